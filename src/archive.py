@@ -0,0 +1,169 @@
+"""
+Project Review Scheduler - Review Archive
+
+Completed and Missed reviews are never read by reviewer assignment or the
+notifications, but in a single Reviews.csv they are parsed and rewritten with
+every change. The archive command moves such reviews, once they are older than
+a number of days, into a gzip-compressed cold file next to the hot one:
+
+    Reviews.csv                (Scheduled and In Progress reviews)
+    Reviews.archive.csv.gz     (finished reviews)
+
+Each archive run appends a new gzip member, so the cold file is never
+rewritten; gzip readers return the members as one CSV file. The archived rows
+are written and synced before they are removed from the hot file, so a failed
+run can leave a review in both files but never lose one.
+"""
+
+import csv
+import gzip
+import io
+import os
+from collections import Counter
+
+from utils import parse_date
+
+TERMINAL_REVIEW_STATUSES = ('Completed', 'Missed')
+
+
+def archive_path_for(file_path):
+    root, _ = os.path.splitext(file_path)
+    return f"{root}.archive.csv.gz"
+
+
+def finished_on(review):
+    """
+    Return the date a finished review is aged from.
+
+    The Completion_Date if it has one (Missed reviews usually do not), otherwise
+    the Scheduled_Date.
+
+    Returns:
+        datetime: The date, or None if neither column holds a valid date
+    """
+    for column in ('Completion_Date', 'Scheduled_Date'):
+        value = (review.get(column) or '')[:10]
+        try:
+            return parse_date(value)
+        except ValueError:
+            continue
+    return None
+
+
+def split_archivable(reviews, cutoff):
+    """
+    Split reviews into those that stay in the hot file and those to archive.
+
+    Args:
+        reviews (list): Review dictionaries
+        cutoff (datetime): Finished reviews dated on or before this are archived
+
+    Returns:
+        tuple: (hot reviews, reviews to archive), each in their original order
+    """
+    hot, cold = [], []
+    for review in reviews:
+        finished = finished_on(review) if review.get('Status') in TERMINAL_REVIEW_STATUSES else None
+        (cold if finished is not None and finished <= cutoff else hot).append(review)
+    return hot, cold
+
+
+def review_key(review):
+    """Identity of a review row: all its non-empty values, as written to CSV."""
+    return tuple(sorted((str(k), str(v)) for k, v in review.items() if v is not None and v != ''))
+
+
+def without_rows(rows, other):
+    """
+    Return the rows that are not also in other, in their original order.
+
+    Review_IDs are not unique (older IDs were one timestamp per second), so
+    rows are matched on all their values, and each row of other cancels at
+    most one equal row.
+
+    Args:
+        rows (list): Review dictionaries to filter
+        other (list): Review dictionaries to take away
+    """
+    # Only rows sharing a Review_ID can be equal, so only those are compared
+    ids = {r.get('Review_ID') for r in rows}
+    other_ids = {r.get('Review_ID') for r in other} & ids
+    remaining = Counter(review_key(r) for r in other if r.get('Review_ID') in other_ids)
+    kept = []
+    for row in rows:
+        if row.get('Review_ID') in other_ids:
+            key = review_key(row)
+            if remaining[key] > 0:
+                remaining[key] -= 1
+                continue
+        kept.append(row)
+    return kept
+
+
+def read_archive(archive_path):
+    """
+    Read all rows of an archive file.
+
+    Returns:
+        tuple: (header, list of rows as dictionaries); ([], []) if there is no archive
+    """
+    try:
+        with gzip.open(archive_path, mode='rt', newline='') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            return list(reader.fieldnames or []), rows
+    except FileNotFoundError:
+        return [], []
+
+
+def append_to_archive(archive_path, rows, fieldnames):
+    """
+    Append rows to an archive file as a new gzip member.
+
+    The first member carries the header. If the rows have columns the archive
+    does not, the archive is rewritten once with the combined header.
+
+    Args:
+        archive_path (str): Archive file
+        rows (list): Rows to append
+        fieldnames (list): Columns of the rows
+    """
+    header = []
+    if os.path.exists(archive_path):
+        with gzip.open(archive_path, mode='rt', newline='') as f:
+            header = next(csv.reader(f), [])
+
+    if header and any(column not in header for column in fieldnames):
+        header, archived = read_archive(archive_path)
+        header += [column for column in fieldnames if column not in header]
+        _write_member(archive_path, header, archived + list(rows), write_header=True, replace=True)
+    else:
+        _write_member(archive_path, header or list(fieldnames), rows, write_header=not header)
+
+
+def _write_member(archive_path, header, rows, write_header, replace=False):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=header)
+    if write_header:
+        writer.writeheader()
+    writer.writerows(rows)
+    data = gzip.compress(buffer.getvalue().encode('utf-8'))
+
+    if not replace:
+        with open(archive_path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return
+
+    temp_path = f"{archive_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, archive_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
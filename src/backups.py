@@ -0,0 +1,467 @@
+"""
+Project Review Scheduler - Backups
+
+write_csv backs up a data file before overwriting it. The BackupManager keeps
+those backups in a content-addressed store inside the backup directory:
+
+- blobs/ab/abcd....gz holds each distinct file content once, compressed and
+  named by its SHA-256 hash, so backing up an unchanged file costs no space
+- manifest.csv records which file had which content at which time
+
+Every write is backed up, except inside a run (start_run() to end_run(), such
+as one CLI command or one assignment run), where only the first write of each
+file is, so a batch of writes keeps the state from before the run. Old backups
+are thinned with a retention policy:
+
+- the newest keep_last backups are always kept
+- of the rest, the newest backup of each of the last keep_daily days is kept
+- and the newest backup of each of the last keep_weekly ISO weeks
+
+A row of a large file that is changed in place (same length, see
+row_offsets.py) is not backed up whole: its old and new text and its byte
+offset go to the row edit journal, row_edits.csv, which undo_row_edits
+replays backwards. A full backup of the file supersedes its journaled edits.
+
+The blob store, manifest and journal are shared by every process using the backup
+directory, so storing, recording and thinning a backup happen under an
+exclusive lock on the manifest.
+
+Backups written by older versions (FILE.TIMESTAMP.bak files) are recognised
+and restored. They are only thinned with the others when prune_legacy is set.
+"""
+
+import csv
+import gzip
+import hashlib
+import lzma
+import os
+import re
+import shutil
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+
+from file_locks import file_lock, lock_path_for
+
+
+COMPRESSORS = {
+    'gzip': ('.gz', gzip.open),
+    'lzma': ('.xz', lzma.open),
+    None: ('', open),
+}
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+MANIFEST_FIELDS = ['File', 'Timestamp', 'Hash', 'Blob']
+ROW_EDIT_FIELDS = ['File', 'Timestamp', 'Offset', 'Old', 'New']
+ENCODING = 'utf-8'
+LEGACY_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+_LEGACY_NAME = re.compile(r'^(?P<name>.+)\.(?P<stamp>\d{8}_\d{6})(?:_\d+)?\.bak(?:\.gz|\.xz)?$')
+
+# One manifest entry; digest is None for legacy backup files
+BackupEntry = namedtuple('BackupEntry', ['file', 'timestamp', 'digest', 'path'])
+# One in-place row change; old and new are the row's bytes before and after
+RowEdit = namedtuple('RowEdit', ['file', 'timestamp', 'offset', 'old', 'new'])
+
+
+def _opener_for(path):
+    if path.endswith('.gz'):
+        return gzip.open
+    if path.endswith('.xz'):
+        return lzma.open
+    return open
+
+
+class BackupManager:
+    """
+    Create, list, thin and restore deduplicated backups of data files.
+
+    Args:
+        backup_dir (str, optional): Directory for backups. Defaults to a
+            'backups' folder next to each backed-up file.
+        compression (str): 'gzip', 'lzma' or None
+        keep_last (int): Number of most recent backups always kept
+        keep_daily (int): Number of days for which the newest backup is kept
+        keep_weekly (int): Number of weeks for which the newest backup is kept
+        prune_legacy (bool): Also delete FILE.TIMESTAMP.bak files the retention
+            policy does not keep. They are left alone by default.
+    """
+
+    def __init__(self, backup_dir=None, compression='gzip', keep_last=5, keep_daily=7, keep_weekly=4,
+                 prune_legacy=False):
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression '{compression}'")
+        self.backup_dir = backup_dir
+        self.compression = compression
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+        self.keep_weekly = keep_weekly
+        self.prune_legacy = prune_legacy
+        # Files backed up in the current run; None outside a run
+        self._backed_up = None
+
+    def directory_for(self, file_path):
+        if self.backup_dir:
+            return self.backup_dir
+        return os.path.join(os.path.dirname(os.path.abspath(file_path)), 'backups')
+
+    @property
+    def in_run(self):
+        return self._backed_up is not None
+
+    def start_run(self):
+        """Start a run: until end_run, each file is backed up before its first write only."""
+        self._backed_up = set()
+
+    def end_run(self):
+        """End the run; every write is backed up again."""
+        self._backed_up = None
+
+    @contextmanager
+    def _store_lock(self, directory):
+        """Hold the exclusive lock on a backup directory's manifest."""
+        os.makedirs(directory, exist_ok=True)
+        manifest = self._manifest_path(directory)
+        # Create the lock file, so the manifest is locked even before it exists
+        open(lock_path_for(manifest), 'a').close()
+        with file_lock(manifest, exclusive=True):
+            yield
+
+    # ---------------------------------------------------------------- manifest
+
+    def _manifest_path(self, directory):
+        return os.path.join(directory, 'manifest.csv')
+
+    def _read_manifest(self, directory):
+        path = self._manifest_path(directory)
+        if not os.path.exists(path):
+            return []
+        with open(path, newline='') as f:
+            rows = csv.reader(f)
+            next(rows, None)  # header
+            return [BackupEntry(name, datetime.strptime(stamp, TIMESTAMP_FORMAT), digest, os.path.join(directory, blob))
+                    for name, stamp, digest, blob in rows]
+
+    def _write_manifest(self, directory, entries):
+        path = self._manifest_path(directory)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(MANIFEST_FIELDS)
+            for entry in entries:
+                writer.writerow([entry.file, entry.timestamp.strftime(TIMESTAMP_FORMAT), entry.digest,
+                                 os.path.relpath(entry.path, directory)])
+        os.replace(temp_path, path)
+
+    def _append_manifest(self, directory, entry):
+        path = self._manifest_path(directory)
+        new_file = not os.path.exists(path)
+        with open(path, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(MANIFEST_FIELDS)
+            writer.writerow([entry.file, entry.timestamp.strftime(TIMESTAMP_FORMAT), entry.digest,
+                             os.path.relpath(entry.path, directory)])
+
+    # --------------------------------------------------------------- row edits
+
+    def row_edits_path(self, file_path):
+        return os.path.join(self.directory_for(file_path), 'row_edits.csv')
+
+    def _read_row_edits(self, path):
+        if not os.path.exists(path):
+            return []
+        with open(path, newline='', encoding=ENCODING) as f:
+            rows = csv.reader(f)
+            next(rows, None)  # header
+            return [RowEdit(name, datetime.strptime(stamp, TIMESTAMP_FORMAT), int(offset),
+                            old.encode(ENCODING), new.encode(ENCODING))
+                    for name, stamp, offset, old, new in rows]
+
+    def _write_row_edits(self, path, edits):
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', newline='', encoding=ENCODING) as f:
+            writer = csv.writer(f)
+            writer.writerow(ROW_EDIT_FIELDS)
+            for edit in edits:
+                writer.writerow([edit.file, edit.timestamp.strftime(TIMESTAMP_FORMAT), edit.offset,
+                                 edit.old.decode(ENCODING), edit.new.decode(ENCODING)])
+        os.replace(temp_path, path)
+
+    def _drop_row_edits(self, file_path):
+        path = self.row_edits_path(file_path)
+        edits = self._read_row_edits(path)
+        name = os.path.basename(file_path)
+        if any(edit.file == name for edit in edits):
+            self._write_row_edits(path, [edit for edit in edits if edit.file != name])
+
+    def record_row_edit(self, file_path, offset, old, new, now=None):
+        """
+        Journal an in-place change of one row instead of backing up the whole file.
+
+        Args:
+            file_path (str): Changed file
+            offset (int): Byte offset of the row
+            old (bytes): Row text before the change
+            new (bytes): Row text written, of the same length
+            now (datetime, optional): Time of the change. Defaults to now.
+        """
+        now = (now or datetime.now()).replace(microsecond=0)
+        directory = self.directory_for(file_path)
+        with self._store_lock(directory):
+            path = self.row_edits_path(file_path)
+            new_file = not os.path.exists(path)
+            with open(path, 'a', newline='', encoding=ENCODING) as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(ROW_EDIT_FIELDS)
+                writer.writerow([os.path.basename(file_path), now.strftime(TIMESTAMP_FORMAT), offset,
+                                 old.decode(ENCODING), new.decode(ENCODING)])
+
+    def undo_row_edits(self, file_path, as_of=None):
+        """
+        Revert the in-place row changes made to a file after a point in time, newest first.
+
+        Only possible while the file has not been backed up (rewritten) since
+        as_of and still holds the text each change wrote. The caller must hold
+        the file's lock.
+
+        Args:
+            file_path (str): Changed file
+            as_of (datetime, optional): Keep changes made up to this time. Reverts all if omitted.
+
+        Returns:
+            int: Number of changes reverted; 0 if there were none or they cannot be reverted
+        """
+        name = os.path.basename(file_path)
+        directory = self.directory_for(file_path)
+        with self._store_lock(directory):
+            if as_of is not None and any(e.timestamp > as_of and e.digest is not None
+                                         for e in self._entries(file_path)):
+                return 0
+            path = self.row_edits_path(file_path)
+            edits = self._read_row_edits(path)
+            undo = [e for e in edits if e.file == name and (as_of is None or e.timestamp > as_of)]
+            if not undo or not os.path.exists(file_path):
+                return 0
+
+            with open(file_path, 'r+b') as f:
+                # Check every change against the file before reverting any
+                current = {}
+                for edit in reversed(undo):
+                    if edit.offset not in current:
+                        f.seek(edit.offset)
+                        current[edit.offset] = f.read(len(edit.new))
+                    if current[edit.offset] != edit.new:
+                        return 0
+                    current[edit.offset] = edit.old
+                for offset, data in current.items():
+                    f.seek(offset)
+                    f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._write_row_edits(path, [e for e in edits if e not in undo])
+        return len(undo)
+
+    # ------------------------------------------------------------------- blobs
+
+    def _existing_blob(self, directory, digest):
+        for extension, _ in COMPRESSORS.values():
+            path = os.path.join(directory, 'blobs', digest[:2], digest + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _store_blob(self, directory, file_path):
+        """Copy a file into the blob store, unless identical content is already there."""
+        extension, opener = COMPRESSORS[self.compression]
+        blob_dir = os.path.join(directory, 'blobs')
+        os.makedirs(blob_dir, exist_ok=True)
+
+        temp_path = os.path.join(blob_dir, f".incoming.{os.getpid()}{extension}")
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as src, opener(temp_path, 'wb') as dst:
+            for chunk in iter(lambda: src.read(1 << 16), b''):
+                digest.update(chunk)
+                dst.write(chunk)
+        digest = digest.hexdigest()
+
+        existing = self._existing_blob(directory, digest)
+        if existing:
+            os.remove(temp_path)
+            return digest, existing
+
+        blob_path = os.path.join(blob_dir, digest[:2], digest + extension)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        os.replace(temp_path, blob_path)
+        return digest, blob_path
+
+    # ----------------------------------------------------------------- backups
+
+    def backup(self, file_path, now=None):
+        """
+        Back up a file unless it has already been backed up in this run.
+
+        Args:
+            file_path (str): File to back up
+            now (datetime, optional): Timestamp for the backup. Defaults to now.
+
+        Returns:
+            str: Path of the blob holding the backup, or None if the file was
+                already backed up in this run
+        """
+        key = os.path.abspath(file_path)
+        if (self._backed_up is not None and key in self._backed_up) or not os.path.exists(file_path):
+            return None
+        blob_path = self._backup(file_path, now)
+        if self._backed_up is not None:
+            self._backed_up.add(key)
+        return blob_path
+
+    def _backup(self, file_path, now=None, pinned=()):
+        now = (now or datetime.now()).replace(microsecond=0)
+        directory = self.directory_for(file_path)
+        with self._store_lock(directory):
+            digest, blob_path = self._store_blob(directory, file_path)
+            self._append_manifest(directory, BackupEntry(os.path.basename(file_path), now, digest, blob_path))
+            # The backup holds the file with its journaled row edits
+            self._drop_row_edits(file_path)
+            self._prune(file_path, pinned)
+        return blob_path
+
+    def _legacy_backups(self, directory, name):
+        if not os.path.isdir(directory):
+            return []
+        entries = []
+        for entry in os.listdir(directory):
+            match = _LEGACY_NAME.match(entry)
+            if match and match.group('name') == name:
+                stamp = datetime.strptime(match.group('stamp'), LEGACY_TIMESTAMP_FORMAT)
+                entries.append(BackupEntry(name, stamp, None, os.path.join(directory, entry)))
+        return entries
+
+    def _entries(self, file_path):
+        directory = self.directory_for(file_path)
+        name = os.path.basename(file_path)
+        entries = [e for e in self._read_manifest(directory) if e.file == name]
+        entries.extend(self._legacy_backups(directory, name))
+        entries.sort(key=lambda e: e.timestamp)  # stable: keeps manifest order for equal times
+        return entries
+
+    def list_backups(self, file_path):
+        """
+        List the backups of a file, oldest first.
+
+        Args:
+            file_path (str): Backed-up file
+
+        Returns:
+            list: (timestamp, path) tuples, where path is the blob or legacy
+                backup file holding the content
+        """
+        return [(e.timestamp, e.path) for e in self._entries(file_path)]
+
+    def find_backup(self, file_path, as_of):
+        """
+        Find the newest backup taken at or before a point in time.
+
+        Args:
+            file_path (str): Backed-up file
+            as_of (datetime): Point in time
+
+        Returns:
+            tuple: (timestamp, path) of the matching backup, or None if there
+                is none that old
+        """
+        backups = self.list_backups(file_path)
+        position = bisect_right([stamp for stamp, _ in backups], as_of)
+        return backups[position - 1] if position else None
+
+    def prune(self, file_path):
+        """
+        Delete backups of a file that the retention policy does not keep, then
+        remove blobs no backup refers to any more.
+
+        Returns:
+            list: (timestamp, path) tuples of the deleted backups
+        """
+        with self._store_lock(self.directory_for(file_path)):
+            return self._prune(file_path)
+
+    def _prune(self, file_path, pinned=()):
+        # pinned: blob or backup file paths kept regardless of the policy
+        entries = self._entries(file_path)
+        if not self.prune_legacy:
+            entries = [entry for entry in entries if entry.digest is not None]
+        keep = set(range(len(entries))[-self.keep_last:]) if self.keep_last else set()
+        keep.update(i for i, entry in enumerate(entries) if entry.path in pinned)
+
+        newest_per_day = {}
+        newest_per_week = {}
+        for i, entry in enumerate(entries):
+            newest_per_day[entry.timestamp.date()] = i
+            newest_per_week[entry.timestamp.isocalendar()[:2]] = i
+        if self.keep_daily:
+            keep.update(newest_per_day[day] for day in sorted(newest_per_day)[-self.keep_daily:])
+        if self.keep_weekly:
+            keep.update(newest_per_week[week] for week in sorted(newest_per_week)[-self.keep_weekly:])
+
+        removed = [entry for i, entry in enumerate(entries) if i not in keep]
+        if not removed:
+            return []
+
+        for entry in removed:
+            if entry.digest is None:
+                os.remove(entry.path)
+
+        if any(entry.digest is not None for entry in removed):
+            directory = self.directory_for(file_path)
+            name = os.path.basename(file_path)
+            remaining = [e for e in self._read_manifest(directory) if e.file != name]
+            remaining.extend(e for i, e in enumerate(entries) if i in keep and e.digest is not None)
+            remaining.sort(key=lambda e: e.timestamp)
+            self._write_manifest(directory, remaining)
+            self._collect_garbage(directory, {e.path for e in remaining})
+        return [(entry.timestamp, entry.path) for entry in removed]
+
+    def _collect_garbage(self, directory, referenced):
+        blob_dir = os.path.join(directory, 'blobs')
+        for root, _, files in os.walk(blob_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if not name.startswith('.') and path not in referenced:
+                    os.remove(path)
+
+    def restore(self, file_path, backup_path=None, as_of=None):
+        """
+        Replace a file with the contents of one of its backups.
+
+        Args:
+            file_path (str): File to restore
+            backup_path (str, optional): Blob or backup file to restore
+            as_of (datetime, optional): Restore the newest backup taken at or before this time.
+                Without backup_path or as_of the newest backup is restored.
+
+        Returns:
+            str: Path of the restored blob or backup file
+        """
+        with self._store_lock(self.directory_for(file_path)):
+            if backup_path is None:
+                if as_of is not None:
+                    found = self.find_backup(file_path, as_of)
+                else:
+                    backups = self.list_backups(file_path)
+                    found = backups[-1] if backups else None
+                if found is None:
+                    raise FileNotFoundError(f"No backup of {file_path} found")
+                backup_path = found[1]
+
+            temp_path = f"{file_path}.restore.tmp"
+            with _opener_for(backup_path)(backup_path, 'rb') as src, open(temp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            # The current contents become the newest backup, so a restore can be
+            # undone. Its prune must not delete the backup being restored.
+            if os.path.exists(file_path):
+                self._backup(file_path, pinned={backup_path})
+            os.replace(temp_path, file_path)
+        return backup_path
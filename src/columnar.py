@@ -0,0 +1,161 @@
+"""
+Project Review Scheduler - Columnar Snapshots
+
+A snapshot stores a CSV file column by column in a NumPy .npz archive next to
+it (Reviews.csv -> Reviews.csv.npz). Each column is kept as categorical codes:
+an int32 array of codes plus the array of distinct values, so repeated values
+such as Department, Status or dates are stored once.
+
+The snapshot records the size and modification time of the CSV file it was
+built from. read_csv loads rows from the snapshot instead of parsing the CSV
+while the file is unchanged; once the CSV is written again the snapshot is
+ignored until the snapshot command rebuilds it.
+"""
+
+import csv
+import gc
+import os
+from itertools import repeat
+
+import numpy as np
+
+
+def snapshot_path_for(file_path):
+    return f"{file_path}.npz"
+
+
+class ColumnarTable:
+    """
+    Columns of one table as categorical codes.
+
+    Args:
+        header (list): Column names in file order
+        codes (dict): Column name -> int32 array of codes; -1 marks a missing value
+        categories (dict): Column name -> array of distinct values
+    """
+
+    def __init__(self, header, codes, categories):
+        self.header = list(header)
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.codes[self.header[0]]) if self.header else 0
+
+    def column(self, name):
+        """Return the values of one column as a list (None where a row had no value)."""
+        values = np.append(self.categories[name].astype(object), None)
+        return values[self.codes[name]].tolist()
+
+    def rows(self):
+        """Return the table as a list of row dictionaries, like csv.DictReader."""
+        if not self.header:
+            return []
+        columns = [self.column(name) for name in self.header]
+        # map keeps the per-row dict(zip(header, values)) loop in C
+        pairs = map(zip, repeat(self.header), zip(*columns))
+
+        # A million new dicts would otherwise trigger many useless GC passes
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return list(map(dict, pairs))
+        finally:
+            if enabled:
+                gc.enable()
+
+
+def encode_rows(header, rows):
+    """
+    Encode rows of CSV values (lists, in header order) as a ColumnarTable.
+
+    Raises:
+        ValueError: If a row has more values than there are columns
+    """
+    width = len(header)
+    columns = [[] for _ in header]
+    for values in rows:
+        if not values:
+            continue
+        if len(values) > width:
+            raise ValueError("Rows with more values than columns cannot be stored")
+        for i, column in enumerate(columns):
+            column.append(values[i] if i < len(values) else None)
+
+    codes = {}
+    categories = {}
+    for name, values in zip(header, columns):
+        missing = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        text = np.array(['' if v is None else v for v in values], dtype=str)
+        distinct, inverse = np.unique(text, return_inverse=True)
+        inverse = inverse.astype(np.int32)
+        inverse[missing] = -1
+        codes[name] = inverse
+        categories[name] = distinct
+    return ColumnarTable(header, codes, categories)
+
+
+def write_snapshot(file_path):
+    """
+    Build the columnar snapshot of a CSV file.
+
+    Args:
+        file_path (str): CSV file to snapshot
+
+    Returns:
+        str: Path of the snapshot file
+    """
+    with open(file_path, mode='r', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        table = encode_rows(header, reader)
+        stat = os.fstat(csvfile.fileno())
+
+    arrays = {
+        'header': np.array(header, dtype=str),
+        'source': np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64),
+    }
+    for i, name in enumerate(header):
+        arrays[f'codes_{i}'] = table.codes[name]
+        arrays[f'categories_{i}'] = table.categories[name]
+
+    snapshot_path = snapshot_path_for(file_path)
+    temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, snapshot_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return snapshot_path
+
+
+def load_snapshot(file_path, stat=None):
+    """
+    Load the snapshot of a CSV file if it was built from the file's current contents.
+
+    Args:
+        file_path (str): CSV file
+        stat (os.stat_result, optional): Current stat of the CSV file
+
+    Returns:
+        ColumnarTable: The snapshot, or None if there is none or it is out of date
+    """
+    snapshot_path = snapshot_path_for(file_path)
+    try:
+        stat = stat or os.stat(file_path)
+        archive = np.load(snapshot_path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    with archive:
+        mtime_ns, size = archive['source'].tolist()
+        if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+            return None
+        header = archive['header'].tolist()
+        codes = {name: archive[f'codes_{i}'] for i, name in enumerate(header)}
+        categories = {name: archive[f'categories_{i}'] for i, name in enumerate(header)}
+    return ColumnarTable(header, codes, categories)
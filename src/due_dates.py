@@ -0,0 +1,208 @@
+"""
+Project Review Scheduler - Batch Due Date Calculation
+
+Vectorized version of calculate_due_date for whole tables. Last review dates
+are parsed once into a NumPy datetime64 array, month offsets are added with
+the same end-of-month clamping as dateutil's relativedelta, and statuses are
+assigned with array comparisons. status_counts evaluates statuses on a whole
+range of dates at once for capacity planning.
+"""
+
+import numpy as np
+
+
+ONE_DAY = np.timedelta64(1, 'D')
+DUE_SOON_DAYS = 30
+STATUSES = np.array(['Overdue', 'Due Soon', 'Up to Date'], dtype=object)
+
+
+def add_months(dates, months):
+    """
+    Add a number of months to each date, clamping to the end of the month.
+
+    Matches date + relativedelta(months=n): 2025-01-31 plus one month is 2025-02-28.
+
+    Args:
+        dates (np.ndarray): datetime64[D] array
+        months (np.ndarray): Integer array of month offsets
+
+    Returns:
+        np.ndarray: datetime64[D] array
+    """
+    month_start = dates.astype('datetime64[M]')
+    day_offset = (dates - month_start.astype('datetime64[D]')).astype(np.int64)
+    target_month = month_start + months.astype('timedelta64[M]')
+    target_start = target_month.astype('datetime64[D]')
+    month_length = ((target_month + 1).astype('datetime64[D]') - target_start).astype(np.int64)
+    return target_start + np.minimum(day_offset, month_length - 1).astype('timedelta64[D]')
+
+
+def review_status(next_review, current_date):
+    """
+    Classify next review dates as 'Overdue', 'Due Soon' or 'Up to Date'.
+
+    Args:
+        next_review (np.ndarray): datetime64[D] array of next review dates
+        current_date (datetime): Date (and time) to compare against
+
+    Returns:
+        np.ndarray: Object array of status strings
+    """
+    now = np.datetime64(current_date, 'us')
+    # Floor division matches timedelta.days when current_date has a time part
+    days_until_review = (next_review.astype('datetime64[us]') - now) // ONE_DAY
+    codes = (days_until_review >= 0).astype(np.int8) + (days_until_review > DUE_SOON_DAYS)
+    return STATUSES[codes]
+
+
+def format_dates(dates):
+    """
+    Format a datetime64[D] array as YYYY-MM-DD strings.
+
+    Each distinct date is formatted once; tables usually have far fewer
+    distinct dates than rows.
+
+    Args:
+        dates (np.ndarray): datetime64[D] array
+
+    Returns:
+        list: Date strings
+    """
+    unique_dates, inverse = np.unique(dates, return_inverse=True)
+    labels = np.array(np.datetime_as_string(unique_dates, unit='D').tolist(), dtype=object)
+    return labels[inverse.reshape(-1)].tolist()
+
+
+def parse_review_schedule(last_review_dates, frequencies):
+    """
+    Parse Last_Review_Date and Review_Frequency_Years of many projects.
+
+    Rows whose values are not plain YYYY-MM-DD dates and finite numbers are skipped.
+
+    Args:
+        last_review_dates (list): Last_Review_Date strings
+        frequencies (list): Review_Frequency_Years values
+
+    Returns:
+        tuple: (int array of the row numbers used, datetime64[D] array of their
+            last review dates, int array of their frequencies in whole months)
+    """
+    count = len(last_review_dates)
+    none = (np.empty(0, dtype=np.int64), np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.int64))
+    if count == 0:
+        return none
+
+    valid = np.fromiter(
+        (isinstance(d, str) and len(d) == 10 and d[4] == '-' and d[7] == '-' for d in last_review_dates),
+        dtype=bool, count=count,
+    )
+    try:
+        years = np.asarray(frequencies, dtype=np.float64)
+    except (TypeError, ValueError):
+        return none
+    valid &= np.isfinite(years)
+
+    rows = np.flatnonzero(valid)
+    if rows.size == 0:
+        return none
+    try:
+        if rows.size == count:
+            last_review = np.asarray(last_review_dates, dtype='datetime64[D]')
+        else:
+            last_review = np.asarray([last_review_dates[i] for i in rows], dtype='datetime64[D]')
+    except ValueError:
+        return none
+    parsed = ~np.isnat(last_review)
+    if not parsed.all():
+        rows, last_review = rows[parsed], last_review[parsed]
+
+    months = (years[rows] * 12).astype(np.int64)  # truncates like int()
+    return rows, last_review, months
+
+
+def next_review_dates(last_review_dates, frequencies):
+    """
+    Calculate the next review date of many projects.
+
+    Args:
+        last_review_dates (list): Last_Review_Date strings
+        frequencies (list): Review_Frequency_Years values
+
+    Returns:
+        tuple: (int array of the row numbers used, datetime64[D] array of their
+            next review dates); see parse_review_schedule for skipped rows
+    """
+    rows, last_review, months = parse_review_schedule(last_review_dates, frequencies)
+    return rows, add_months(last_review, months)
+
+
+def calculate_due_dates(last_review_dates, frequencies, current_date):
+    """
+    Calculate Next_Review_Date and Status for many projects at once.
+
+    Rows whose values are not plain YYYY-MM-DD dates and finite numbers are
+    left as None so the caller can handle them with calculate_due_date.
+
+    Args:
+        last_review_dates (list): Last_Review_Date strings
+        frequencies (list): Review_Frequency_Years values
+        current_date (datetime): Date to compare against
+
+    Returns:
+        tuple: (next review date strings, status strings), with None for skipped rows
+    """
+    count = len(last_review_dates)
+    next_dates = [None] * count
+    statuses = [None] * count
+    rows, next_review = next_review_dates(last_review_dates, frequencies)
+    if rows.size == 0:
+        return next_dates, statuses
+
+    next_strings = format_dates(next_review)
+    status_strings = review_status(next_review, current_date).tolist()
+    if rows.size == count:
+        return next_strings, status_strings
+    for position, row in enumerate(rows.tolist()):
+        next_dates[row] = next_strings[position]
+        statuses[row] = status_strings[position]
+    return next_dates, statuses
+
+
+def status_counts(next_review, groups, group_count, dates):
+    """
+    Count the projects in each status, per group, on each of many dates.
+
+    Statuses follow review_status for dates without a time. Instead of
+    comparing every project with every date, the next review days are sorted
+    once per group and the whole (group, date) grid of window boundaries is
+    located with a single searchsorted call, so memory stays O(projects + dates).
+
+    Args:
+        next_review (np.ndarray): datetime64[D] array of next review dates
+        groups (np.ndarray): Integer group (e.g. department) of each project, 0 <= group < group_count
+        group_count (int): Number of groups
+        dates (np.ndarray): datetime64[D] array of dates to evaluate
+
+    Returns:
+        np.ndarray: int64 array of shape (group_count, len(dates), 3) holding the
+            Overdue, Due Soon and Up to Date counts
+    """
+    days = next_review.astype(np.int64)
+    axis = dates.astype(np.int64)
+    if days.size == 0 or axis.size == 0:
+        return np.zeros((group_count, axis.size, 3), dtype=np.int64)
+
+    # One sorted key per project: its group, then its next review day
+    low = min(days.min(), axis.min())
+    width = max(days.max(), axis.max() + DUE_SOON_DAYS) - low + 2
+    keys = np.sort(groups.astype(np.int64) * width + (days - low))
+
+    group_base = np.arange(group_count, dtype=np.int64)[:, None] * width
+    day_offset = (axis - low)[None, :]
+    bounds = np.searchsorted(keys, np.stack([
+        np.broadcast_to(group_base, (group_count, axis.size)),  # group start
+        group_base + day_offset,                                 # first day not overdue
+        group_base + day_offset + DUE_SOON_DAYS + 1,             # first day still up to date
+        np.broadcast_to(group_base + width, (group_count, axis.size)),  # group end
+    ]))
+    return np.stack(np.diff(bounds, axis=0), axis=-1)
@@ -0,0 +1,99 @@
+"""
+Project Review Scheduler - File Locks
+
+Advisory locks that let the CLI jobs and the dashboards share the CSV files.
+Readers take a shared lock, writers an exclusive one, and a read-modify-write
+cycle (such as a reviewer assignment run) holds the exclusive lock from the
+first read to the last write.
+
+The lock is taken on a hidden sidecar file (.Users.csv.lock next to Users.csv)
+because write_csv replaces the data file itself. Locks are reentrant within a
+thread, so a function holding a lock can call read_csv and write_csv, which
+lock the same file again. A shared lock is upgraded when the same thread asks
+for an exclusive one. Files that do not exist yet are not locked, unless their
+lock file exists (a Reviews file moved into month partitions keeps its lock file).
+
+On platforms without fcntl the locks do nothing.
+"""
+
+import os
+import threading
+from contextlib import ExitStack, contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+_held = threading.local()
+
+
+def lock_path_for(file_path):
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, f".{name}.lock")
+
+
+def _held_locks():
+    if not hasattr(_held, 'locks'):
+        _held.locks = {}
+    return _held.locks
+
+
+@contextmanager
+def file_lock(file_path, exclusive=False):
+    """
+    Hold an advisory lock on a data file.
+
+    Args:
+        file_path (str): Data file to lock
+        exclusive (bool): Exclusive (writer) lock instead of a shared (reader) lock
+    """
+    path = lock_path_for(file_path)
+    if fcntl is None or not (os.path.exists(file_path) or os.path.exists(path)):
+        yield
+        return
+
+    locks = _held_locks()
+    held = locks.get(path)
+    if held is None:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        except BaseException:
+            os.close(fd)
+            raise
+        # [fd, exclusive depth, shared depth]
+        held = locks[path] = [fd, 0, 0]
+    elif exclusive and not held[1]:
+        fcntl.flock(held[0], fcntl.LOCK_EX)  # upgrade
+
+    held[1 if exclusive else 2] += 1
+    try:
+        yield
+    finally:
+        held[1 if exclusive else 2] -= 1
+        if not held[1] and not held[2]:
+            del locks[path]
+            fcntl.flock(held[0], fcntl.LOCK_UN)
+            os.close(held[0])
+        elif exclusive and not held[1]:
+            fcntl.flock(held[0], fcntl.LOCK_SH)  # back to the outer shared lock
+
+
+@contextmanager
+def file_locks(file_paths, exclusive=False):
+    """
+    Hold advisory locks on several data files.
+
+    Locks are taken in a fixed order so two processes locking the same files
+    cannot deadlock.
+
+    Args:
+        file_paths (iterable): Data files to lock
+        exclusive (bool): Exclusive (writer) locks instead of shared (reader) locks
+    """
+    with ExitStack() as stack:
+        for file_path in sorted({os.path.abspath(p) for p in file_paths}):
+            stack.enter_context(file_lock(file_path, exclusive))
+        yield
@@ -0,0 +1,143 @@
+"""
+Project Review Scheduler - Review Demand Forecast
+
+Projects are reviewed every Review_Frequency_Years, so the reviews falling due
+in any future week or month follow from Last_Review_Date alone: the k-th
+review after the last one is due Last_Review_Date + k * frequency (with the
+same month arithmetic as calculate_due_date).
+
+The series are expanded lazily, one k at a time for all projects at once, and
+a project drops out as soon as its next review is beyond the horizon, so the
+work is proportional to the number of reviews in the window. Each round is
+added to a (department, period) histogram.
+"""
+
+import numpy as np
+
+from due_dates import add_months, parse_review_schedule
+
+PERIODS = ('week', 'month')
+
+
+def period_starts(start, end, period='week'):
+    """
+    First day of each forecast period from start to end.
+
+    Weeks are seven-day periods beginning on start; months are calendar
+    months, the first one beginning on start.
+
+    Args:
+        start (np.datetime64): First day of the forecast
+        end (np.datetime64): Last day of the forecast
+        period (str): 'week' or 'month'
+
+    Returns:
+        np.ndarray: datetime64[D] array
+    """
+    if period == 'week':
+        return np.arange(start, end + 1, 7)
+    if period == 'month':
+        starts = np.arange(start.astype('datetime64[M]'), end.astype('datetime64[M]') + 1).astype('datetime64[D]')
+        starts[0] = start
+        return starts
+    raise ValueError(f"Unknown period: {period!r} (expected one of {', '.join(PERIODS)})")
+
+
+def expand_reviews(last_review, months, start, end):
+    """
+    Yield the review due dates of every project between start and end.
+
+    The series of each project begins with the first review on or after start
+    (or its next review, if that is later), so long-past last reviews do not
+    cost one round per elapsed period. Dates are handled as integers: the
+    month arithmetic of due_dates.add_months is done with a table of month
+    lengths built once.
+
+    Args:
+        last_review (np.ndarray): datetime64[D] last review dates
+        months (np.ndarray): Review frequency of each project in whole months
+        start (np.datetime64): First day of the window
+        end (np.datetime64): Last day of the window
+
+    Yields:
+        tuple: (project positions, due dates as days since 1970-01-01, due
+            dates as months since 1970-01), one round of the series at a time
+    """
+    active = np.flatnonzero(months > 0)
+    last_review, months = last_review[active], months[active]
+    base_month = last_review.astype('datetime64[M]')
+    day_offset = (last_review - base_month.astype('datetime64[D]')).astype(np.int64)
+    base_month = base_month.astype(np.int64)
+    start_day, end_day = start.astype(np.int64), end.astype(np.int64)
+    start_month, end_month = (np.array([start, end]).astype('datetime64[M]').astype(np.int64)).tolist()
+
+    # First day and length of every month a review in the window can fall in
+    table_months = np.arange(start_month, end_month + 2).astype('datetime64[M]')
+    month_starts = table_months.astype('datetime64[D]').astype(np.int64)
+    month_lengths = np.diff(month_starts)
+
+    # Whole periods already elapsed by the start of the window
+    k = np.maximum((start_month - base_month) // months, 1)
+    while active.size:
+        target = base_month + months * k
+        keep = target <= end_month
+        if not keep.all():
+            active, day_offset, base_month, months, k, target = (
+                active[keep], day_offset[keep], base_month[keep], months[keep], k[keep], target[keep])
+        slot = np.maximum(target - start_month, 0)
+        due = month_starts[slot] + np.minimum(day_offset, month_lengths[slot] - 1)
+        in_window = (target >= start_month) & (due >= start_day) & (due <= end_day)
+        yield active[in_window], due[in_window], target[in_window]
+        k = k + 1
+
+
+def forecast_review_demand(last_review_dates, frequencies, departments, start, end, period='week',
+                           include_overdue=True):
+    """
+    Count the reviews falling due in each period, per department.
+
+    Args:
+        last_review_dates (list): Last_Review_Date of each project
+        frequencies (list): Review_Frequency_Years of each project
+        departments (list): Department of each project
+        start (str or date): First day of the forecast, 'YYYY-MM-DD'
+        end (str or date): Last day of the forecast
+        period (str): 'week' or 'month'
+        include_overdue (bool): Count reviews already overdue on start in the first period
+
+    Returns:
+        dict: 'period', 'periods' (start date of each period), 'departments'
+            (department -> reviews due per period), 'totals' (reviews due per
+            period) and 'skipped' (projects without a valid date or a
+            frequency of at least one month)
+    """
+    start, end = np.datetime64(start, 'D'), np.datetime64(end, 'D')
+    if end < start:
+        raise ValueError("end is before start")
+    starts = period_starts(start, end, period)
+
+    departments = list(departments)
+    rows, last_review, months = parse_review_schedule(list(last_review_dates), list(frequencies))
+    names, groups = np.unique(np.array([departments[i] or 'Unknown' for i in rows.tolist()], dtype=str),
+                              return_inverse=True)
+    groups = groups.reshape(-1)
+
+    width = len(starts)
+    counts = np.zeros(len(names) * width, dtype=np.int64)
+    start_day = start.astype(np.int64)
+    start_month = start.astype('datetime64[M]').astype(np.int64)
+    for positions, due_days, due_months in expand_reviews(last_review, months, start, end):
+        bins = (due_days - start_day) // 7 if period == 'week' else due_months - start_month
+        counts += np.bincount(groups[positions] * width + bins, minlength=counts.size)
+    if include_overdue:
+        overdue = np.flatnonzero((add_months(last_review, months) < start) & (months > 0))
+        counts += np.bincount(groups[overdue] * width, minlength=counts.size)
+
+    counts = counts.reshape(len(names), width)
+    return {
+        'period': period,
+        'periods': np.datetime_as_string(starts, unit='D').tolist(),
+        'departments': {name: counts[g].tolist() for g, name in enumerate(names.tolist())},
+        'totals': counts.sum(axis=0).tolist(),
+        'skipped': len(last_review_dates) - int((months > 0).sum()),
+    }
@@ -0,0 +1,155 @@
+"""
+Project Review Scheduler - In-memory Table Indexes
+
+A TableIndex is built once over the rows of a loaded table. It provides a hash
+index on the primary key and multi-value indexes on secondary columns, so
+lookups such as "reviews for project P001" are dictionary probes instead of
+scans. Indexed columns can also be queried by range (e.g. "projects with a
+Next_Review_Date in the next 30 days"). The index is kept up to date when rows
+are inserted or changed.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+
+from storage import TABLE_SCHEMAS
+
+
+class TableIndex:
+    """
+    Hash index on a key column plus multi-value indexes on other columns.
+
+    The index holds references to the row dictionaries it was built from.
+    """
+
+    def __init__(self, rows, key, columns=()):
+        self.key = key
+        self.columns = tuple(columns)
+        self.by_key = {}
+        self.by_column = {column: {} for column in self.columns}
+        # Column -> its distinct values as (text, value), sorted by text; built by range()
+        self._sorted = {}
+        self._position = {}
+        for row in rows:
+            self._add(row)
+
+    def _add(self, row, position=None):
+        if position is None:
+            position = len(self._position)
+        self._position[id(row)] = position
+        # First row wins for duplicate keys, like a linear scan would
+        self.by_key.setdefault(row.get(self.key), row)
+        for column in self.columns:
+            value = row.get(column)
+            bucket = self.by_column[column].setdefault(value, [])
+            if not bucket and column in self._sorted and value not in (None, ''):
+                insort(self._sorted[column], (str(value), value), key=_TEXT)
+            if bucket and self._position[id(bucket[-1])] > position:
+                insort(bucket, row, key=lambda r: self._position[id(r)])
+            else:
+                bucket.append(row)
+
+    def _remove(self, row):
+        if self.by_key.get(row.get(self.key)) is row:
+            del self.by_key[row.get(self.key)]
+        for column in self.columns:
+            bucket = self.by_column[column].get(row.get(column), [])
+            for i, candidate in enumerate(bucket):
+                if candidate is row:
+                    del bucket[i]
+                    break
+            if not bucket:
+                self.by_column[column].pop(row.get(column), None)
+                self._unsort(column, row.get(column))
+
+    def _unsort(self, column, value):
+        values = self._sorted.get(column)
+        if values is None or value in (None, ''):
+            return
+        i = bisect_left(values, str(value), key=_TEXT)
+        while i < len(values) and values[i][0] == str(value):
+            if values[i][1] == value:
+                del values[i]
+                return
+            i += 1
+
+    def get(self, key):
+        """Return the row with the given key, or None."""
+        return self.by_key.get(key)
+
+    def find(self, column, value):
+        """Return the rows whose column equals value, in load order."""
+        if column not in self.by_column:
+            raise KeyError(f"Column '{column}' is not indexed")
+        return list(self.by_column[column].get(value, []))
+
+    def range(self, column, low=None, high=None):
+        """
+        Return the rows whose column value lies between low and high, in value order.
+
+        Values are compared as text, which orders ISO dates correctly. high
+        covers every value that starts with it, so '2025-06-30' also matches a
+        value of 2025-06-30 with a time. Rows with an empty value are left out.
+        The distinct values are sorted on the first call and kept sorted, so a
+        query costs O(log n) plus the rows returned.
+
+        Args:
+            column (str): Indexed column
+            low (str, optional): Smallest value; no lower limit if omitted
+            high (str, optional): Largest value; no upper limit if omitted
+
+        Returns:
+            list: Matching rows, ordered by value and then by load order
+        """
+        if column not in self.by_column:
+            raise KeyError(f"Column '{column}' is not indexed")
+        values = self._sorted.get(column)
+        if values is None:
+            values = self._sorted[column] = sorted(
+                ((str(value), value) for value in self.by_column[column] if value not in (None, '')), key=_TEXT)
+        first = 0 if low is None else bisect_left(values, str(low), key=_TEXT)
+        last = len(values) if high is None else bisect_right(values, f"{high}\uffff", key=_TEXT)
+        buckets = self.by_column[column]
+        return [row for _, value in values[first:last] for row in buckets[value]]
+
+    def insert(self, row):
+        self._add(row)
+
+    def replace(self, key, values):
+        """
+        Update the row with the given key in place.
+
+        Args:
+            key (str): Key of the row to change
+            values (dict): New column values
+
+        Returns:
+            dict: The updated row, or None if no row has that key
+        """
+        row = self.by_key.get(key)
+        if row is None:
+            return None
+        position = self._position[id(row)]
+        self._remove(row)
+        row.clear()
+        row.update(values)
+        self._add(row, position)
+        return row
+
+
+_TEXT = itemgetter(0)
+
+
+def build_index(table, rows):
+    """
+    Build the standard index for one of the scheduler tables.
+
+    Args:
+        table (str): 'Projects', 'Users' or 'Reviews'
+        rows (list): Rows of that table
+
+    Returns:
+        TableIndex: Index over the rows
+    """
+    schema = TABLE_SCHEMAS[table]
+    return TableIndex(rows, schema['key'], schema['indexes'])
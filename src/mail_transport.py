@@ -0,0 +1,149 @@
+"""
+Project Review Scheduler - Mail Transport
+
+Pooled SMTP transport for the notification system. Instead of connecting,
+running STARTTLS and logging in for every message, the transport keeps a
+small pool of authenticated connections and sends several messages over each
+one. Connections that the server has closed are replaced transparently.
+
+The transport is thread-safe: up to pool_size threads send at the same time,
+each over its own connection, and further senders wait for a free one.
+"""
+
+import smtplib
+import threading
+
+
+class PooledSMTPTransport:
+    """
+    Send email messages over a pool of reusable SMTP connections.
+
+    Args:
+        host (str): SMTP server address
+        port (int): SMTP server port
+        user (str, optional): SMTP username
+        password (str, optional): SMTP password
+        use_tls (bool): Run STARTTLS after connecting
+        pool_size (int): Maximum number of open connections
+        messages_per_connection (int): Messages sent before a connection is recycled
+        timeout (float): Socket timeout in seconds
+    """
+
+    def __init__(self, host, port=587, user=None, password=None, use_tls=True,
+                 pool_size=2, messages_per_connection=100, timeout=30):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.pool_size = max(1, pool_size)
+        self.messages_per_connection = max(1, messages_per_connection)
+        self.timeout = timeout
+
+        self._idle = []
+        self._open = 0
+        # Guards _idle and _open; notified whenever a connection or a slot is freed
+        self._available = threading.Condition()
+        self.connections_opened = 0
+
+    def _connect(self):
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            server.ehlo()
+            if self.use_tls:
+                server.starttls()
+                server.ehlo()
+            if self.user and self.password:
+                server.login(self.user, self.password)
+        except Exception:
+            self._close_quietly(server)
+            raise
+        self.connections_opened += 1
+        return [server, 0]
+
+    @staticmethod
+    def _close_quietly(server):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def _acquire(self):
+        # Take an idle connection, or a free slot to open one, or wait for either
+        with self._available:
+            while not self._idle and self._open >= self.pool_size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._open += 1
+        try:
+            return self._connect()
+        except Exception:
+            self._free_slot()
+            raise
+
+    def _free_slot(self):
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+
+    def _put_idle(self, connection):
+        with self._available:
+            self._idle.append(connection)
+            self._available.notify()
+
+    def _release(self, connection):
+        if connection[1] >= self.messages_per_connection:
+            self._discard(connection)
+        else:
+            self._put_idle(connection)
+
+    def _discard(self, connection):
+        self._close_quietly(connection[0])
+        self._free_slot()
+
+    def send(self, msg):
+        """
+        Send one message, reconnecting once if the server dropped the connection.
+
+        Args:
+            msg (EmailMessage): Message to send
+        """
+        for attempt in range(2):
+            connection = self._acquire()
+            try:
+                connection[0].send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError) as e:
+                self._discard(connection)
+                if attempt == 1:
+                    raise e
+                continue
+            except Exception:
+                # Server rejected this message; the connection may still be usable
+                try:
+                    connection[0].rset()
+                except Exception:
+                    self._discard(connection)
+                else:
+                    self._put_idle(connection)
+                raise
+            connection[1] += 1
+            self._release(connection)
+            return
+
+    def close(self):
+        """Close all idle connections."""
+        with self._available:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._discard(connection)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,102 @@
+"""
+Project Review Scheduler - Review Partitions
+
+Reviews can be stored as one CSV file per month of Scheduled_Date instead of a
+single Reviews.csv:
+
+    reviews/2025-05.csv
+    reviews/2025-06.csv
+    reviews/undated.csv    (rows without a valid Scheduled_Date)
+
+The partition_reviews command moves Reviews.csv into this layout and leaves a
+marker file (reviews/.partitioned) that records it. While the marker is there
+the data access functions in scheduler.py route reads and writes of
+Reviews.csv to the partitions, so callers keep using the Reviews.csv path,
+while the monthly report and date-range queries read only the months they
+need. A header-only Reviews.csv created later by another tool is ignored.
+"""
+
+import os
+import re
+
+PARTITION_DIR_NAME = 'reviews'
+UNDATED = 'undated'
+MARKER_NAME = '.partitioned'
+
+_MONTH = re.compile(r'^(\d{4})-(0[1-9]|1[0-2])')
+
+
+def month_of(scheduled_date):
+    """Return the partition ('YYYY-MM' or 'undated') for a Scheduled_Date value."""
+    match = _MONTH.match(scheduled_date or '')
+    return match.group(0) if match else UNDATED
+
+
+def group_by_month(reviews):
+    """
+    Split reviews into partitions, keeping their order within each month.
+
+    Returns:
+        dict: Partition name -> list of reviews
+    """
+    groups = {}
+    for review in reviews:
+        groups.setdefault(month_of(review.get('Scheduled_Date')), []).append(review)
+    return groups
+
+
+class ReviewPartitions:
+    """
+    The month partitions that hold the rows of a Reviews file.
+
+    Args:
+        reviews_file (str): Path of the Reviews file, e.g. 'data/Reviews.csv'.
+            Its partitions live in 'data/reviews/'.
+    """
+
+    def __init__(self, reviews_file):
+        self.reviews_file = reviews_file
+        self.directory = os.path.join(os.path.dirname(os.path.abspath(reviews_file)), PARTITION_DIR_NAME)
+
+    @property
+    def marker_path(self):
+        return os.path.join(self.directory, MARKER_NAME)
+
+    def exists(self):
+        """True once partition_reviews has moved the Reviews file into partitions."""
+        return os.path.exists(self.marker_path)
+
+    def mark(self):
+        """Record that the Reviews file is stored in these partitions."""
+        with open(self.marker_path, 'w') as f:
+            f.write(f"{os.path.basename(self.reviews_file)}\n")
+
+    def path_for(self, month):
+        return os.path.join(self.directory, f"{month}.csv")
+
+    def months(self):
+        """Partition names in order; dated months first, then 'undated'."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        months = sorted(name[:-4] for name in names if name.endswith('.csv') and not name.startswith('.'))
+        if UNDATED in months:
+            months.remove(UNDATED)
+            months.append(UNDATED)
+        return months
+
+    def paths(self):
+        return [self.path_for(month) for month in self.months()]
+
+    def paths_between(self, start, end):
+        """
+        Paths of the dated partitions that can hold reviews scheduled from start to end.
+
+        Args:
+            start (str): First date, 'YYYY-MM-DD'
+            end (str): Last date, 'YYYY-MM-DD'
+        """
+        first, last = start[:7], end[:7]
+        return [self.path_for(month) for month in self.months()
+                if month != UNDATED and first <= month <= last]
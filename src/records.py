@@ -0,0 +1,271 @@
+"""
+Project Review Scheduler - Typed Records
+
+Compact record types for rows of the Projects, Users and Reviews tables.
+Values are parsed once when a row is loaded: dates become datetime.date,
+Current_Load an int and Review_Frequency_Years a float. Department, Status and
+the ID columns that repeat across rows are interned, so every row shares one
+string object per distinct value. With __slots__ a record takes a fraction of
+the memory of the dictionary DictReader produces.
+
+Records also behave like read-only rows: record['Status'] and
+record.get('Department') return the same text the CSV file holds, so code
+written for dictionaries can read them unchanged. Use the attributes
+(record.last_review_date) to get the parsed values, and to_row() to turn a
+record back into a dictionary for write_csv.
+
+Text that cannot be parsed (a malformed date, for example) is kept as it is,
+and numbers written in another form than Python's ('1.0', '03') remember
+their text, so converting a CSV row to a record and back never changes a value.
+to_row() always returns every column of the table: a column the row did not
+have comes back as '', as write_csv would write it.
+"""
+
+import sys
+from datetime import date, datetime
+
+from utils import parse_date
+
+
+def _text(value):
+    return value
+
+
+def _interned(value):
+    return sys.intern(value) if value else value
+
+
+class _FloatText(float):
+    """A float whose text differs from its repr ('1.0', '0.50'); formats as that text."""
+
+    __slots__ = ('text',)
+
+
+class _IntText(int):
+    """An int whose text differs from str() ('03', '+3'); formats as that text."""
+
+    # int subclasses cannot have slots; such values are rare enough for a __dict__
+
+
+def _date(value):
+    if not value:
+        return None
+    # fromisoformat also accepts forms like '20250101' and '2025-W01-1'
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _int(value):
+    if value is None or value == '':
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        return value
+    if str(number) == value:
+        return number
+    number = _IntText(value)
+    number.text = value
+    return number
+
+
+def _float(value):
+    if value is None or value == '':
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    if _format(number) == value:
+        return number
+    number = _FloatText(value)
+    number.text = value
+    return number
+
+
+def _format(value):
+    if type(value) is str:
+        return value
+    if value is None:
+        return ''
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (_FloatText, _IntText)):
+        return value.text
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    return str(value)
+
+
+class Record:
+    """
+    Base class for the typed table rows.
+
+    Subclasses list their columns in FIELDS as (column, attribute, parser)
+    tuples. Columns a file has beyond FIELDS are kept in extra.
+    """
+
+    __slots__ = ('extra',)
+    FIELDS = ()
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls._ATTRIBUTES = {column: attribute for column, attribute, _ in cls.FIELDS}
+
+    def __init__(self, *values, extra=None):
+        for (_, attribute, _), value in zip(self.FIELDS, values):
+            setattr(self, attribute, value)
+        for _, attribute, _ in self.FIELDS[len(values):]:
+            setattr(self, attribute, None)
+        self.extra = extra or None
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Build a record from a CSV row dictionary.
+
+        Args:
+            row (dict): Row as read by read_csv
+
+        Returns:
+            Record: Record with parsed values
+        """
+        if isinstance(row, cls):
+            return row
+        record = cls(*[parse(row.get(column)) for column, _, parse in cls.FIELDS])
+        attributes = cls._ATTRIBUTES
+        if any(column not in attributes for column in row):
+            record.extra = {k: v for k, v in row.items() if k not in attributes}
+        return record
+
+    def to_row(self):
+        """Return the record as a CSV row dictionary."""
+        row = {column: _format(getattr(self, attribute)) for column, attribute, _ in self.FIELDS}
+        if self.extra:
+            row.update(self.extra)
+        return row
+
+    # Read-only mapping access with CSV text values
+
+    def __getitem__(self, column):
+        attribute = self._ATTRIBUTES.get(column)
+        if attribute is not None:
+            return _format(getattr(self, attribute))
+        if self.extra and column in self.extra:
+            return self.extra[column]
+        raise KeyError(column)
+
+    def get(self, column, default=None):
+        attribute = self._ATTRIBUTES.get(column)
+        if attribute is not None:
+            value = getattr(self, attribute)
+            return default if value is None else _format(value)
+        if self.extra:
+            return self.extra.get(column, default)
+        return default
+
+    def keys(self):
+        columns = list(self._ATTRIBUTES)
+        if self.extra:
+            columns.extend(self.extra)
+        return columns
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __contains__(self, column):
+        return column in self._ATTRIBUTES or bool(self.extra and column in self.extra)
+
+    def items(self):
+        return self.to_row().items()
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_row() == other.to_row()
+        return NotImplemented
+
+    def __repr__(self):
+        key_column, key_attribute, _ = self.FIELDS[0]
+        return f"{type(self).__name__}({key_column}={getattr(self, key_attribute)!r})"
+
+
+class Project(Record):
+    __slots__ = ('project_id', 'project_name', 'start_date', 'last_review_date',
+                 'review_frequency_years', 'department', 'status', 'next_review_date')
+    FIELDS = (
+        ('Project_ID', 'project_id', _text),
+        ('Project_Name', 'project_name', _text),
+        ('Start_Date', 'start_date', _date),
+        ('Last_Review_Date', 'last_review_date', _date),
+        ('Review_Frequency_Years', 'review_frequency_years', _float),
+        ('Department', 'department', _interned),
+        ('Status', 'status', _interned),
+        ('Next_Review_Date', 'next_review_date', _date),
+    )
+
+
+class User(Record):
+    __slots__ = ('user_id', 'name', 'email', 'department', 'current_load')
+    FIELDS = (
+        ('User_ID', 'user_id', _interned),
+        ('Name', 'name', _text),
+        ('Email', 'email', _text),
+        ('Department', 'department', _interned),
+        ('Current_Load', 'current_load', _int),
+    )
+
+
+class Review(Record):
+    __slots__ = ('review_id', 'project_id', 'reviewer_id', 'scheduled_date', 'status', 'completion_date')
+    FIELDS = (
+        ('Review_ID', 'review_id', _text),
+        ('Project_ID', 'project_id', _interned),
+        ('Reviewer_ID', 'reviewer_id', _interned),
+        ('Scheduled_Date', 'scheduled_date', _date),
+        ('Status', 'status', _interned),
+        ('Completion_Date', 'completion_date', _date),
+    )
+
+
+RECORD_TYPES = {'Projects': Project, 'Users': User, 'Reviews': Review}
+
+
+def to_records(table, rows):
+    """
+    Convert the rows of a table to records.
+
+    Args:
+        table (str): 'Projects', 'Users' or 'Reviews'
+        rows (iterable): Row dictionaries (records are passed through)
+
+    Returns:
+        list: Records of the table's type
+    """
+    from_row = RECORD_TYPES[table].from_row
+    return [from_row(row) for row in rows]
+
+
+def row_date(row, column):
+    """
+    Return a date column of a row or record as a datetime.
+
+    Records return their parsed value; dictionaries are parsed as '%Y-%m-%d'.
+
+    Raises:
+        ValueError: If the value is empty or not a valid date
+    """
+    if isinstance(row, Record):
+        value = getattr(row, row._ATTRIBUTES[column])
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        value = value or ''
+    else:
+        value = row[column]
+    return parse_date(value)
@@ -0,0 +1,50 @@
+"""
+Project Review Scheduler - Report Snapshot
+
+A ReportSnapshot holds one read-only copy of Projects, Users and Reviews with
+prebuilt indexes. Report generators take a snapshot argument so a single load
+can be shared by every report in a run, by the dashboards and by tests.
+"""
+
+from indexes import build_index
+from records import to_records
+
+
+class ReportSnapshot:
+    """
+    Immutable view of the three scheduler tables.
+
+    Rows are typed records (see records.py) that can be read like
+    dictionaries but not changed, and the tables are tuples, so reports cannot
+    change data that other reports will read.
+    """
+
+    __slots__ = ('projects', 'users', 'reviews', '_projects_index', '_users_index', '_reviews_index')
+
+    def __init__(self, projects, users, reviews):
+        self.projects = tuple(to_records('Projects', projects))
+        self.users = tuple(to_records('Users', users))
+        self.reviews = tuple(to_records('Reviews', reviews))
+        self._projects_index = build_index('Projects', self.projects)
+        self._users_index = build_index('Users', self.users)
+        self._reviews_index = build_index('Reviews', self.reviews)
+
+    def get_project(self, project_id):
+        return self._projects_index.get(project_id)
+
+    def get_reviewer(self, reviewer_id):
+        return self._users_index.get(reviewer_id)
+
+    def reviews_for_project(self, project_id):
+        return self._reviews_index.find('Project_ID', project_id)
+
+    def reviews_for_reviewer(self, reviewer_id):
+        return self._reviews_index.find('Reviewer_ID', reviewer_id)
+
+    def projects_with_status(self, status):
+        return self._projects_index.find('Status', status)
+
+    def projects_due_between(self, start_date=None, end_date=None, department=None):
+        """Projects with a Next_Review_Date from start_date to end_date ('YYYY-MM-DD'), in date order."""
+        projects = self._projects_index.range('Next_Review_Date', start_date, end_date)
+        return [p for p in projects if department is None or p.get('Department') == department]
@@ -8,7 +8,9 @@ from faker import Faker
 import csv
 import os
 import random
+import shutil
 from datetime import datetime, timedelta
+from partitions import ReviewPartitions
 from scheduler import calculate_all_reviews, assign_all_reviewers
 
 fake = Faker()
@@ -66,6 +68,8 @@ def reset_all():
         "Review_Frequency_Years", "Department", "Status", "Next_Review_Date"
     ])
     write_csv("Reviews.csv", [], ["Review_ID", "Project_ID", "Reviewer_ID", "Scheduled_Date", "Status", "Completion_Date"])
+    # Month partitions would take priority over the new, empty Reviews.csv
+    shutil.rmtree(ReviewPartitions("Reviews.csv").directory, ignore_errors=True)
 
     print("✅ Fake data created.")
     calculate_all_reviews("Projects.csv")
@@ -0,0 +1,95 @@
+"""
+Project Review Scheduler - Reviewer Pool
+
+Keeps reviewers in min-heaps ordered by current load so the reviewer
+assignment does not have to sort the whole reviewer list for every project.
+There is one heap over all reviewers and one heap per department. The least
+loaded reviewer outside a department is the best head among the other
+departments' heaps.
+"""
+
+import heapq
+
+
+class ReviewerPool:
+    """
+    Load-ordered pool of reviewers used by assign_reviewer.
+
+    Heap entries are (load, position, User_ID), where position is the reviewer's
+    place in the original list. Ties on load therefore go to the reviewer listed
+    first, exactly like the stable sort the assignment used before. When a load
+    changes a new entry is pushed; outdated entries are dropped when they reach
+    the top of a heap.
+    """
+
+    def __init__(self, reviewers):
+        self.reviewers = reviewers
+        self._loads = []
+        self._positions = {}
+        self._all = []
+        self._by_department = {}
+
+        for position, reviewer in enumerate(reviewers):
+            try:
+                reviewer['Current_Load'] = int(reviewer.get('Current_Load', 0))
+            except ValueError:
+                reviewer['Current_Load'] = 0
+            self._loads.append(reviewer['Current_Load'])
+            self._positions[id(reviewer)] = position
+            entry = (reviewer['Current_Load'], position, reviewer.get('User_ID'))
+            self._all.append(entry)
+            self._by_department.setdefault(reviewer.get('Department'), []).append(entry)
+
+        heapq.heapify(self._all)
+        for heap in self._by_department.values():
+            heapq.heapify(heap)
+
+    def __len__(self):
+        return len(self.reviewers)
+
+    def _head(self, heap):
+        # Discard entries whose load is no longer current
+        while heap:
+            load, position, _ = heap[0]
+            if self._loads[position] == load:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def least_loaded(self):
+        """Return the reviewer with the lowest load, or None if the pool is empty."""
+        head = self._head(self._all)
+        return self.reviewers[head[1]] if head else None
+
+    def pick(self, department):
+        """
+        Choose the least loaded reviewer outside a department.
+
+        Falls back to the least loaded reviewer overall (same department) when
+        nobody from another department is available.
+
+        Args:
+            department (str): Department of the project being reviewed
+
+        Returns:
+            dict: Selected reviewer, or None if the pool is empty
+        """
+        best = None
+        for reviewer_department, heap in self._by_department.items():
+            if reviewer_department == department:
+                continue
+            head = self._head(heap)
+            if head is not None and (best is None or head < best):
+                best = head
+        if best is None:
+            return self.least_loaded()
+        return self.reviewers[best[1]]
+
+    def increment(self, reviewer):
+        """Add one review to a reviewer's load and reposition it in the heaps."""
+        position = self._positions[id(reviewer)]
+        self._loads[position] += 1
+        reviewer['Current_Load'] = self._loads[position]
+        entry = (self._loads[position], position, reviewer.get('User_ID'))
+        heapq.heappush(self._all, entry)
+        heapq.heappush(self._by_department[reviewer.get('Department')], entry)
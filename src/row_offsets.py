@@ -0,0 +1,209 @@
+"""
+Project Review Scheduler - Row Offset Index
+
+Point lookups into a large CSV file without parsing all of it. The file is
+scanned once through mmap to record where each row starts, keyed by its ID
+column (Review_ID for Reviews.csv). The index is saved in a sidecar file next
+to it (.Reviews.csv.offsets, see sidecars.py) and rebuilt when the file changes.
+
+With the index a single row is one seek and one line parse. A row can also be
+changed in place when its new text has exactly the same length as the old,
+for example Status 'Scheduled' -> 'Completed'; anything else needs a rewrite.
+"""
+
+import csv
+import io
+import mmap
+import os
+
+from sidecars import load_sidecar, restamp_sidecar, save_sidecar, sidecar_path_for, version_of
+
+ENCODING = 'utf-8'
+
+
+def offsets_path_for(file_path):
+    return sidecar_path_for(file_path, 'offsets')
+
+
+def _parse_line(data):
+    return next(csv.reader(io.StringIO(data.decode(ENCODING))), [])
+
+
+def _encode_row(values):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='').writerow(values)
+    return buffer.getvalue().encode(ENCODING)
+
+
+def _scan(mapped, key_column):
+    """Return (header, {key: (offset, length)}) for the rows of a mapped CSV file."""
+    if mapped.find(b'"') == -1:
+        return _scan_unquoted(mapped, key_column)
+    size = len(mapped)
+    offsets = {}
+    header = None
+    key_position = None
+    position = 0
+    while position < size:
+        end = mapped.find(b'\n', position)
+        end = size if end == -1 else end + 1
+        # A quoted field may contain line breaks: extend until the quotes balance
+        while mapped[position:end].count(b'"') % 2 and end < size:
+            next_end = mapped.find(b'\n', end)
+            end = size if next_end == -1 else next_end + 1
+        line = mapped[position:end].rstrip(b'\r\n')
+        if header is None:
+            header = _parse_line(line)
+            if key_column not in header:
+                return header, offsets
+            key_position = header.index(key_column)
+        elif line:
+            if b'"' in line:
+                values = _parse_line(line)
+            else:
+                values = line.decode(ENCODING).split(',')
+            if key_position < len(values):
+                offsets.setdefault(values[key_position], (position, len(line)))
+        position = end
+    return header or [], offsets
+
+
+def _scan_unquoted(mapped, key_column):
+    """_scan for files without quoted fields: every line is one row."""
+    size = len(mapped)
+    end = mapped.find(b'\n')
+    end = size if end == -1 else end
+    header = _parse_line(mapped[:end].rstrip(b'\r'))
+    offsets = {}
+    if key_column not in header:
+        return header, offsets
+    key_position = header.index(key_column)
+    position = end + 1
+    while position < size:
+        end = mapped.find(b'\n', position)
+        if end == -1:
+            end = size
+        line = mapped[position:end]
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        if line:
+            values = line.split(b',', key_position + 1)
+            if key_position < len(values):
+                offsets.setdefault(values[key_position].decode(ENCODING), (position, len(line)))
+        position = end + 1
+    return header, offsets
+
+
+class RowOffsetIndex:
+    """
+    Byte offsets of the rows of a CSV file, keyed by one column.
+
+    Args:
+        file_path (str): CSV file
+        key_column (str): Column identifying a row
+    """
+
+    def __init__(self, file_path, key_column='Review_ID'):
+        self.file_path = file_path
+        self.key_column = key_column
+        self.header = []
+        self.offsets = {}
+        self.mtime_ns = None
+        self.size = None
+
+    def is_current(self, stat=None):
+        try:
+            stat = stat or os.stat(self.file_path)
+        except FileNotFoundError:
+            return False
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def load(self):
+        """Use the saved index if it matches the file, otherwise rebuild and save it."""
+        stat = os.stat(self.file_path)
+        if self.is_current(stat):
+            return self
+        saved = load_sidecar(offsets_path_for(self.file_path), version_of(stat))
+        try:
+            if saved['key_column'] != self.key_column:
+                return self.rebuild()
+            header = list(saved['header'])
+            offsets = {key: (offset, length) for key, offset, length in saved['offsets']}
+        except (TypeError, KeyError, ValueError):
+            return self.rebuild()
+        self.header, self.offsets = header, offsets
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        return self
+
+    def rebuild(self):
+        """Scan the file and save a fresh index."""
+        with open(self.file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size == 0:
+                self.header, self.offsets = [], {}
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    self.header, self.offsets = _scan(mapped, self.key_column)
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        self._save()
+        return self
+
+    def _save(self):
+        offsets = [(key, offset, length) for key, (offset, length) in self.offsets.items()]
+        save_sidecar(offsets_path_for(self.file_path), (self.mtime_ns, self.size),
+                     {'key_column': self.key_column, 'header': self.header, 'offsets': offsets})
+
+    def _mark_current(self, stat):
+        # The rows did not move, so only the saved file version needs updating
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        if not restamp_sidecar(offsets_path_for(self.file_path), version_of(stat)):
+            self._save()
+
+    def get(self, key):
+        """
+        Read one row by key.
+
+        Returns:
+            dict: The row, or None if no row has that key
+        """
+        location = self.offsets.get(key)
+        if location is None:
+            return None
+        offset, length = location
+        with open(self.file_path, 'rb') as f:
+            f.seek(offset)
+            values = _parse_line(f.read(length))
+        values += [None] * (len(self.header) - len(values))
+        return dict(zip(self.header, values))
+
+    def update_in_place(self, row, before_write=None):
+        """
+        Overwrite a row in place if its new text has the same length as the old.
+
+        Args:
+            row (dict): Complete new row, including the key column
+            before_write (callable, optional): Called as before_write(offset, old, new)
+                with the row's bytes before anything is written, e.g. to journal the change
+
+        Returns:
+            bool: True if the row was written, False if it needs a full rewrite
+        """
+        location = self.offsets.get(row.get(self.key_column))
+        if location is None or any(column not in self.header for column in row):
+            return False
+        offset, length = location
+        data = _encode_row(['' if row.get(c) is None else str(row.get(c)) for c in self.header])
+        if len(data) != length or b'\n' in data or b'\r' in data:
+            return False
+
+        with open(self.file_path, 'r+b') as f:
+            f.seek(offset)
+            if before_write is not None:
+                before_write(offset, f.read(length), data)
+                f.seek(offset)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            stat = os.fstat(f.fileno())
+        self._mark_current(stat)
+        return True
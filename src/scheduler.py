@@ -27,18 +27,42 @@ sys.path.append(str(project_dir))
 
 import os
 import csv
+import shutil
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from email.message import EmailMessage
-import pandas as pd
-import matplotlib.pyplot as plt
 from io import StringIO
-
-from faker import Faker
-import random
-fake = Faker()
-
-from utils import safe_parse_date
+from types import SimpleNamespace
+
+# Heavy dependencies are imported on first use so that commands which do not
+# need them start quickly: matplotlib only for charts, NumPy only for the
+# batch date engines. Fake data generation (Faker) lives in reset_and_assign.py.
+plt = None
+
+def _pyplot():
+    """Import matplotlib.pyplot on first use."""
+    global plt
+    if plt is None:
+        import matplotlib.pyplot as pyplot
+        plt = pyplot
+    return plt
+
+from utils import parse_date
+from storage import TABLE_SCHEMAS, SQLiteBackend, table_for_path
+from indexes import build_index
+from reviewer_pool import ReviewerPool
+from mail_transport import PooledSMTPTransport
+from report_snapshot import ReportSnapshot
+from records import row_date, to_records
+from row_offsets import RowOffsetIndex
+from partitions import ReviewPartitions, group_by_month
+from transitions import TransitionIndex, parse_day, status_on
+from archive import append_to_archive, archive_path_for, read_archive, split_archivable, without_rows
+from backups import BackupManager
+from file_locks import file_lock, file_locks, lock_path_for
 from dateutil.relativedelta import relativedelta
 
    
@@ -76,29 +100,567 @@ import os
 import csv
 from datetime import datetime
 
-def read_csv(file_path):
+# Active storage backend. None means the CSV files are read and written directly.
+_storage_backend = None
+
+def set_storage_backend(backend):
+    """
+    Route the data access functions through a storage backend.
+
+    Args:
+        backend (StorageBackend): Backend to use, or None to go back to plain CSV files
+
+    Returns:
+        StorageBackend: The previously active backend
+    """
+    global _storage_backend
+    previous = _storage_backend
+    _storage_backend = backend
+    return previous
+
+def get_storage_backend():
+    return _storage_backend
+
+def _backend_table(file_path):
+    """Return the backend table for file_path, or None if the CSV file should be used."""
+    if _storage_backend is None:
+        return None
+    return table_for_path(file_path)
+
+class _CachedTable:
+    """Parsed rows of one CSV file, the stat they were read at, and a lazy index."""
+
+    __slots__ = ('mtime_ns', 'size', 'rows', 'table', '_index')
+
+    def __init__(self, stat, rows, table):
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.rows = rows
+        self.table = table
+        self._index = None
+
+    def matches(self, stat):
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+    def index(self, table=None):
+        table = table or self.table
+        if self._index is None or self.table != table:
+            self.table = table
+            self._index = build_index(table, self.rows)
+        return self._index
+
+    def append(self, row):
+        self.rows.append(row)
+        if self._index is not None:
+            self._index.insert(row)
+
+# Parsed CSV tables keyed by absolute path
+_csv_cache = {}
+
+def invalidate_csv_cache(file_path=None):
+    """
+    Drop cached rows for one CSV file, or for every file if file_path is None.
+
+    Args:
+        file_path (str, optional): Path of the file that changed
+    """
+    if file_path is None:
+        _csv_cache.clear()
+    else:
+        _csv_cache.pop(os.path.abspath(file_path), None)
+
+def _valid_cache_entry(file_path):
+    """Return the cache entry for file_path if it matches the file on disk."""
+    entry = _csv_cache.get(os.path.abspath(file_path))
+    if entry is None:
+        return None
+    try:
+        return entry if entry.matches(os.stat(file_path)) else None
+    except FileNotFoundError:
+        return None
+
+def _recache(file_path, entry):
+    """Store an entry this process has brought up to date after writing the file."""
+    entry.mtime_ns, entry.size = 0, -1
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return
+    entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+    _csv_cache[os.path.abspath(file_path)] = entry
+
+def _as_written(row):
+    # The values a row has after a round trip through the CSV file
+    return {k: '' if v is None else str(v) for k, v in row.items()}
+
+def read_csv(file_path, shared=False):
     """
     Read data from a CSV file. If missing, create a new one with default schema.
 
+    Parsed rows are cached per process and reused while the file's modification
+    time and size are unchanged.
+
     Args:
         file_path (str): Full or relative path to the CSV file.
+        shared (bool): Return the cached rows themselves instead of copies.
+            Only for read-only callers; the rows must not be modified.
 
     Returns:
         list: List of rows as dictionaries.
     """
-    if not os.path.exists(file_path):
+    table = _backend_table(file_path)
+    if table:
+        return _storage_backend.read_all(table)
+
+    partitions = _review_partitions(file_path)
+    if partitions is not None:
+        return _read_partitions(file_path, partitions, shared)
+
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         print(f"⚠️ {file_path} not found. Creating with headers...")
         create_csv_if_missing(file_path)
         return []
 
-    with open(file_path, mode='r', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        return list(reader)
+    key = os.path.abspath(file_path)
+    entry = _csv_cache.get(key)
+    if entry is None or not entry.matches(stat):
+        with file_lock(file_path):
+            rows = _read_snapshot_rows(file_path, stat)
+            if rows is None:
+                with open(file_path, mode='r', newline='') as csvfile:
+                    reader = csv.DictReader(csvfile)
+                    rows = list(reader)
+                    stat = os.fstat(csvfile.fileno())
+        entry = _csv_cache[key] = _CachedTable(stat, rows, table_for_path(file_path))
+
+    if shared:
+        return entry.rows
+    return [dict(row) for row in entry.rows]
+
+# ---------------------------------------------------------------------------
+# Month-partitioned Reviews (see partitions.py)
+# ---------------------------------------------------------------------------
+
+# Partition stats the combined rows of a partitioned Reviews file were built from
+_partition_signatures = {}
+_NO_STAT = SimpleNamespace(st_mtime_ns=0, st_size=-1)
+
+def _review_partitions(file_path):
+    """
+    Return the ReviewPartitions of a Reviews file stored as month partitions, else None.
+
+    The partitions are used whenever partition_reviews has marked them, so a
+    header-only Reviews.csv created by another tool does not hide them.
+
+    Raises:
+        ValueError: If the Reviews file holds reviews as well as the partitions
+    """
+    if table_for_path(file_path) != 'Reviews' or _backend_table(file_path):
+        return None
+    partitions = ReviewPartitions(file_path)
+    if not partitions.exists():
+        return None
+    if _has_rows(file_path):
+        raise ValueError(f"{file_path} holds reviews although its reviews are stored in "
+                         f"{partitions.directory}; move them into the partitions or remove "
+                         f"{partitions.marker_path}")
+    return partitions
+
+def _has_rows(file_path):
+    """True if a CSV file exists and has at least one row below its header."""
+    try:
+        with open(file_path, mode='r', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            next(reader, None)
+            return any(reader)
+    except FileNotFoundError:
+        return False
+
+def _read_partitions(file_path, partitions, shared):
+    """read_csv for a partitioned Reviews file: all partitions, oldest month first."""
+    key = os.path.abspath(file_path)
+    with file_lock(file_path):
+        paths = partitions.paths()
+        signature = []
+        for path in paths:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        signature = tuple(signature)
+
+        entry = _csv_cache.get(key)
+        if entry is None or _partition_signatures.get(key) != signature:
+            rows = []
+            for path in paths:
+                rows.extend(read_csv(path, shared=True))
+            # Not tied to a single file's stat; validated by the signature instead
+            entry = _csv_cache[key] = _CachedTable(_NO_STAT, rows, 'Reviews')
+            _partition_signatures[key] = signature
+
+    if shared:
+        return entry.rows
+    return [dict(row) for row in entry.rows]
+
+def _write_partitions(file_path, partitions, data, fieldnames):
+    """write_csv for a partitioned Reviews file: rewrite only the months that changed."""
+    fieldnames = list(fieldnames)
+    groups = group_by_month(data)
+    with file_lock(file_path, exclusive=True):
+        for month in sorted(set(partitions.months()) | set(groups)):
+            path = partitions.path_for(month)
+            rows = groups.get(month)
+            if rows is None:
+                backup_file(path)
+                os.remove(path)
+                invalidate_csv_cache(path)
+            elif not _partition_unchanged(path, rows, fieldnames):
+                write_csv(path, rows, fieldnames)
+    invalidate_csv_cache(file_path)
+
+def _partition_unchanged(path, rows, fieldnames):
+    if not os.path.exists(path) or read_csv_header(path) != fieldnames:
+        return False
+    current = read_csv(path, shared=True)
+    if len(current) != len(rows):
+        return False
+    for old, new in zip(current, rows):
+        new = _as_written(new)
+        if any(old.get(f) != new.get(f, '') for f in fieldnames) or any(k not in fieldnames for k in new):
+            return False
+    return True
+
+def _add_to_partitions(file_path, partitions, reviews):
+    """add_reviews for a partitioned Reviews file: append each review to its month."""
+    with file_lock(file_path, exclusive=True):
+        for month, group in group_by_month(reviews).items():
+            path = partitions.path_for(month)
+            if not os.path.exists(path):
+                with open(path, 'w', newline='') as csvfile:
+                    csv.writer(csvfile).writerow(TABLE_SCHEMAS['Reviews']['columns'])
+            add_reviews(group, path)
+    invalidate_csv_cache(file_path)
+
+def partition_reviews(reviews_file='Reviews.csv'):
+    """
+    Move a Reviews file into month partitions (reviews/YYYY-MM.csv).
+
+    The file is backed up and removed; afterwards all reads and writes of
+    reviews_file go to the partitions.
+
+    Args:
+        reviews_file (str): Path to the Reviews CSV file
+
+    Returns:
+        dict: Number of reviews per partition
+    """
+    partitions = ReviewPartitions(reviews_file)
+    with file_lock(reviews_file, exclusive=True):
+        header = read_csv_header(reviews_file)
+        groups = group_by_month(read_csv(reviews_file))
+        backup_file(reviews_file)
+        os.makedirs(partitions.directory, exist_ok=True)
+        for month, rows in groups.items():
+            write_csv(partitions.path_for(month), rows, header)
+        # Keep the lock file so processes go on locking the partitioned table
+        open(lock_path_for(reviews_file), 'a').close()
+        partitions.mark()
+        os.remove(reviews_file)
+    invalidate_csv_cache(reviews_file)
+    return {month: len(rows) for month, rows in groups.items()}
+
+def get_reviews_between(start_date, end_date, file_path='Reviews.csv'):
+    """
+    Return the reviews scheduled between two dates (inclusive).
+
+    With month partitions only the partitions in the range are read.
+
+    Args:
+        start_date (str or date): First date, 'YYYY-MM-DD'
+        end_date (str or date): Last date, 'YYYY-MM-DD'
+        file_path (str): Path to the Reviews CSV file
+
+    Returns:
+        list: Matching reviews in storage order
+    """
+    start, end = str(start_date)[:10], str(end_date)[:10]
+    in_range = lambda r: start <= (r.get('Scheduled_Date') or '')[:10] <= end
+    partitions = _review_partitions(file_path)
+    if partitions is None:
+        reviews = list(iter_csv(file_path, where=in_range))
+    else:
+        with file_lock(file_path):
+            reviews = [r for path in partitions.paths_between(start, end) for r in iter_csv(path, where=in_range)]
+    return _with_archived(file_path, reviews, in_range)
+
+# ---------------------------------------------------------------------------
+# Cold archive of finished reviews (see archive.py)
+# ---------------------------------------------------------------------------
+
+# Archive finished reviews older than this many days before each assignment run; None disables
+_archive_after_days = int(os.environ['SCHEDULER_ARCHIVE_AFTER_DAYS']) \
+    if os.environ.get('SCHEDULER_ARCHIVE_AFTER_DAYS') else None
+
+def configure_archiving(after_days=None):
+    """
+    Set the automatic archive policy used by assign_all_reviewers.
+
+    Args:
+        after_days (int, optional): Archive Completed and Missed reviews older
+            than this many days. None turns automatic archiving off.
+
+    Returns:
+        int: The previous setting
+    """
+    global _archive_after_days
+    previous = _archive_after_days
+    _archive_after_days = after_days
+    return previous
+
+def archive_reviews(reviews_file='Reviews.csv', older_than_days=90, current_date=None):
+    """
+    Move Completed and Missed reviews older than a number of days to the archive.
+
+    Afterwards the hot file holds only active and recently finished reviews;
+    get_all_reviews and get_reviews_between still return the archived ones.
+
+    Args:
+        reviews_file (str): Path to the Reviews CSV file
+        older_than_days (int): Age in days (by completion or scheduled date) of reviews to archive
+        current_date (datetime, optional): Date to age reviews from. Defaults to now.
+
+    Returns:
+        int: Number of reviews archived
+    """
+    if _backend_table(reviews_file):
+        raise ValueError("Reviews can only be archived from CSV files")
+    cutoff = (current_date or datetime.now()) - timedelta(days=int(older_than_days))
+    archive_path = archive_path_for(reviews_file)
+
+    with file_locks([reviews_file, archive_path], exclusive=True):
+        reviews = read_csv(reviews_file)
+        hot, cold = split_archivable(reviews, cutoff)
+        if not cold:
+            return 0
+        # Skip rows left behind by an archive run that failed before rewriting the
+        # hot file. Rows are matched whole: a row only leaves the hot file once
+        # that exact row is in the archive.
+        new_cold = without_rows(cold, _read_archived(reviews_file))
+
+        partitions = _review_partitions(reviews_file)
+        if partitions is not None:
+            header = list(TABLE_SCHEMAS['Reviews']['columns'])
+            header += [c for r in reviews for c in r if c not in header]
+            header = list(dict.fromkeys(header))
+        else:
+            header = read_csv_header(reviews_file)
+
+        if new_cold:
+            append_to_archive(archive_path, new_cold, header)
+            invalidate_csv_cache(archive_path)
+
+        if partitions is not None:
+            _write_partitions(reviews_file, partitions, hot, header)
+        elif hot:
+            write_csv(reviews_file, hot, header)
+        else:
+            backup_file(reviews_file)
+            _replace_file(reviews_file, [], header)
+            invalidate_csv_cache(reviews_file)
+    return len(cold)
+
+def _apply_archive_policy(reviews_file, current_date=None):
+    if _archive_after_days is None or _backend_table(reviews_file):
+        return 0
+    return archive_reviews(reviews_file, _archive_after_days, current_date)
+
+def _read_archived(file_path):
+    """Rows of the archive belonging to a Reviews file, cached like read_csv ([] if none)."""
+    archive_path = archive_path_for(file_path)
+    try:
+        stat = os.stat(archive_path)
+    except FileNotFoundError:
+        return []
+    key = os.path.abspath(archive_path)
+    entry = _csv_cache.get(key)
+    if entry is None or not entry.matches(stat):
+        with file_lock(archive_path):
+            _, rows = read_archive(archive_path)
+        entry = _csv_cache[key] = _CachedTable(stat, rows, 'Reviews')
+    return entry.rows
+
+def _with_archived(file_path, reviews, where=None):
+    """Prepend the archived reviews (matching where) that are not also in reviews."""
+    if _backend_table(file_path):
+        return reviews
+    archived = _read_archived(file_path)
+    if not archived:
+        return reviews
+    if where is not None:
+        archived = [r for r in archived if where(r)]
+    return [dict(r) for r in without_rows(archived, reviews)] + reviews
+
+def _read_snapshot_rows(file_path, stat):
+    """Rows from the file's columnar snapshot, or None if it has no current snapshot."""
+    # Same path as columnar.snapshot_path_for, checked before importing NumPy
+    if not os.path.exists(f"{file_path}.npz"):
+        return None
+    from columnar import load_snapshot
+    snapshot = load_snapshot(file_path, stat)
+    return snapshot.rows() if snapshot is not None else None
+
+def write_snapshots(file_paths):
+    """
+    Write columnar snapshots of CSV files for fast loading (see columnar.py).
+
+    Args:
+        file_paths (list): CSV files to snapshot
+
+    Returns:
+        dict: Snapshot path for each file, None for files that do not exist
+    """
+    from columnar import write_snapshot
+    written = {}
+    for file_path in file_paths:
+        if not os.path.exists(file_path):
+            written[file_path] = None
+            continue
+        with file_lock(file_path):
+            written[file_path] = write_snapshot(file_path)
+    return written
+
+def table_index(file_path, table, rows=None):
+    """
+    Return the TableIndex for a Projects, Users or Reviews CSV file.
+
+    The index is built once per loaded version of the file and reused by all
+    lookups until the file changes.
+
+    Args:
+        file_path (str): Path to the CSV file
+        table (str): Table the file holds ('Projects', 'Users' or 'Reviews')
+        rows (list, optional): The rows read_csv(file_path, shared=True) returned,
+            if the caller has them already
+
+    Returns:
+        TableIndex: Index over the file's rows
+    """
+    if rows is None:
+        rows = read_csv(file_path, shared=True)
+    entry = _csv_cache.get(os.path.abspath(file_path))
+    if entry is not None and entry.rows is rows:
+        return entry.index(table)
+    return build_index(table, rows)
+
+# Files larger than this are streamed by the filtered getters and reports
+# instead of being loaded and cached whole
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+ACTIVE_REVIEW_STATUSES = ('Scheduled', 'In Progress')
+
+def _filter_rows(rows, where, columns):
+    """Apply iter_csv's where and columns arguments to rows already in memory."""
+    conditions = [(column, _allowed_values(allowed)) for column, allowed in where.items()] \
+        if isinstance(where, dict) else []
+    for row in rows:
+        if any(row.get(column) not in allowed for column, allowed in conditions):
+            continue
+        if callable(where) and not where(row):
+            continue
+        yield {c: row.get(c) for c in columns} if columns is not None else dict(row)
+
+def _allowed_values(allowed):
+    if isinstance(allowed, (set, frozenset, list, tuple)):
+        return set(allowed)
+    return {allowed}
+
+def iter_csv(file_path, where=None, columns=None):
+    """
+    Stream the rows of a CSV file one at a time.
+
+    Only the current row is held in memory, so large files can be filtered in
+    constant memory. Rows already cached by read_csv are filtered in memory
+    instead of reading the file again. The file stays share-locked until the
+    generator is exhausted or closed.
+
+    Args:
+        file_path (str): Path to the CSV file
+        where (dict or callable, optional): Either a mapping of column to an
+            allowed value (or set of values), or a function taking a row and
+            returning True for rows to keep
+        columns (list, optional): Columns to include in each row. All columns if omitted.
+
+    Yields:
+        dict: Each matching row
+    """
+    table = _backend_table(file_path)
+    if table:
+        yield from _filter_rows(_storage_backend.read_all(table), where, columns)
+        return
+
+    partitions = _review_partitions(file_path)
+    if partitions is not None:
+        with file_lock(file_path):
+            for path in partitions.paths():
+                yield from iter_csv(path, where, columns)
+        return
+
+    entry = _valid_cache_entry(file_path)
+    if entry is not None:
+        yield from _filter_rows(entry.rows, where, columns)
+        return
+
+    if not os.path.exists(file_path):
+        return
+
+    with file_lock(file_path), open(file_path, mode='r', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if not header:
+            return
+        width = len(header)
+
+        # Dict conditions are checked on the raw values before a row dict is built
+        conditions = []
+        if isinstance(where, dict):
+            for column, allowed in where.items():
+                if column not in header:
+                    return
+                conditions.append((header.index(column), _allowed_values(allowed)))
+        predicate = where if callable(where) else None
+
+        for values in reader:
+            if len(values) < width:
+                if not values:
+                    continue
+                values = values + [None] * (width - len(values))
+            for i, allowed in conditions:
+                if values[i] not in allowed:
+                    break
+            else:
+                row = dict(zip(header, values))
+                if predicate is not None and not predicate(row):
+                    continue
+                yield {c: row.get(c) for c in columns} if columns is not None else row
+
+def _should_stream(file_path):
+    """True if a CSV file is too large to load whole and is not cached already."""
+    if _backend_table(file_path) or _valid_cache_entry(file_path) is not None:
+        return False
+    try:
+        return os.path.getsize(file_path) > STREAM_THRESHOLD_BYTES
+    except OSError:
+        return False
 
 def write_csv(file_path, data, fieldnames=None):
     """
     Write data to a CSV file. Backs up old file if it exists.
 
+    The data is written to a temporary file in the same directory, synced to
+    disk and then moved over the old file, so readers see either the old or
+    the new contents, never a partial file. The file is locked exclusively
+    while it is backed up and replaced.
+
     Args:
         file_path (str): Path to the CSV file
         data (list): List of dictionaries to write
@@ -108,30 +670,141 @@ def write_csv(file_path, data, fieldnames=None):
         print(f"⚠️ No data to write to {file_path}")
         return
 
+    table = _backend_table(file_path)
+    if table:
+        _storage_backend.replace_all(table, data)
+        return
+
     if fieldnames is None:
         fieldnames = data[0].keys()
 
-    # Backup existing file
-    if os.path.exists(file_path):
-        backup_file(file_path)
+    partitions = _review_partitions(file_path)
+    if partitions is not None:
+        _write_partitions(file_path, partitions, data, fieldnames)
+        return
+
+    with file_lock(file_path, exclusive=True):
+        # Backup existing file
+        if os.path.exists(file_path):
+            backup_file(file_path)
 
-    with open(file_path, mode='w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+        _replace_file(file_path, data, fieldnames)
+    invalidate_csv_cache(file_path)
+
+def _replace_file(file_path, data, fieldnames):
+    """Atomically replace file_path with a CSV file holding data."""
+    directory, name = os.path.split(os.path.abspath(file_path))
+    temp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, mode='w', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(data)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(directory)
+
+def _fsync_directory(directory):
+    # Make the rename itself durable; not every platform can open a directory
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+# Compressed backups, at most one per file per run (see backups.py)
+_backup_manager = BackupManager(os.environ.get('SCHEDULER_BACKUP_DIR') or None)
+
+def configure_backups(backup_dir=None, compression='gzip', keep_last=5, keep_daily=7, keep_weekly=4,
+                      prune_legacy=False):
+    """
+    Replace the backup settings used by write_csv.
+
+    Args:
+        backup_dir (str, optional): Directory for backups. Defaults to 'backups' next to each file.
+        compression (str): 'gzip', 'lzma' or None
+        keep_last (int): Number of most recent backups always kept
+        keep_daily (int): Number of days for which the newest backup is kept
+        keep_weekly (int): Number of weeks for which the newest backup is kept
+        prune_legacy (bool): Let the retention policy delete old FILE.TIMESTAMP.bak files too
+
+    Returns:
+        BackupManager: The new backup manager
+    """
+    global _backup_manager
+    _backup_manager = BackupManager(backup_dir, compression, keep_last, keep_daily, keep_weekly, prune_legacy)
+    return _backup_manager
+
+@contextmanager
+def backup_run():
+    """
+    Treat the writes inside the block as one run: each file is backed up once,
+    before its first write. A block inside another run joins that run.
+    """
+    manager = _backup_manager
+    if manager.in_run:
+        yield
+        return
+    manager.start_run()
+    try:
+        yield
+    finally:
+        manager.end_run()
 
 def backup_file(file_path):
     """
-    Create a backup copy of a file with a timestamp.
+    Create a compressed, timestamped backup of a file.
+
+    Inside a backup_run only the first call per file makes a backup, so a
+    batch of writes keeps the state from before the run.
 
     Args:
         file_path (str): Path to the file to backup
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = f"{file_path}.{timestamp}.bak"
-    with open(file_path, 'r') as src, open(backup_path, 'w') as dst:
-        dst.write(src.read())
-    print(f" Backed up {file_path} → {backup_path}")
+    backup_path = _backup_manager.backup(file_path)
+    if backup_path:
+        print(f" Backed up {file_path} → {backup_path}")
+
+def restore_backups(file_paths, as_of=None):
+    """
+    Restore data files to their state at a point in time.
+
+    Each file gets the content of its newest backup taken at or before as_of.
+    When a file has only had rows changed in place since as_of, those changes
+    are undone from the row edit journal instead.
+
+    Args:
+        file_paths (list): Files to restore
+        as_of (datetime, optional): Point in time. Defaults to the newest backup.
+
+    Returns:
+        dict: Restored backup path for each file, None where no backup was old enough
+    """
+    restored = {}
+    for file_path in file_paths:
+        try:
+            with file_lock(file_path, exclusive=True):
+                if as_of is not None and _backup_manager.undo_row_edits(file_path, as_of):
+                    restored[file_path] = _backup_manager.row_edits_path(file_path)
+                else:
+                    restored[file_path] = _backup_manager.restore(file_path, as_of=as_of)
+        except FileNotFoundError:
+            restored[file_path] = None
+        invalidate_csv_cache(file_path)
+    return restored
 
 def create_csv_if_missing(file_path, schema=None):
     """
@@ -143,7 +816,7 @@ def create_csv_if_missing(file_path, schema=None):
     Returns:
         bool: True if file was created, False if it already existed
     """
-    if os.path.exists(file_path):
+    if os.path.exists(file_path) or _review_partitions(file_path) is not None:
         return False
 
     filename = os.path.basename(file_path)
@@ -174,49 +847,417 @@ def get_all_projects(file_path='Projects.csv'):
 def get_all_users(file_path='Users.csv'):
     return read_csv(file_path)
 
-def get_all_reviews(file_path='Reviews.csv'):
-    return read_csv(file_path)
+def get_all_reviews(file_path='Reviews.csv', include_archived=True):
+    """
+    Read all reviews, including archived ones unless include_archived is False.
+
+    Args:
+        file_path (str): Path to the reviews CSV file
+        include_archived (bool): Also return the reviews moved to the archive
+
+    Returns:
+        list: Archived reviews first, then the reviews in the file
+    """
+    reviews = read_csv(file_path)
+    return _with_archived(file_path, reviews) if include_archived else reviews
+
+def read_records(file_path, table=None):
+    """
+    Read a Projects, Users or Reviews file as typed records (see records.py).
+
+    Args:
+        file_path (str): Path to the CSV file
+        table (str, optional): Table the file holds. Derived from the file name if omitted.
+
+    Returns:
+        list: Project, User or Review records
+    """
+    table = table or table_for_path(file_path)
+    if table is None:
+        raise ValueError(f"Cannot tell which table {file_path} holds")
+    return to_records(table, read_csv(file_path, shared=True))
 
 def get_projects_by_status(status, file_path='Projects.csv'):
-    return [p for p in read_csv(file_path) if p.get('Status') == status]
+    if _backend_table(file_path):
+        return _storage_backend.find('Projects', 'Status', status)
+    if _should_stream(file_path):
+        return list(iter_csv(file_path, where={'Status': status}))
+    return [dict(p) for p in table_index(file_path, 'Projects').find('Status', status)]
+
+def projects_due_between(start_date=None, end_date=None, department=None, file_path='Projects.csv'):
+    """
+    Return the projects whose Next_Review_Date lies between two dates (inclusive).
+
+    Uses the sorted Next_Review_Date index of the loaded Projects table, so
+    the cost is a binary search plus the projects returned.
+
+    Args:
+        start_date (str or date, optional): First date, 'YYYY-MM-DD'. No lower limit if omitted.
+        end_date (str or date, optional): Last date. No upper limit if omitted.
+        department (str, optional): Only projects of this department
+        file_path (str): Path to the Projects CSV file
+
+    Returns:
+        list: Matching projects ordered by Next_Review_Date
+    """
+    start = str(start_date)[:10] if start_date is not None else None
+    end = str(end_date)[:10] if end_date is not None else None
+    if _should_stream(file_path):
+        in_range = lambda p: (p.get('Next_Review_Date') and (start is None or start <= p['Next_Review_Date'])
+                              and (end is None or p['Next_Review_Date'][:10] <= end))
+        where = {'Department': department} if department is not None else None
+        matches = [p for p in iter_csv(file_path, where=where) if in_range(p)]
+        return sorted(matches, key=lambda p: p['Next_Review_Date'])
+    if _backend_table(file_path):
+        index = build_index('Projects', _storage_backend.read_all('Projects'))
+    else:
+        index = table_index(file_path, 'Projects')
+    return [dict(p) for p in index.range('Next_Review_Date', start, end)
+            if department is None or p.get('Department') == department]
 
 def get_reviews_by_project(project_id, file_path='Reviews.csv'):
-    return [r for r in read_csv(file_path) if r.get('Project_ID') == project_id]
+    if _backend_table(file_path):
+        return _storage_backend.find('Reviews', 'Project_ID', project_id)
+    if _should_stream(file_path):
+        return list(iter_csv(file_path, where={'Project_ID': project_id}))
+    return [dict(r) for r in table_index(file_path, 'Reviews').find('Project_ID', project_id)]
+
+def get_reviews_by_reviewer(reviewer_id, file_path='Reviews.csv'):
+    if _backend_table(file_path):
+        return _storage_backend.find('Reviews', 'Reviewer_ID', reviewer_id)
+    if _should_stream(file_path):
+        return list(iter_csv(file_path, where={'Reviewer_ID': reviewer_id}))
+    return [dict(r) for r in table_index(file_path, 'Reviews').find('Reviewer_ID', reviewer_id)]
+
+def get_review(review_id, file_path='Reviews.csv'):
+    if _backend_table(file_path):
+        return _storage_backend.get('Reviews', review_id)
+    if _should_stream(file_path):
+        with file_lock(file_path):
+            return _row_offsets(file_path).get(review_id)
+    review = table_index(file_path, 'Reviews').get(review_id)
+    return dict(review) if review else None
+
+# Byte-offset indexes of large Reviews files keyed by absolute path (see row_offsets.py)
+_offset_indexes = {}
+
+def _row_offsets(file_path):
+    """Return the current RowOffsetIndex of a Reviews file. Call with the file locked."""
+    key = os.path.abspath(file_path)
+    index = _offset_indexes.get(key)
+    if index is None:
+        index = _offset_indexes[key] = RowOffsetIndex(file_path, 'Review_ID')
+    return index.load()
+
+def get_project(project_id, file_path='Projects.csv'):
+    if _backend_table(file_path):
+        return _storage_backend.get('Projects', project_id)
+    project = table_index(file_path, 'Projects').get(project_id)
+    return dict(project) if project else None
 
 def get_reviewer(reviewer_id, file_path='Users.csv'):
-    for user in read_csv(file_path):
-        if user.get('User_ID') == reviewer_id:
-            return user
-    return None
+    if _backend_table(file_path):
+        return _storage_backend.get('Users', reviewer_id)
+    user = table_index(file_path, 'Users').get(reviewer_id)
+    return dict(user) if user else None
+
+def _refresh_cached_row(file_path, table, entry, key, row):
+    """Apply a single-row update to a cache entry after the file was rewritten."""
+    if entry is not None and entry.index(table).replace(key, _as_written(row)) is not None:
+        _recache(file_path, entry)
 
 def update_project(project, file_path='Projects.csv'):
-    projects = read_csv(file_path)
-    for i, p in enumerate(projects):
-        if p.get('Project_ID') == project.get('Project_ID'):
-            projects[i] = project
-            break
-    write_csv(file_path, projects)
+    if _backend_table(file_path):
+        _storage_backend.upsert('Projects', project)
+        return
+    with file_lock(file_path, exclusive=True):
+        entry = _valid_cache_entry(file_path)
+        projects = read_csv(file_path)
+        for i, p in enumerate(projects):
+            if p.get('Project_ID') == project.get('Project_ID'):
+                projects[i] = project
+                break
+        write_csv(file_path, projects)
+        _refresh_cached_row(file_path, 'Projects', entry, project.get('Project_ID'), project)
 
 def update_user(user, file_path='Users.csv'):
-    users = read_csv(file_path)
-    for i, u in enumerate(users):
-        if u.get('User_ID') == user.get('User_ID'):
-            users[i] = user
-            break
-    write_csv(file_path, users)
+    """
+    Update an existing user in the users CSV file.
+
+    Args:
+        user (dict): User dictionary with updated information
+        file_path (str): Path to the users CSV file
+    """
+    if _backend_table(file_path):
+        _storage_backend.upsert('Users', user)
+        return
+    with file_lock(file_path, exclusive=True):
+        entry = _valid_cache_entry(file_path)
+        users = read_csv(file_path)
+        for i, u in enumerate(users):
+            if u.get('User_ID') == user.get('User_ID'):
+                users[i] = user
+                break
+        write_csv(file_path, users)
+        _refresh_cached_row(file_path, 'Users', entry, user.get('User_ID'), user)
 
 def add_review(review, file_path='Reviews.csv'):
-    reviews = read_csv(file_path)
-    reviews.append(review)
-    write_csv(file_path, reviews)
+    """
+    Add a new review to the reviews CSV file.
+
+    Args:
+        review (dict): Review dictionary to add
+        file_path (str): Path to the reviews CSV file
+    """
+    add_reviews([review], file_path)
+
+def add_reviews(reviews, file_path='Reviews.csv'):
+    """
+    Append reviews to the reviews CSV file without rewriting it.
+
+    The existing header is checked first. If the reviews contain columns the
+    file does not have, the file is rewritten with the combined data instead.
+    Appending never changes existing rows, so no backup is made.
+
+    Args:
+        reviews (iterable): Review dictionaries to add
+        file_path (str): Path to the reviews CSV file
+
+    Returns:
+        int: Number of reviews added
+    """
+    reviews = list(reviews)
+    if not reviews:
+        return 0
+
+    if _backend_table(file_path):
+        _storage_backend.insert_many('Reviews', reviews)
+        return len(reviews)
+
+    partitions = _review_partitions(file_path)
+    if partitions is not None:
+        _add_to_partitions(file_path, partitions, reviews)
+        return len(reviews)
+
+    if not os.path.exists(file_path):
+        # Nothing to append to: write the file with the standard columns
+        columns = TABLE_SCHEMAS['Reviews']['columns']
+        write_csv(file_path, reviews, list(dict.fromkeys(columns + [key for r in reviews for key in r])))
+        return len(reviews)
+
+    with file_lock(file_path, exclusive=True):
+        header = read_csv_header(file_path)
+        columns = set(header)
+        if not header or any(key not in columns for r in reviews for key in r):
+            # New columns go after the existing ones; rows without them get ''
+            fieldnames = list(dict.fromkeys(header + [key for r in reviews for key in r]))
+            write_csv(file_path, read_csv(file_path) + reviews, fieldnames)
+            return len(reviews)
+
+        entry = _valid_cache_entry(file_path)
+
+        # Files edited by hand may not end with a line break
+        needs_newline = False
+        with open(file_path, mode='rb') as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) not in (b'\n', b'\r')
+
+        with open(file_path, mode='a', newline='') as csvfile:
+            if needs_newline:
+                csvfile.write('\r\n')
+            writer = csv.DictWriter(csvfile, fieldnames=header)
+            writer.writerows(reviews)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+        invalidate_csv_cache(file_path)
+
+        # Keep the cached table and its index current instead of reparsing
+        if entry is not None:
+            for review in reviews:
+                row = {column: '' for column in header}
+                row.update(_as_written(review))
+                entry.append(row)
+            _recache(file_path, entry)
+    return len(reviews)
+
+def read_csv_header(file_path):
+    """
+    Read only the header row of a CSV file.
+
+    Args:
+        file_path (str): Path to the CSV file
+
+    Returns:
+        list: Column names, or an empty list if the file is empty
+    """
+    with open(file_path, mode='r', newline='') as csvfile:
+        return next(csv.reader(csvfile), [])
+
+def update_review(review, file_path='Reviews.csv'):
+    if _backend_table(file_path):
+        _storage_backend.upsert('Reviews', review)
+        return
+    with file_lock(file_path, exclusive=True):
+        # Large files: overwrite the row in place when its length is unchanged,
+        # journaling the old row instead of backing up the whole file
+        if _should_stream(file_path):
+            index = _row_offsets(file_path)
+            if review.get('Review_ID') in index.offsets:
+                record = lambda offset, old, new: _backup_manager.record_row_edit(file_path, offset, old, new)
+                if index.update_in_place(review, before_write=record):
+                    invalidate_csv_cache(file_path)
+                    return
+
+        entry = _valid_cache_entry(file_path)
+        reviews = read_csv(file_path)
+        for i, r in enumerate(reviews):
+            if r.get('Review_ID') == review.get('Review_ID'):
+                reviews[i] = review
+                break
+        write_csv(file_path, reviews)
+        _refresh_cached_row(file_path, 'Reviews', entry, review.get('Review_ID'), review)
+
+def migrate_csv_to_backend(backend, projects_file='Projects.csv', users_file='Users.csv',
+                           reviews_file='Reviews.csv'):
+    """
+    Copy the contents of the CSV files into a storage backend.
+
+    Args:
+        backend (StorageBackend): Destination backend
+        projects_file (str): Path to the Projects CSV file
+        users_file (str): Path to the Users CSV file
+        reviews_file (str): Path to the Reviews CSV file
+
+    Returns:
+        dict: Number of rows imported per table
+    """
+    previous = set_storage_backend(None)
+    try:
+        return {
+            'Projects': backend.import_csv('Projects', read_csv(projects_file)),
+            'Users': backend.import_csv('Users', read_csv(users_file)),
+            'Reviews': backend.import_csv('Reviews', read_csv(reviews_file)),
+        }
+    finally:
+        set_storage_backend(previous)
+
+
+
+
+class DataSession:
+    """
+    Unit of work for batch changes to Users and Reviews.
+
+    Users and Reviews are loaded once. User updates and new reviews are collected
+    in memory and written by commit() with a single write (and backup) per file.
+    rollback() discards pending changes and restores the loads of touched users.
+    Use it as a context manager to commit on success and roll back on error.
+    """
+
+    def __init__(self, users_file='Users.csv', reviews_file='Reviews.csv', users=None, reviews=None):
+        self.users_file = users_file
+        self.reviews_file = reviews_file
+        self.users = users if users is not None else read_csv(users_file)
+        self.reviews = reviews if reviews is not None else read_csv(reviews_file)
+        self.review_ids = {r.get('Review_ID') for r in self.reviews}
+        # Callers update user dicts in place, so keep copies of the committed state
+        self._committed_users = {u.get('User_ID'): dict(u) for u in self.users}
+        self._pending_users = {}
+        self._new_reviews = []
+
+    def update_user(self, user):
+        self._pending_users[user.get('User_ID')] = user
+
+    def add_review(self, review):
+        self._new_reviews.append(review)
+        self.review_ids.add(review.get('Review_ID'))
+
+    @property
+    def pending(self):
+        return len(self._pending_users) + len(self._new_reviews)
+
+    def commit(self):
+        """
+        Write all pending changes: one write per file.
+
+        Returns:
+            dict: Number of users updated and reviews added
+        """
+        result = {'users_updated': len(self._pending_users), 'reviews_added': len(self._new_reviews)}
+        # Readers see both files change together
+        with file_locks([self.users_file, self.reviews_file], exclusive=True):
+            self._write_pending()
+
+        for user_id, user in self._pending_users.items():
+            self._committed_users[user_id] = dict(user)
+        self.reviews.extend(self._new_reviews)
+        self._pending_users.clear()
+        self._new_reviews.clear()
+        return result
+
+    def _write_pending(self):
+        users_written = False
+        try:
+            if self._pending_users:
+                self._write_users(self._pending_users)
+                users_written = True
+            if self._new_reviews:
+                # Appended: the existing reviews are not rewritten or backed up
+                add_reviews(self._new_reviews, self.reviews_file)
+        except Exception:
+            if users_written:
+                self._write_users({uid: self._committed_users[uid]
+                                   for uid in self._pending_users if uid in self._committed_users})
+            self.rollback()
+            raise
+
+    def rollback(self):
+        """Discard pending changes and restore the in-memory loads of touched users."""
+        for user in self.users:
+            user_id = user.get('User_ID')
+            if user_id in self._pending_users and user_id in self._committed_users:
+                user['Current_Load'] = self._committed_users[user_id].get('Current_Load')
+        for review in self._new_reviews:
+            self.review_ids.discard(review.get('Review_ID'))
+        self._pending_users.clear()
+        self._new_reviews.clear()
+
+    def _write_users(self, changed):
+        if _backend_table(self.users_file):
+            _storage_backend.upsert_many('Users', list(changed.values()))
+            return
+        users = [changed.get(u.get('User_ID'), u) for u in self.users]
+        write_csv(self.users_file, users)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+def generate_review_id(taken=None):
+    """
+    Build a timestamp-based Review_ID that is not already in taken.
+
+    Args:
+        taken (set, optional): Review IDs already in use
 
-def update_review(review, file_path='Reviews.csv'):
-    reviews = read_csv(file_path)
-    for i, r in enumerate(reviews):
-        if r.get('Review_ID') == review.get('Review_ID'):
-            reviews[i] = review
-            break
-    write_csv(file_path, reviews)
+    Returns:
+        str: New review ID
+    """
+    review_id = f"R{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    if taken is None or review_id not in taken:
+        return review_id
+    suffix = 1
+    while f"{review_id}-{suffix}" in taken:
+        suffix += 1
+    return f"{review_id}-{suffix}"
 
 
 
@@ -292,7 +1333,7 @@ def validate_csv_data(file_path, schema=None):
             value = row[field]
             if rules.get('type') == 'date':
                 try:
-                    datetime.strptime(value, '%Y-%m-%d')
+                    parse_date(value)
                 except ValueError:
                     errors.append({
                         'row': i,
@@ -329,7 +1370,7 @@ def validate_referential_integrity():
     """
     projects = get_all_projects()
     users = get_all_users()
-    reviews = get_all_reviews()
+    reviews = get_all_reviews(include_archived=False)
     
     errors = []
     
@@ -381,10 +1422,10 @@ def calculate_due_date(project_data, current_date=None):
     if current_date is None:
         current_date = datetime.now()
     elif isinstance(current_date, str):
-        current_date = datetime.strptime(current_date, '%Y-%m-%d')
+        current_date = parse_date(current_date)
     
-    # Parse dates
-    last_review = datetime.strptime(project_data['Last_Review_Date'], '%Y-%m-%d')
+    # Parse dates (records carry them parsed already)
+    last_review = row_date(project_data, 'Last_Review_Date')
     frequency_years = float(project_data['Review_Frequency_Years'])
     
     # Calculate months and days
@@ -404,7 +1445,7 @@ def calculate_due_date(project_data, current_date=None):
         status = 'Up to Date'
     
     # Update project data
-    result = project_data.copy()
+    result = dict(project_data)
     result['Next_Review_Date'] = next_review.strftime('%Y-%m-%d')
     result['Status'] = status
     
@@ -424,18 +1465,29 @@ def calculate_all_reviews(projects_file='Projects.csv', current_date=None):
     if current_date is None:
         current_date = datetime.now()
     elif isinstance(current_date, str):
-        current_date = datetime.strptime(current_date, '%Y-%m-%d')
+        current_date = parse_date(current_date)
     
-    # Read projects data
-    projects = read_csv(projects_file)
-    
-    # Calculate due dates and update status
-    for project in projects:
-        updated_project = calculate_due_date(project, current_date)
-        project.update(updated_project)
-    
-    # Write updated data back to CSV
-    write_csv(projects_file, projects)
+    with file_lock(projects_file, exclusive=True):
+        # Read projects data
+        projects = read_csv(projects_file)
+        
+        # Calculate due dates and update status for all rows at once; rows the
+        # batch engine cannot parse go through calculate_due_date individually
+        from due_dates import calculate_due_dates
+        next_dates, statuses = calculate_due_dates(
+            [p.get('Last_Review_Date') for p in projects],
+            [p.get('Review_Frequency_Years') for p in projects],
+            current_date,
+        )
+        for project, next_date, status in zip(projects, next_dates, statuses):
+            if next_date is None:
+                project.update(calculate_due_date(project, current_date))
+            else:
+                project['Next_Review_Date'] = next_date
+                project['Status'] = status
+        
+        # Write updated data back to CSV
+        write_csv(projects_file, projects)
     
     # Generate summary
     status_counts = {
@@ -447,54 +1499,210 @@ def calculate_all_reviews(projects_file='Projects.csv', current_date=None):
     
     return status_counts
 
+def status_matrix(start_date, end_date, step_days=7, projects_file='Projects.csv'):
+    """
+    Count projects by status on a range of dates, in total and per department.
+
+    Gives the counts of calling calculate_due_date(project, date) for every
+    project and date, but computes them in one vectorized pass over the
+    projects (see due_dates.status_counts).
+
+    Args:
+        start_date (datetime or str): First date ('YYYY-MM-DD')
+        end_date (datetime or str): Last date; included if it falls on a step
+        step_days (int): Days between two dates
+        projects_file (str): Path to the Projects CSV file
+
+    Returns:
+        dict: 'dates' ('YYYY-MM-DD' strings), 'totals' (status -> count per
+            date), 'departments' (department -> status -> count per date) and
+            'skipped' (projects without a valid Last_Review_Date or frequency)
+    """
+    import numpy as np
+    from due_dates import next_review_dates, status_counts
+
+    step_days = int(step_days)
+    if step_days < 1:
+        raise ValueError("step_days must be at least 1")
+    first, last = np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D')
+    if last < first:
+        raise ValueError("end_date is before start_date")
+    dates = np.arange(first, last + 1, step_days)
+
+    projects = read_csv(projects_file, shared=True)
+    rows, next_review = next_review_dates([p.get('Last_Review_Date') for p in projects],
+                                          [p.get('Review_Frequency_Years') for p in projects])
+    departments = np.array([projects[i].get('Department') or 'Unknown' for i in rows.tolist()], dtype=str)
+    names, groups = np.unique(departments, return_inverse=True)
+    counts = status_counts(next_review, groups.reshape(-1), len(names), dates)
+
+    statuses = ('Overdue', 'Due Soon', 'Up to Date')
+    totals = counts.sum(axis=0)
+    return {
+        'dates': np.datetime_as_string(dates, unit='D').tolist(),
+        'totals': {status: totals[:, k].tolist() for k, status in enumerate(statuses)},
+        'departments': {name: {status: counts[g, :, k].tolist() for k, status in enumerate(statuses)}
+                        for g, name in enumerate(names.tolist())},
+        'skipped': len(projects) - len(rows),
+    }
+
+def forecast_demand(start_date=None, years=1, period='week', projects_file='Projects.csv'):
+    """
+    Forecast how many reviews fall due per week or month, per department.
+
+    Args:
+        start_date (datetime or str, optional): First day of the forecast ('YYYY-MM-DD'). Defaults to today.
+        years (float): Length of the forecast in years
+        period (str): 'week' or 'month'
+        projects_file (str): Path to the Projects CSV file
+
+    Returns:
+        dict: See forecast.forecast_review_demand; reviews already overdue are
+            counted in the first period
+    """
+    from forecast import forecast_review_demand
+
+    if start_date is None:
+        start_date = datetime.now()
+    elif isinstance(start_date, str):
+        start_date = parse_date(start_date)
+    months = int(float(years) * 12)
+    if months < 1:
+        raise ValueError("The forecast must cover at least one month")
+    end_date = start_date + relativedelta(months=months) - timedelta(days=1)
+
+    projects = read_csv(projects_file, shared=True)
+    return forecast_review_demand([p.get('Last_Review_Date') for p in projects],
+                                  [p.get('Review_Frequency_Years') for p in projects],
+                                  [p.get('Department') for p in projects],
+                                  start_date.date(), end_date.date(), period)
+
+# Status transition indexes of Projects files keyed by absolute path (see transitions.py)
+_transition_indexes = {}
+
+def advance_statuses(to_date=None, projects_file='Projects.csv'):
+    """
+    Bring project statuses up to a date, touching only the projects whose status changes.
+
+    Instead of recalculating every project like calculate_all_reviews, the
+    transition index yields the projects whose Next_Review_Date has come
+    within the Due Soon window or passed since the last run. Projects without
+    a Next_Review_Date are calculated in full.
+
+    Args:
+        to_date (datetime or str, optional): Date to advance to ('YYYY-MM-DD'). Defaults to today.
+        projects_file (str): Path to the Projects CSV file
+
+    Returns:
+        dict: Date advanced to, number of projects checked and changed, the new
+            statuses, and the date of the next pending change
+    """
+    if _backend_table(projects_file):
+        raise ValueError("Statuses can only be advanced for CSV files")
+    if to_date is None:
+        to_date = datetime.now()
+    elif isinstance(to_date, str):
+        to_date = parse_date(to_date)
+    day = to_date.toordinal()
+    current_date = datetime.fromordinal(day)
+
+    create_csv_if_missing(projects_file)
+    with file_lock(projects_file, exclusive=True):
+        key = os.path.abspath(projects_file)
+        index = _transition_indexes.get(key)
+        if index is None:
+            index = _transition_indexes[key] = TransitionIndex(projects_file)
+        index.load(lambda: read_csv(projects_file, shared=True), day)
+
+        due = index.pop_due(day)
+        changed = {}
+        if due:
+            # One pass to find the due rows; no index over the whole table is
+            # needed. The cached rows are not modified, only replaced in the list.
+            rows = list(read_csv(projects_file, shared=True))
+            wanted = set(due)
+            positions = {}
+            for i, row in enumerate(rows):
+                project_id = row.get('Project_ID')
+                if project_id in wanted and project_id not in positions:
+                    positions[project_id] = i
+
+            for project_id in due:
+                if project_id not in positions:
+                    continue
+                project = rows[positions[project_id]]
+                next_review = parse_day(project.get('Next_Review_Date'))
+                if next_review is None:
+                    try:
+                        updated = calculate_due_date(project, current_date)
+                    except (KeyError, TypeError, ValueError):
+                        continue  # left out of the index until its dates are fixed
+                    next_review = parse_day(updated['Next_Review_Date'])
+                else:
+                    updated = dict(project)
+                    updated['Status'] = status_on(next_review, day)
+                index.schedule(project_id, next_review, updated['Status'])
+                if (updated['Status'], updated['Next_Review_Date']) != \
+                        (project.get('Status'), project.get('Next_Review_Date')):
+                    changed[project_id] = updated
+                    rows[positions[project_id]] = updated
+
+            if changed:
+                write_csv(projects_file, rows)
+        index.save(os.stat(projects_file))
+
+    next_day = index.next_change_day()
+    return {
+        'date': current_date.strftime('%Y-%m-%d'),
+        'checked': len(due),
+        'changed': len(changed),
+        'statuses': {project_id: p['Status'] for project_id, p in changed.items()},
+        'next_change': datetime.fromordinal(next_day).strftime('%Y-%m-%d') if next_day else None,
+    }
+
 
 
 
 # ===============================================================================
 # Reviewer Assignment
 # ===============================================================================
-def assign_reviewer(project, reviewers=None, users_file='Users.csv', reviews_file='Reviews.csv'):
+def assign_reviewer(project, reviewers=None, users_file='Users.csv', reviews_file='Reviews.csv',
+                    session=None, pool=None):
     """
     Assign a reviewer to a project based on workload balance and department.
     Returns None if no reviewers are available.
-    """
-    if reviewers is None:
-        reviewers = get_all_users(users_file)  # 🔧 FIX: Pass file path
-    
-    if not reviewers:
-        return None  # 🚨 No reviewers at all
-    
-    # Convert Current_Load to int
-    for reviewer in reviewers:
-        try:
-            reviewer['Current_Load'] = int(reviewer.get('Current_Load', 0))
-        except ValueError:
-            reviewer['Current_Load'] = 0
 
-    # Sort reviewers by load
-    reviewers_sorted = sorted(reviewers, key=lambda r: r['Current_Load'])
-    
-    # Try to select from a different department
-    project_dept = project.get('Department', '')
-    other_dept_reviewers = [r for r in reviewers_sorted if r.get('Department') != project_dept]
+    If a DataSession is given, the load update and new review are queued on it
+    instead of being written immediately. Batch callers should also pass a
+    ReviewerPool built once over the reviewers, so each pick costs O(log U).
+    """
+    if pool is None:
+        if reviewers is None:
+            reviewers = get_all_users(users_file)  # 🔧 FIX: Pass file path
+        
+        if not reviewers:
+            return None  # 🚨 No reviewers at all
+        
+        # Converts Current_Load to int and orders reviewers by load
+        pool = ReviewerPool(reviewers)
     
-    # Assign reviewer
-    if other_dept_reviewers:
-        assigned_reviewer = other_dept_reviewers[0]
-    else:
-        # ❗ Fallback: same department
-        if not reviewers_sorted:
-            return None  # 🛑 Still no one to assign
-        assigned_reviewer = reviewers_sorted[0]
+    # Least loaded reviewer from a different department,
+    # ❗ falling back to the same department
+    assigned_reviewer = pool.pick(project.get('Department', ''))
+    if assigned_reviewer is None:
+        return None  # 🛑 Still no one to assign
     
     # Update workload and persist
-    assigned_reviewer['Current_Load'] += 1
-    update_user(assigned_reviewer, users_file)  # 🔧 FIX: Pass file path
+    pool.increment(assigned_reviewer)
+    if session is not None:
+        session.update_user(assigned_reviewer)
+    else:
+        update_user(assigned_reviewer, users_file)  # 🔧 FIX: Pass file path
     
     # Build review object
     from datetime import datetime, timedelta
     review = {
-        'Review_ID': f"R{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        'Review_ID': generate_review_id(session.review_ids if session is not None else None),
         'Project_ID': project['Project_ID'],
         'Reviewer_ID': assigned_reviewer['User_ID'],
         'Scheduled_Date': (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d'),
@@ -502,7 +1710,10 @@ def assign_reviewer(project, reviewers=None, users_file='Users.csv', reviews_fil
         'Completion_Date': ''
     }
 
-    add_review(review, reviews_file)  # 🔧 FIX: Pass file path
+    if session is not None:
+        session.add_review(review)
+    else:
+        add_review(review, reviews_file)  # 🔧 FIX: Pass file path
     return review
 
 
@@ -518,43 +1729,58 @@ def assign_all_reviewers(projects_file='Projects.csv', users_file='Users.csv', r
     Returns:
         dict: Summary of assignment results including counts and assignment details
     """
-    # Read data from specified files
-    projects = read_csv(projects_file)
-    users = read_csv(users_file)
-    existing_reviews = read_csv(reviews_file)
-    
-    # Filter projects that need review (Overdue or Due Soon status)
-    projects_needing_review = [p for p in projects 
-                               if p.get('Status') in ['Overdue', 'Due Soon']]
-    
-    # Exclude projects that already have active reviews to avoid double-assignment
-    active_project_ids = {r['Project_ID'] for r in existing_reviews 
-                          if r.get('Status') in ['Scheduled', 'In Progress']}
-    
-    projects_to_assign = [p for p in projects_needing_review 
-                          if p['Project_ID'] not in active_project_ids]
-    
-    # Track assignment results
-    new_assignments = []
-    failed_assignments = []
-    
-    # Assign reviewers to each project needing assignment
-    for project in projects_to_assign:
-        try:
-            review = assign_reviewer(project, users, users_file, reviews_file)
-            if review:  # Assignment successful
-                new_assignments.append(review)
-            else:  # Assignment failed (no available reviewers)
-                failed_assignments.append({
-                    'project_id': project['Project_ID'],
-                    'reason': 'No available reviewers'
-                })
-        except Exception as e:
-            # Handle any errors during assignment
-            failed_assignments.append({
-                'project_id': project['Project_ID'],
-                'reason': f'Assignment error: {str(e)}'
-            })
+    with backup_run():
+        return _assign_all_reviewers(projects_file, users_file, reviews_file)
+
+def _assign_all_reviewers(projects_file, users_file, reviews_file):
+    # Finished reviews are not needed here; move old ones out of the hot file
+    # first. archive_reviews takes its own locks, so this runs before ours.
+    _apply_archive_policy(reviews_file)
+
+    # Hold Users and Reviews from the first read to the last write, so two
+    # runs cannot assign the same projects
+    with file_locks([users_file, reviews_file], exclusive=True):
+        # Read data from specified files
+        projects = read_csv(projects_file)
+        users = read_csv(users_file)
+        existing_reviews = read_csv(reviews_file)
+    
+        # Filter projects that need review (Overdue or Due Soon status)
+        projects_needing_review = [p for p in projects 
+                                   if p.get('Status') in ['Overdue', 'Due Soon']]
+    
+        # Exclude projects that already have active reviews to avoid double-assignment
+        active_project_ids = {r['Project_ID'] for r in existing_reviews 
+                              if r.get('Status') in ['Scheduled', 'In Progress']}
+    
+        projects_to_assign = [p for p in projects_needing_review 
+                              if p['Project_ID'] not in active_project_ids]
+    
+        # Track assignment results
+        new_assignments = []
+        failed_assignments = []
+    
+        # Assign reviewers to each project needing assignment. All changes are
+        # collected in one session and written once at the end of the run.
+        pool = ReviewerPool(users)
+        with DataSession(users_file, reviews_file, users=users, reviews=existing_reviews) as session:
+            for project in projects_to_assign:
+                try:
+                    review = assign_reviewer(project, users, users_file, reviews_file,
+                                             session=session, pool=pool)
+                    if review:  # Assignment successful
+                        new_assignments.append(review)
+                    else:  # Assignment failed (no available reviewers)
+                        failed_assignments.append({
+                            'project_id': project['Project_ID'],
+                            'reason': 'No available reviewers'
+                        })
+                except Exception as e:
+                    # Handle any errors during assignment
+                    failed_assignments.append({
+                        'project_id': project['Project_ID'],
+                        'reason': f'Assignment error: {str(e)}'
+                    })
     
     # Return comprehensive assignment summary
     return {
@@ -567,37 +1793,6 @@ def assign_all_reviewers(projects_file='Projects.csv', users_file='Users.csv', r
     }
 
 
-# Helper function to ensure proper file path handling in add_review
-def add_review(review, file_path='Reviews.csv'):
-    """
-    Add a new review to the reviews CSV file.
-    
-    Args:
-        review (dict): Review dictionary to add
-        file_path (str): Path to the reviews CSV file
-    """
-    reviews = read_csv(file_path)
-    reviews.append(review)
-    write_csv(file_path, reviews)
-
-
-# Helper function to ensure proper file path handling in update_user  
-def update_user(user, file_path='Users.csv'):
-    """
-    Update an existing user in the users CSV file.
-    
-    Args:
-        user (dict): User dictionary with updated information
-        file_path (str): Path to the users CSV file
-    """
-    users = read_csv(file_path)
-    for i, u in enumerate(users):
-        if u.get('User_ID') == user.get('User_ID'):
-            users[i] = user
-            break
-    write_csv(file_path, users)
-
-
 # Enhanced version with better error handling and logging
 def assign_reviewer_enhanced(project, reviewers=None, users_file='Users.csv', reviews_file='Reviews.csv', verbose=False):
     """
@@ -642,22 +1837,17 @@ def assign_reviewer_enhanced(project, reviewers=None, users_file='Users.csv', re
         for r in working_reviewers:
             print(f"      {r['Name']} ({r['Department']}): {r['Current_Load']} reviews")
     
-    # Sort by workload
-    reviewers_sorted = sorted(working_reviewers, key=lambda r: r['Current_Load'])
-    
     # Department-based assignment logic
     project_dept = project.get('Department', '')
-    other_dept_reviewers = [r for r in reviewers_sorted if r.get('Department') != project_dept]
+    assigned_reviewer = ReviewerPool(working_reviewers).pick(project_dept)
     
-    if other_dept_reviewers:
-        assigned_reviewer = other_dept_reviewers[0]
+    if assigned_reviewer is None:
+        if verbose:
+            print(f"   ❌ No reviewers available after sorting")
+        return None
+    if assigned_reviewer.get('Department') != project_dept:
         assignment_type = "cross-department"
     else:
-        if not reviewers_sorted:
-            if verbose:
-                print(f"   ❌ No reviewers available after sorting")
-            return None
-        assigned_reviewer = reviewers_sorted[0]
         assignment_type = "same-department"
     
     if verbose:
@@ -704,10 +1894,116 @@ def assign_reviewer_enhanced(project, reviewers=None, users_file='Users.csv', re
 # Notification System
 # ===============================================================================
 
+def _notification_content(project, review, reviewer):
+    """Build the subject and body of a review notification."""
+    # Set subject with urgency prefix if overdue
+    subject = project['Project_Name'] + ' - Review Required'
+    if project.get('Status') == 'Overdue':
+        subject = '[URGENT] ' + subject
+    
+    # Create email body
+    body = f"""
+                Dear {reviewer['Name']},
+                
+                You have been assigned to review the following project:
+                
+                Project: {project['Project_Name']}
+                Project ID: {project['Project_ID']}
+                Scheduled Date: {review['Scheduled_Date']}
+                Status: {project.get('Status', '')}
+                
+                """
+    
+    if project.get('Status') == 'Overdue':
+        body += "This review is OVERDUE and requires immediate attention.\n"
+    elif project.get('Status') == 'Due Soon':
+        body += "This review is due soon. Please prioritize accordingly.\n"
+    
+    body += """
+                Please complete your review by the scheduled date.
+                
+                Thank you,
+                Project Review Scheduler
+                """
+    return subject, body
+
+def build_notification_plan(status_filter=None, projects_file='Projects.csv',
+                            reviews_file='Reviews.csv', users_file='Users.csv'):
+    """
+    Work out which notifications to send, without sending anything.
+
+    Projects, Reviews and Users are each loaded once. Active reviews are
+    hash-joined to their projects and reviewers, so the cost is linear in the
+    size of the three tables. Due Soon projects are the Due Soon rows of the
+    next 31 days' slice of the Next_Review_Date range index; Overdue projects
+    are every row marked Overdue (from the Status index), in date order.
+
+    Args:
+        status_filter (str, optional): Filter projects by status ('Overdue', 'Due Soon')
+        projects_file (str): Path to the Projects CSV file
+        reviews_file (str): Path to the Reviews CSV file
+        users_file (str): Path to the Users CSV file
+
+    Returns:
+        list: Message specs in project order (Next_Review_Date order for an
+            Overdue or Due Soon filter). Each has 'project_id' and 'review_id',
+            plus 'reviewer_email', 'subject' and 'body' when the message can be sent,
+            or a failure 'reason' when it cannot.
+    """
+    # Read necessary data
+    projects = read_csv(projects_file, shared=True)
+    reviews = read_csv(reviews_file, shared=True)
+    users = read_csv(users_file, shared=True)
+    
+    # Filter projects if needed
+    if status_filter == 'Due Soon':
+        start, end = _status_window(status_filter, datetime.now())
+        due = table_index(projects_file, 'Projects', projects).range('Next_Review_Date', start, end)
+        projects = [p for p in due if p.get('Status') == status_filter]
+    elif status_filter == 'Overdue':
+        index = table_index(projects_file, 'Projects', projects)
+        start, end = _status_window(status_filter, datetime.now())
+        projects = _with_status_in_date_order(status_filter, index.range('Next_Review_Date', start, end),
+                                              index.find('Status', status_filter), start, end)
+    elif status_filter:
+        projects = [p for p in projects if p.get('Status') == status_filter]
+    
+    # Hash tables for the joins: active reviews by project, users by ID
+    active_reviews = {}
+    for review in reviews:
+        if review['Status'] in ['Scheduled', 'In Progress']:
+            active_reviews.setdefault(review.get('Project_ID'), []).append(review)
+    users_by_id = {}
+    for user in users:
+        users_by_id.setdefault(user.get('User_ID'), user)
+    
+    plan = []
+    for project in projects:
+        for review in active_reviews.get(project['Project_ID'], []):
+            spec = {'project_id': project['Project_ID'], 'review_id': review['Review_ID']}
+            reviewer = users_by_id.get(review['Reviewer_ID'])
+            
+            if not reviewer or not reviewer.get('Email'):
+                spec['reason'] = 'Missing reviewer or email'
+            else:
+                try:
+                    spec['subject'], spec['body'] = _notification_content(project, review, reviewer)
+                    spec['reviewer_email'] = reviewer['Email']
+                except Exception as e:
+                    spec['reason'] = str(e)
+            plan.append(spec)
+    
+    return plan
+
 def send_notifications(status_filter=None, smtp_server='localhost', smtp_port=587, 
-                      smtp_user=None, smtp_password=None, sender_email='scheduler@example.com'):
+                      smtp_user=None, smtp_password=None, sender_email='scheduler@example.com',
+                      use_tls=True, messages_per_connection=100, transport=None, plan=None,
+                      pool_size=2):
     """
     Send email notifications to reviewers for their assigned reviews.
+
+    With a transport, up to its pool_size messages are sent at the same time,
+    each over its own pooled connection. The log keeps the order of the plan.
     
     Args:
         status_filter (str, optional): Filter projects by status ('Overdue', 'Due Soon')
@@ -716,113 +2012,79 @@ def send_notifications(status_filter=None, smtp_server='localhost', smtp_port=58
         smtp_user (str, optional): SMTP username
         smtp_password (str, optional): SMTP password
         sender_email (str): Sender email address
+        use_tls (bool): Run STARTTLS on each new SMTP connection
+        messages_per_connection (int): Messages sent over one SMTP connection before reconnecting
+        transport (PooledSMTPTransport, optional): Transport to send with. Created from the
+            SMTP settings if omitted and smtp_server is not 'localhost'.
+        plan (list, optional): Message specs from build_notification_plan. Built here if omitted.
+        pool_size (int): SMTP connections used in parallel by the transport created here
         
     Returns:
         dict: Summary of notification results
     """
-    # Read necessary data
-    projects = get_all_projects()
-    
-    # Filter projects if needed
-    if status_filter:
-        projects = [p for p in projects if p.get('Status') == status_filter]
-    
-    sent_count = 0
-    failed_count = 0
-    notification_log = []
-    
-    # Process each project
-    for project in projects:
-        # Get associated reviews
-        reviews = get_reviews_by_project(project['Project_ID'])
-        
-        # Filter reviews that are scheduled or in progress
-        active_reviews = [r for r in reviews if r['Status'] in ['Scheduled', 'In Progress']]
+    if plan is None:
+        plan = build_notification_plan(status_filter)
+    
+    # One pool of SMTP connections is shared by all messages
+    owns_transport = transport is None and smtp_server != 'localhost'
+    if owns_transport:
+        transport = PooledSMTPTransport(smtp_server, smtp_port, smtp_user, smtp_password,
+                                        use_tls=use_tls, pool_size=pool_size,
+                                        messages_per_connection=messages_per_connection)
+    
+    def notify(spec):
+        if 'reason' in spec:
+            return {
+                'project_id': spec['project_id'],
+                'review_id': spec['review_id'],
+                'status': 'Failed',
+                'reason': spec['reason']
+            }
         
-        for review in active_reviews:
-            # Get reviewer information
-            reviewer = get_reviewer(review['Reviewer_ID'])
+        try:
+            msg = EmailMessage()
+            msg['Subject'] = spec['subject']
+            msg['From'] = sender_email
+            msg['To'] = spec['reviewer_email']
+            msg.set_content(spec['body'])
             
-            if not reviewer or not reviewer.get('Email'):
-                notification_log.append({
-                    'project_id': project['Project_ID'],
-                    'review_id': review['Review_ID'],
-                    'status': 'Failed',
-                    'reason': 'Missing reviewer or email'
-                })
-                failed_count += 1
-                continue
+            # In a production environment, we would send the email here
+            # For testing/development, we'll simulate this
+            if transport is None:
+                # Simulate email sending for testing
+                print(f"Email would be sent to {spec['reviewer_email']}")
+            else:
+                # Actually send the email over a pooled connection
+                transport.send(msg)
             
-            try:
-                # Prepare email content
-                msg = EmailMessage()
-                
-                # Set subject with urgency prefix if overdue
-                subject = project['Project_Name'] + ' - Review Required'
-                if project.get('Status') == 'Overdue':
-                    subject = '[URGENT] ' + subject
-                
-                msg['Subject'] = subject
-                msg['From'] = sender_email
-                msg['To'] = reviewer['Email']
-                
-                # Create email body
-                body = f"""
-                Dear {reviewer['Name']},
-                
-                You have been assigned to review the following project:
-                
-                Project: {project['Project_Name']}
-                Project ID: {project['Project_ID']}
-                Scheduled Date: {review['Scheduled_Date']}
-                Status: {project.get('Status', '')}
-                
-                """
-                
-                if project.get('Status') == 'Overdue':
-                    body += "This review is OVERDUE and requires immediate attention.\n"
-                elif project.get('Status') == 'Due Soon':
-                    body += "This review is due soon. Please prioritize accordingly.\n"
-                
-                body += """
-                Please complete your review by the scheduled date.
-                
-                Thank you,
-                Project Review Scheduler
-                """
-                
-                msg.set_content(body)
-                
-                # In a production environment, we would send the email here
-                # For testing/development, we'll simulate this
-                if smtp_server == 'localhost':
-                    # Simulate email sending for testing
-                    print(f"Email would be sent to {reviewer['Email']}")
-                else:
-                    # Actually send the email
-                    with smtplib.SMTP(smtp_server, smtp_port) as server:
-                        server.starttls()
-                        if smtp_user and smtp_password:
-                            server.login(smtp_user, smtp_password)
-                        server.send_message(msg)
-                
-                notification_log.append({
-                    'project_id': project['Project_ID'],
-                    'review_id': review['Review_ID'],
-                    'reviewer_email': reviewer['Email'],
-                    'status': 'Sent',
-                    'subject': subject
-                })
-                sent_count += 1
-                
-            except Exception as e:
-                notification_log.append({
-                    'project_id': project['Project_ID'],
-                    'review_id': review['Review_ID'],
-                    'status': 'Failed',
-                    'reason': str(e)
-                })
-                failed_count += 1
+            return {
+                'project_id': spec['project_id'],
+                'review_id': spec['review_id'],
+                'reviewer_email': spec['reviewer_email'],
+                'status': 'Sent',
+                'subject': spec['subject']
+            }
+            
+        except Exception as e:
+            return {
+                'project_id': spec['project_id'],
+                'review_id': spec['review_id'],
+                'status': 'Failed',
+                'reason': str(e)
+            }
+    
+    try:
+        if transport is not None and transport.pool_size > 1:
+            with ThreadPoolExecutor(max_workers=transport.pool_size) as executor:
+                notification_log = list(executor.map(notify, plan))
+        else:
+            notification_log = [notify(spec) for spec in plan]
+    finally:
+        if owns_transport:
+            transport.close()
+    
+    sent_count = sum(1 for entry in notification_log if entry['status'] == 'Sent')
+    failed_count = len(notification_log) - sent_count
     
     return {
         'sent': sent_count,
@@ -838,7 +2100,7 @@ def send_notifications(status_filter=None, smtp_server='localhost', smtp_port=58
 # Reporting Module
 # ===============================================================================
 
-def generate_monthly_schedule(month, year, output_file=None):
+def generate_monthly_schedule(month, year, output_file=None, snapshot=None):
     """
     Generate a monthly schedule of upcoming reviews.
     
@@ -846,12 +2108,34 @@ def generate_monthly_schedule(month, year, output_file=None):
         month (str): Month to generate schedule for (format: MM)
         year (str): Year to generate schedule for (format: YYYY)
         output_file (str, optional): Path to output file. If None, uses default naming.
+        snapshot (ReportSnapshot, optional): Preloaded data. Read from the CSV files if omitted.
         
     Returns:
         dict: Report generation results
     """
     # Read data
-    reviews = get_all_reviews()
+    if snapshot is not None:
+        reviews = snapshot.reviews
+        find_project = snapshot.get_project
+        find_reviewer = snapshot.get_reviewer
+    else:
+        partitions = _review_partitions('Reviews.csv')
+        if partitions is not None:
+            # Only the requested month's partition is read
+            month_path = partitions.path_for(f"{year}-{month}")
+            reviews = read_csv(month_path, shared=True) if os.path.exists(month_path) else []
+        elif _should_stream('Reviews.csv'):
+            # Only this month's active reviews are kept in memory
+            prefix = f"{year}-{month}-"
+            reviews = iter_csv('Reviews.csv', where=lambda r: (r['Status'] in ACTIVE_REVIEW_STATUSES
+                                                               and r['Scheduled_Date'].startswith(prefix)))
+        else:
+            reviews = get_all_reviews(include_archived=False)
+        projects_by_id = {}
+        for p in get_all_projects():
+            projects_by_id.setdefault(p['Project_ID'], p)
+        find_project = projects_by_id.get
+        find_reviewer = get_reviewer
     
     # Build full review data with project and reviewer info
     enriched_reviews = []
@@ -861,13 +2145,13 @@ def generate_monthly_schedule(month, year, output_file=None):
             continue
         
         # Check if the review is in the specified month/year
-        review_date = datetime.strptime(review['Scheduled_Date'], '%Y-%m-%d')
+        review_date = row_date(review, 'Scheduled_Date')
         if review_date.strftime('%m') != month or review_date.strftime('%Y') != year:
             continue
         
         # Get project and reviewer info
-        project = next((p for p in get_all_projects() if p['Project_ID'] == review['Project_ID']), {})
-        reviewer = get_reviewer(review['Reviewer_ID'])
+        project = find_project(review['Project_ID']) or {}
+        reviewer = find_reviewer(review['Reviewer_ID'])
         
         # Create enriched review record
         enriched_review = {
@@ -905,27 +2189,40 @@ def generate_monthly_schedule(month, year, output_file=None):
         'review_count': len(enriched_reviews)
     }
 
-def generate_workload_report(output_file=None):
+def generate_workload_report(output_file=None, snapshot=None):
     """
     Generate a report showing workload distribution among reviewers.
     
     Args:
         output_file (str, optional): Path to output file. If None, uses default naming.
+        snapshot (ReportSnapshot, optional): Preloaded data. Read from the CSV files if omitted.
         
     Returns:
         dict: Report generation results
     """
     # Read data
-    users = get_all_users()
-    reviews = get_all_reviews()
+    if snapshot is not None:
+        users = snapshot.users
+        reviews_for_reviewer = snapshot.reviews_for_reviewer
+    else:
+        users = get_all_users()
+        if _should_stream('Reviews.csv'):
+            # One pass that keeps only the active reviews
+            active_by_reviewer = {}
+            for r in iter_csv('Reviews.csv', where={'Status': ACTIVE_REVIEW_STATUSES},
+                              columns=['Review_ID', 'Reviewer_ID', 'Status']):
+                active_by_reviewer.setdefault(r['Reviewer_ID'], []).append(r)
+            reviews_for_reviewer = lambda user_id: active_by_reviewer.get(user_id, [])
+        else:
+            reviews_index = build_index('Reviews', get_all_reviews(include_archived=False))
+            reviews_for_reviewer = lambda user_id: reviews_index.find('Reviewer_ID', user_id)
     
     # Count active reviews per reviewer
     workloads = {}
     for user in users:
         user_id = user['User_ID']
-        active_reviews = [r for r in reviews 
-                          if r['Reviewer_ID'] == user_id and 
-                          r['Status'] in ['Scheduled', 'In Progress']]
+        active_reviews = [r for r in reviews_for_reviewer(user_id)
+                          if r['Status'] in ['Scheduled', 'In Progress']]
         workloads[user_id] = {
             'User_ID': user_id,
             'Name': user['Name'],
@@ -948,6 +2245,7 @@ def generate_workload_report(output_file=None):
     write_csv(output_file, sorted_workloads, fieldnames)
     
     # Generate visualization
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))
     plt.bar([w['Name'] for w in sorted_workloads], [w['Current_Load'] for w in sorted_workloads])
     plt.xlabel('Reviewer')
@@ -967,36 +2265,95 @@ def generate_workload_report(output_file=None):
         'total_reviews': sum(w['Current_Load'] for w in sorted_workloads)
     }
 
-def generate_overdue_alerts(output_file=None):
+def _status_window(status, today):
+    """
+    Next_Review_Date range (inclusive, 'YYYY-MM-DD') of the projects that have a status on a day.
+
+    calculate_due_date compares with the current time, so a project due today
+    is already Overdue and one due 31 days from now still Due Soon. advance
+    compares dates only and calls a project due today Due Soon, so both
+    windows include today.
+
+    Args:
+        status (str): 'Overdue' or 'Due Soon'
+        today (datetime): The day
+
+    Returns:
+        tuple: (start, end), None where the range is open
+    """
+    if status == 'Overdue':
+        return None, today.strftime('%Y-%m-%d')
+    return today.strftime('%Y-%m-%d'), (today + timedelta(days=31)).strftime('%Y-%m-%d')
+
+def _with_status_in_date_order(status, due, marked, start, end):
+    """
+    Projects with a status, ordered by Next_Review_Date.
+
+    Args:
+        status (str): Status to select
+        due (list): Projects due from start to end, in date order (from the range index)
+        marked (list): All projects with that status
+        start, end (str): The _status_window of the status
+
+    Returns:
+        list: The projects of due with the status, preceded by those without a
+            date and followed by those dated outside the window (rows whose
+            status does not match their date yet)
+    """
+    undated, outside = [], []
+    for project in marked:
+        next_review = (project.get('Next_Review_Date') or '')[:10]
+        if not next_review:
+            undated.append(project)
+        elif (start is not None and next_review < start) or (end is not None and next_review > end):
+            outside.append(project)
+    outside.sort(key=lambda p: p['Next_Review_Date'])
+    return undated + [p for p in due if p.get('Status') == status] + outside
+
+def generate_overdue_alerts(output_file=None, snapshot=None):
     """
     Generate alerts for overdue reviews.
     
     Args:
         output_file (str, optional): Path to output file. If None, uses default naming.
+        snapshot (ReportSnapshot, optional): Preloaded data. Read from the CSV files if omitted.
         
     Returns:
         dict: Report generation results
     """
-    # Read data
-    projects = get_all_projects()
-    
-    # Filter overdue projects
-    overdue_projects = [p for p in projects if p.get('Status') == 'Overdue']
-    
-    # Sort by next review date (oldest first)
-    overdue_projects.sort(key=lambda p: p.get('Next_Review_Date', ''))
+    # Read data. Candidates come from the Next_Review_Date range index, in date order
+    start, end = _status_window('Overdue', datetime.now())
+    if snapshot is not None:
+        due = snapshot.projects_due_between(start, end)
+        marked = snapshot.projects_with_status('Overdue')
+        find_reviews = snapshot.reviews_for_project
+        find_reviewer = snapshot.get_reviewer
+    else:
+        due = projects_due_between(start, end)
+        marked = get_projects_by_status('Overdue')
+        find_reviews = get_reviews_by_project
+        find_reviewer = get_reviewer
+        if _should_stream('Reviews.csv'):
+            # One pass for all overdue projects instead of one scan per project
+            overdue_ids = {p['Project_ID'] for p in marked}
+            active_by_project = {}
+            for r in iter_csv('Reviews.csv', where={'Status': ACTIVE_REVIEW_STATUSES}):
+                if r['Project_ID'] in overdue_ids:
+                    active_by_project.setdefault(r['Project_ID'], []).append(r)
+            find_reviews = lambda project_id: active_by_project.get(project_id, [])
+    overdue_projects = _with_status_in_date_order('Overdue', due, marked, start, end)
     
     # Enrich with reviewer information
     enriched_overdue = []
     for project in overdue_projects:
-        reviews = get_reviews_by_project(project['Project_ID'])
+        reviews = find_reviews(project['Project_ID'])
         active_reviews = [r for r in reviews if r['Status'] in ['Scheduled', 'In Progress']]
         
         if active_reviews:
             review = active_reviews[0]  # Take the first active review
-            reviewer = get_reviewer(review['Reviewer_ID'])
+            reviewer = find_reviewer(review['Reviewer_ID'])
             reviewer_name = reviewer.get('Name', 'Unknown') if reviewer else 'Unknown'
-            next_review = datetime.strptime(project['Next_Review_Date'], '%Y-%m-%d')
+            next_review = row_date(project, 'Next_Review_Date')
             days_overdue = (datetime.now() - next_review).days
 
         else:
@@ -1030,10 +2387,36 @@ def generate_overdue_alerts(output_file=None):
         'projects': [p['Project_ID'] for p in enriched_overdue]
     }
 
-def generate_all_reports():
+def load_report_snapshot(projects_file='Projects.csv', users_file='Users.csv', reviews_file='Reviews.csv',
+                         include_archived=True):
+    """
+    Load Projects, Users and Reviews once into a read-only ReportSnapshot.
+
+    Args:
+        projects_file (str): Path to the Projects CSV file
+        users_file (str): Path to the Users CSV file
+        reviews_file (str): Path to the Reviews CSV file
+        include_archived (bool): Also load the archived reviews
+
+    Returns:
+        ReportSnapshot: Snapshot with prebuilt indexes
+    """
+    with file_locks([projects_file, users_file, reviews_file]):
+        reviews = read_csv(reviews_file, shared=True)
+        if include_archived:
+            reviews = _with_archived(reviews_file, reviews)
+        return ReportSnapshot(read_csv(projects_file, shared=True),
+                              read_csv(users_file, shared=True),
+                              reviews)
+
+def generate_all_reports(snapshot=None):
     """
     Generate all standard reports.
     
+    Args:
+        snapshot (ReportSnapshot, optional): Preloaded data shared by all reports.
+            Loaded once from the CSV files if omitted.
+    
     Returns:
         dict: Summary of all report generation results
     """
@@ -1042,10 +2425,14 @@ def generate_all_reports():
     current_month = current_date.strftime('%m')
     current_year = current_date.strftime('%Y')
     
+    if snapshot is None:
+        # The standard reports only look at active reviews
+        snapshot = load_report_snapshot(include_archived=False)
+    
     # Generate reports
-    monthly_result = generate_monthly_schedule(current_month, current_year)
-    workload_result = generate_workload_report()
-    overdue_result = generate_overdue_alerts()
+    monthly_result = generate_monthly_schedule(current_month, current_year, snapshot=snapshot)
+    workload_result = generate_workload_report(snapshot=snapshot)
+    overdue_result = generate_overdue_alerts(snapshot=snapshot)
     
     return {
         'monthly_schedule': monthly_result,
@@ -1137,30 +2524,155 @@ def execute_command(args):
     """
     Execute a command based on parsed arguments.
 
+    A command is one backup run: each file it writes is backed up once.
+
     Args:
         args (list): List of command line arguments
 
     Returns:
         dict: Command execution results
     """
+    with backup_run():
+        return _execute_command(args)
+
+def _execute_command(args):
     parsed_args = parse_args(args)
     print(f"DEBUG: parsed_args = {parsed_args}")
     command = parsed_args.get('command')
     print("DEBUG: command =", command)  
 
+    # Optional SQLite storage for every command: --db scheduler.db. The backend
+    # only serves this command; the previous one is active again afterwards.
+    if parsed_args.get('db') and command != 'migrate_db':
+        backend = SQLiteBackend(parsed_args['db'])
+        previous = set_storage_backend(backend)
+        try:
+            return _run_command(parsed_args, command)
+        finally:
+            set_storage_backend(previous)
+            backend.close()
+    return _run_command(parsed_args, command)
+
+def _run_command(parsed_args, command):
     if command == 'help':
         print("Project Review Scheduler - Command Line Interface\n")
         print("Available commands:")
         print("  calculate_reviews [--csv PROJECTS_FILE]")
         print("      Calculate review due dates for all projects")
+        print("  due [--days DAYS] [--department DEPARTMENT] [--projects PROJECTS_FILE]")
+        print("      List projects with a review due in the next DAYS days (default 30)")
+        print("  status_matrix --from DATE --to DATE [--step DAYS] [--projects PROJECTS_FILE] [--output FILE]")
+        print("      Count projects by status and department on every DAYS-th date (default 7)")
+        print("  forecast [--from DATE] [--years YEARS] [--period week|month] [--projects PROJECTS_FILE] [--output FILE]")
+        print("      Forecast the number of reviews due per period and department (default: 1 year by week)")
+        print("  advance [--to DATE] [--projects PROJECTS_FILE]")
+        print("      Update only the project statuses that change by DATE (default today)")
         print("  assign_reviewers [--projects PROJECTS_FILE] [--users USERS_FILE] [--reviews REVIEWS_FILE]")
         print("      Assign reviewers to projects needing review")
-        print("  send_notifications [--status STATUS] [--smtp-server SERVER] [--smtp-port PORT]")
-        print("      Send email notifications to reviewers")
+        print("  send_notifications [--status STATUS] [--smtp-server SERVER] [--smtp-port PORT] [--pool-size N]")
+        print("      Send email notifications to reviewers over up to N SMTP connections at once (default 2)")
         print("  generate_reports [--type REPORT_TYPE] [--month MONTH] [--year YEAR] [--output OUTPUT_FILE]")
         print("      Generate reports. REPORT_TYPE can be 'monthly', 'workload', 'overdue', or 'all'")
+        print("  migrate_db --db DB_FILE [--projects PROJECTS_FILE] [--users USERS_FILE] [--reviews REVIEWS_FILE]")
+        print("      Copy the CSV files into a SQLite database")
+        print("  archive [--reviews REVIEWS_FILE] [--days DAYS]")
+        print("      Move Completed and Missed reviews older than DAYS (default 90) to the compressed archive")
+        print("  partition_reviews [--reviews REVIEWS_FILE]")
+        print("      Move the reviews into one CSV file per month (reviews/YYYY-MM.csv)")
+        print("  snapshot [--projects PROJECTS_FILE] [--users USERS_FILE] [--reviews REVIEWS_FILE]")
+        print("      Write columnar snapshots of the CSV files for fast loading")
+        print("  restore [--as-of TIMESTAMP] [--file FILE]")
+        print("      Restore the CSV files (or one FILE) from the newest backup taken at or before TIMESTAMP")
+        print("      (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS; a date alone means the end of that day)")
+        print("\nAny command accepts --db DB_FILE to use a SQLite database instead of the CSV files")
         return {'success': True, 'command': 'help'}
 
+    elif command == 'migrate_db':
+        db_file = parsed_args.get('db', 'scheduler.db')
+        backend = SQLiteBackend(db_file)
+        try:
+            result = migrate_csv_to_backend(
+                backend,
+                parsed_args.get('projects', 'Projects.csv'),
+                parsed_args.get('users', 'Users.csv'),
+                parsed_args.get('reviews', 'Reviews.csv'),
+            )
+        finally:
+            backend.close()
+
+        print(f"Migrated CSV data into {db_file}")
+        for table, count in result.items():
+            print(f"{table}: {count} rows")
+
+        return {'success': True, 'command': 'migrate_db', 'result': result}
+
+    elif command == 'archive':
+        reviews_file = parsed_args.get('reviews', 'Reviews.csv')
+        days = parsed_args.get('days', _archive_after_days if _archive_after_days is not None else 90)
+        try:
+            days = int(days)
+        except (TypeError, ValueError):
+            print(f"Error: invalid --days value: {days}")
+            return {'success': False, 'command': 'archive', 'error': f"invalid --days value: {days}"}
+
+        archived = archive_reviews(reviews_file, days)
+
+        print(f"Archived {archived} reviews finished more than {days} days ago to {archive_path_for(reviews_file)}")
+
+        return {'success': True, 'command': 'archive', 'result': {'archived': archived, 'days': days}}
+
+    elif command == 'partition_reviews':
+        reviews_file = parsed_args.get('reviews', 'Reviews.csv')
+        if not os.path.exists(reviews_file):
+            print(f"Error: {reviews_file} not found")
+            return {'success': False, 'command': 'partition_reviews', 'error': f"{reviews_file} not found"}
+
+        result = partition_reviews(reviews_file)
+
+        print(f"Reviews partitioned by month into {ReviewPartitions(reviews_file).directory}")
+        for month, count in sorted(result.items()):
+            print(f"{month}: {count} reviews")
+
+        return {'success': True, 'command': 'partition_reviews', 'result': result}
+
+    elif command == 'snapshot':
+        result = write_snapshots([
+            parsed_args.get('projects', 'Projects.csv'),
+            parsed_args.get('users', 'Users.csv'),
+            parsed_args.get('reviews', 'Reviews.csv'),
+        ])
+
+        for file_path, snapshot_path in result.items():
+            if snapshot_path:
+                print(f"Snapshot of {file_path} written to {snapshot_path}")
+            else:
+                print(f"{file_path} not found, no snapshot written")
+
+        return {'success': True, 'command': 'snapshot', 'result': result}
+
+    elif command == 'restore':
+        as_of = parsed_args.get('as-of')
+        if as_of:
+            try:
+                timestamp = datetime.fromisoformat(as_of)
+            except ValueError:
+                print(f"Error: Invalid timestamp '{as_of}'")
+                return {'success': False, 'command': 'restore', 'error': f"Invalid timestamp '{as_of}'"}
+            if len(as_of) == 10:
+                timestamp += timedelta(days=1, microseconds=-1)
+            as_of = timestamp
+
+        files = [parsed_args['file']] if parsed_args.get('file') else ['Projects.csv', 'Users.csv', 'Reviews.csv']
+        result = restore_backups(files, as_of)
+
+        for file_path, backup_path in result.items():
+            if backup_path:
+                print(f"Restored {file_path} from {backup_path}")
+            else:
+                print(f"No backup of {file_path} found")
+
+        return {'success': all(result.values()), 'command': 'restore', 'result': result}
+
     elif command == 'calculate_reviews':
         csv_file = parsed_args.get('csv_file', 'Projects.csv')
 
@@ -1174,6 +2686,101 @@ def execute_command(args):
 
         return {'success': True, 'command': 'calculate_reviews', 'result': result}
 
+    elif command == 'due':
+        try:
+            days = int(parsed_args.get('days', 30))
+        except (TypeError, ValueError):
+            print(f"Error: invalid --days value: {parsed_args.get('days')}")
+            return {'success': False, 'command': 'due', 'error': "invalid --days value"}
+        department = parsed_args.get('department')
+        today = datetime.now()
+        projects = projects_due_between(today.strftime('%Y-%m-%d'),
+                                        (today + timedelta(days=days)).strftime('%Y-%m-%d'),
+                                        department if isinstance(department, str) else None,
+                                        parsed_args.get('projects', 'Projects.csv'))
+
+        print(f"{len(projects)} projects due in the next {days} days")
+        for project in projects:
+            print(f"  {project.get('Next_Review_Date')}  {project.get('Project_ID')}  "
+                  f"{project.get('Project_Name', '')} ({project.get('Department', 'Unknown')})")
+
+        return {'success': True, 'command': 'due', 'result': [p.get('Project_ID') for p in projects]}
+
+    elif command == 'status_matrix':
+        start_date, end_date = parsed_args.get('from'), parsed_args.get('to')
+        if not isinstance(start_date, str) or not isinstance(end_date, str):
+            print("Error: status_matrix needs --from DATE and --to DATE")
+            return {'success': False, 'command': 'status_matrix', 'error': "--from and --to are required"}
+        try:
+            result = status_matrix(start_date, end_date, parsed_args.get('step', 7),
+                                   parsed_args.get('projects', 'Projects.csv'))
+        except ValueError as e:
+            print(f"Error: {e}")
+            return {'success': False, 'command': 'status_matrix', 'error': str(e)}
+
+        print(f"{'Date':<12}{'Overdue':>10}{'Due Soon':>10}{'Up to Date':>12}")
+        totals = result['totals']
+        for i, day in enumerate(result['dates']):
+            print(f"{day:<12}{totals['Overdue'][i]:>10}{totals['Due Soon'][i]:>10}{totals['Up to Date'][i]:>12}")
+
+        output_file = parsed_args.get('output')
+        if isinstance(output_file, str):
+            rows = [{'Date': day, 'Department': department,
+                     **{status: counts[status][i] for status in counts}}
+                    for i, day in enumerate(result['dates'])
+                    for department, counts in result['departments'].items()]
+            write_csv(output_file, rows, ['Date', 'Department', 'Overdue', 'Due Soon', 'Up to Date'])
+            print(f"Per-department counts written to {output_file}")
+
+        return {'success': True, 'command': 'status_matrix', 'result': result}
+
+    elif command == 'forecast':
+        start_date = parsed_args.get('from')
+        try:
+            result = forecast_demand(start_date if isinstance(start_date, str) else None,
+                                     parsed_args.get('years', 1), parsed_args.get('period', 'week'),
+                                     parsed_args.get('projects', 'Projects.csv'))
+        except ValueError as e:
+            print(f"Error: {e}")
+            return {'success': False, 'command': 'forecast', 'error': str(e)}
+
+        departments = sorted(result['departments'])
+        print(f"Reviews due per {result['period']}")
+        print(f"{'Period':<12}" + ''.join(f"{d[:12]:>14}" for d in departments) + f"{'Total':>10}")
+        for i, period_start in enumerate(result['periods']):
+            print(f"{period_start:<12}" + ''.join(f"{result['departments'][d][i]:>14}" for d in departments)
+                  + f"{result['totals'][i]:>10}")
+
+        output_file = parsed_args.get('output')
+        if isinstance(output_file, str):
+            rows = [{'Period_Start': period_start,
+                     **{d: result['departments'][d][i] for d in departments},
+                     'Total': result['totals'][i]}
+                    for i, period_start in enumerate(result['periods'])]
+            write_csv(output_file, rows, ['Period_Start'] + departments + ['Total'])
+            print(f"Forecast written to {output_file}")
+
+        return {'success': True, 'command': 'forecast', 'result': result}
+
+    elif command == 'advance':
+        projects_file = parsed_args.get('projects', 'Projects.csv')
+        to_date = parsed_args.get('to')
+        try:
+            result = advance_statuses(to_date if isinstance(to_date, str) else None, projects_file)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return {'success': False, 'command': 'advance', 'error': str(e)}
+
+        print(f"Statuses advanced to {result['date']}")
+        print(f"Projects checked: {result['checked']}")
+        print(f"Statuses changed: {result['changed']}")
+        for project_id, status in result['statuses'].items():
+            print(f"  {project_id}: {status}")
+        if result['next_change']:
+            print(f"Next status change: {result['next_change']}")
+
+        return {'success': True, 'command': 'advance', 'result': result}
+
     elif command == 'assign_reviewers':
         projects_file = parsed_args.get('projects_file', 'Projects.csv')
         users_file = parsed_args.get('users_file', 'Users.csv')
@@ -1192,8 +2799,13 @@ def execute_command(args):
         status = parsed_args.get('status')
         smtp_server = parsed_args.get('smtp_server', 'localhost')
         smtp_port = parsed_args.get('smtp_port', 587)
+        try:
+            pool_size = int(parsed_args.get('pool-size', 2))
+        except (TypeError, ValueError):
+            print(f"Error: invalid --pool-size value: {parsed_args.get('pool-size')}")
+            return {'success': False, 'command': 'send_notifications', 'error': "invalid --pool-size value"}
 
-        result = send_notifications(status, smtp_server, smtp_port)
+        result = send_notifications(status, smtp_server, smtp_port, pool_size=pool_size)
 
         print(f"Notification process completed")
         print(f"Total notifications: {result['total']}")
@@ -0,0 +1,86 @@
+"""
+Project Review Scheduler - Sidecar Index Files
+
+Indexes derived from a data file, such as the row offsets of Reviews.csv or
+the status transitions of Projects.csv, are saved next to it in hidden sidecar
+files (.Reviews.csv.offsets), so the next process can load them instead of
+scanning the file again.
+
+A sidecar starts with the modification time and size of the version of the
+data file it was built from, and is only used while both still match. The
+index itself is stored as JSON, never as a pickle: the data directory is
+shared, and unpickling a file from it would run any code written into it.
+"""
+
+import json
+import os
+import struct
+
+# (source mtime_ns, source size), followed by the JSON payload
+_HEADER = struct.Struct('<qq')
+
+
+def sidecar_path_for(file_path, suffix):
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, f".{name}.{suffix}")
+
+
+def version_of(stat):
+    """The (mtime_ns, size) pair a sidecar is tied to, from an os.stat result."""
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_sidecar(path, version):
+    """
+    Read a sidecar saved for a version of its data file.
+
+    Args:
+        path (str): Sidecar file
+        version (tuple): (mtime_ns, size) of the data file as it is now
+
+    Returns:
+        The saved payload, or None if there is no readable sidecar for that version
+    """
+    try:
+        with open(path, 'rb') as f:
+            if _HEADER.unpack(f.read(_HEADER.size)) != tuple(version):
+                return None
+            return json.loads(f.read().decode('utf-8'))
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+def save_sidecar(path, version, payload):
+    """
+    Save a sidecar for a version of its data file.
+
+    The sidecar is written to a temporary file and moved into place, so
+    readers never see a partial one.
+
+    Args:
+        path (str): Sidecar file
+        version (tuple): (mtime_ns, size) of the data file the payload describes
+        payload: JSON-serialisable index
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(*version))
+        f.write(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+    os.replace(temp_path, path)
+
+
+def restamp_sidecar(path, version):
+    """
+    Tie an existing sidecar to a new version of its data file, keeping its payload.
+
+    For changes that leave the index valid, such as a same-length row update.
+
+    Returns:
+        bool: False if there is no sidecar to restamp
+    """
+    try:
+        with open(path, 'r+b') as f:
+            f.write(_HEADER.pack(*version))
+        return True
+    except FileNotFoundError:
+        return False
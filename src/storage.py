@@ -0,0 +1,228 @@
+"""
+Project Review Scheduler - Storage Backends
+
+The scheduler stores its data in three CSV files by default. This module
+provides an alternative SQLite backend that keeps Projects, Users and Reviews
+in indexed tables so single-row lookups and updates do not require reading or
+rewriting a whole file.
+
+Rows are exchanged as dictionaries of strings, exactly like the rows returned
+by csv.DictReader, so the rest of the scheduler does not need to know which
+backend is active.
+"""
+
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+
+
+# Column layout, primary key and secondary indexes for each table
+TABLE_SCHEMAS = {
+    'Projects': {
+        'key': 'Project_ID',
+        'columns': ["Project_ID", "Project_Name", "Start_Date", "Last_Review_Date",
+                    "Review_Frequency_Years", "Department", "Status", "Next_Review_Date"],
+        'indexes': ['Status', 'Department', 'Next_Review_Date'],
+    },
+    'Users': {
+        'key': 'User_ID',
+        'columns': ["User_ID", "Name", "Email", "Department", "Current_Load"],
+        'indexes': ['Department'],
+    },
+    'Reviews': {
+        # Not unique: older Review_IDs were one timestamp per second
+        'key': 'Review_ID',
+        'unique_key': False,
+        'columns': ["Review_ID", "Project_ID", "Reviewer_ID", "Scheduled_Date",
+                    "Status", "Completion_Date"],
+        'indexes': ['Project_ID', 'Reviewer_ID', 'Status'],
+    },
+}
+
+
+def table_for_path(file_path):
+    """
+    Map a CSV file path to the table it holds.
+
+    Args:
+        file_path (str): Path such as 'data/Projects.csv'
+
+    Returns:
+        str: Table name ('Projects', 'Users' or 'Reviews'), or None for other files
+    """
+    name = os.path.splitext(os.path.basename(str(file_path)))[0]
+    return name if name in TABLE_SCHEMAS else None
+
+
+class StorageBackend(ABC):
+    """
+    Interface implemented by every storage backend.
+
+    All methods take a table name from TABLE_SCHEMAS and rows as dictionaries.
+    Where a table's key is not unique, get and upsert use the first row with
+    the key, like a scan of the CSV file would.
+    """
+
+    @abstractmethod
+    def read_all(self, table):
+        """Return all rows of a table in insertion order."""
+
+    @abstractmethod
+    def get(self, table, key):
+        """Return the row with the given key, or None."""
+
+    @abstractmethod
+    def find(self, table, column, value):
+        """Return the rows whose column equals value, in insertion order."""
+
+    def insert(self, table, row):
+        self.insert_many(table, [row])
+
+    @abstractmethod
+    def insert_many(self, table, rows):
+        """Add rows to a table."""
+
+    def upsert(self, table, row):
+        self.upsert_many(table, [row])
+
+    @abstractmethod
+    def upsert_many(self, table, rows):
+        """Update the rows with the same keys, adding the rows that have no match."""
+
+    @abstractmethod
+    def replace_all(self, table, rows):
+        """Replace the contents of a table."""
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    SQLite implementation of the storage backend.
+
+    The database runs in WAL mode so readers (e.g. the dashboard) are not blocked
+    while a batch job writes. All SQL is built once per table in the constructor;
+    sqlite3 caches the compiled statements, so repeated calls reuse them.
+    """
+
+    def __init__(self, db_path='scheduler.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+
+        self._sql = {}
+        for table, schema in TABLE_SCHEMAS.items():
+            self._create_table(table, schema)
+            self._sql[table] = self._build_statements(table, schema)
+        self.conn.commit()
+
+    def _create_table(self, table, schema):
+        key, unique = schema['key'], schema.get('unique_key', True)
+        columns = ', '.join(
+            f'"{c}" TEXT PRIMARY KEY' if c == key and unique else f'"{c}" TEXT'
+            for c in schema['columns']
+        )
+        # rowid keeps insertion order so read_all matches the CSV row order
+        self.conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({columns})')
+        if not unique:
+            self._drop_primary_key(table, key, columns)
+        for column in ([] if unique else [key]) + schema['indexes']:
+            self.conn.execute(
+                f'CREATE INDEX IF NOT EXISTS "idx_{table}_{column}" ON "{table}" ("{column}")'
+            )
+
+    def _drop_primary_key(self, table, key, columns):
+        """Rebuild a table created with a unique key by an older version, keeping row order."""
+        table_info = self.conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+        if not any(info['name'] == key and info['pk'] for info in table_info):
+            return
+        self.conn.execute(f'CREATE TABLE "{table}_rebuilt" ({columns})')
+        self.conn.execute(f'INSERT INTO "{table}_rebuilt" SELECT * FROM "{table}" ORDER BY rowid')
+        self.conn.execute(f'DROP TABLE "{table}"')
+        self.conn.execute(f'ALTER TABLE "{table}_rebuilt" RENAME TO "{table}"')
+
+    @staticmethod
+    def _build_statements(table, schema):
+        columns = schema['columns']
+        column_list = ', '.join(f'"{c}"' for c in columns)
+        placeholders = ', '.join('?' for _ in columns)
+        key = schema['key']
+        updates = ', '.join(f'"{c}" = excluded."{c}"' for c in columns if c != key)
+        assignments = ', '.join(f'"{c}" = ?' for c in columns)
+        first_with_key = f'SELECT rowid FROM "{table}" WHERE "{key}" = ? ORDER BY rowid LIMIT 1'
+        return {
+            'select_all': f'SELECT {column_list} FROM "{table}" ORDER BY rowid',
+            'select_key': f'SELECT {column_list} FROM "{table}" WHERE "{key}" = ? ORDER BY rowid LIMIT 1',
+            'insert': f'INSERT INTO "{table}" ({column_list}) VALUES ({placeholders})',
+            'upsert': (f'INSERT INTO "{table}" ({column_list}) VALUES ({placeholders}) '
+                       f'ON CONFLICT("{key}") DO UPDATE SET {updates}'),
+            'update_first': f'UPDATE "{table}" SET {assignments} WHERE rowid = ({first_with_key})',
+            'delete_all': f'DELETE FROM "{table}"',
+        }
+
+    @staticmethod
+    def _values(table, row):
+        # Store everything as text, the same way the CSV files do
+        values = []
+        for column in TABLE_SCHEMAS[table]['columns']:
+            value = row.get(column, '')
+            values.append('' if value is None else str(value))
+        return values
+
+    def read_all(self, table):
+        return [dict(r) for r in self.conn.execute(self._sql[table]['select_all'])]
+
+    def get(self, table, key):
+        row = self.conn.execute(self._sql[table]['select_key'], (key,)).fetchone()
+        return dict(row) if row else None
+
+    def find(self, table, column, value):
+        if column not in TABLE_SCHEMAS[table]['columns']:
+            raise ValueError(f"Unknown column '{column}' for table {table}")
+        column_list = ', '.join(f'"{c}"' for c in TABLE_SCHEMAS[table]['columns'])
+        sql = f'SELECT {column_list} FROM "{table}" WHERE "{column}" = ? ORDER BY rowid'
+        return [dict(r) for r in self.conn.execute(sql, (value,))]
+
+    def insert_many(self, table, rows):
+        with self.conn:
+            self.conn.executemany(self._sql[table]['insert'],
+                                  (self._values(table, r) for r in rows))
+
+    def upsert_many(self, table, rows):
+        sql = self._sql[table]
+        with self.conn:
+            if TABLE_SCHEMAS[table].get('unique_key', True):
+                self.conn.executemany(sql['upsert'], (self._values(table, r) for r in rows))
+                return
+            # No unique constraint to conflict on: update the first row with the key
+            key_position = TABLE_SCHEMAS[table]['columns'].index(TABLE_SCHEMAS[table]['key'])
+            for row in rows:
+                values = self._values(table, row)
+                if self.conn.execute(sql['update_first'], values + [values[key_position]]).rowcount == 0:
+                    self.conn.execute(sql['insert'], values)
+
+    def replace_all(self, table, rows):
+        with self.conn:
+            self.conn.execute(self._sql[table]['delete_all'])
+            self.conn.executemany(self._sql[table]['insert'],
+                                  (self._values(table, r) for r in rows))
+
+    def import_csv(self, table, rows):
+        """
+        Load rows read from a CSV file into a table, replacing its contents.
+
+        Args:
+            table (str): Table name
+            rows (list): Rows as dictionaries
+
+        Returns:
+            int: Number of rows imported
+        """
+        self.replace_all(table, rows)
+        return len(rows)
+
+    def close(self):
+        self.conn.close()
@@ -42,7 +42,7 @@ sys.path.append(str(project_dir))
 fake = Faker()
 
 # Import utility functions
-from utils import safe_parse_date
+from utils import parse_date, safe_parse_date
 
    
 
@@ -298,7 +298,7 @@ def validate_csv_data(file_path, schema=None):
             value = row[field]
             if rules.get('type') == 'date':
                 try:
-                    datetime.strptime(value, '%Y-%m-%d')
+                    parse_date(value)
                 except ValueError:
                     errors.append({
                         'row': i,
@@ -532,7 +532,7 @@ def calculate_all_reviews(projects_file='Projects.csv', current_date=None):
     if current_date is None:
         current_date = datetime.now()
     elif isinstance(current_date, str):
-        current_date = datetime.strptime(current_date, '%Y-%m-%d')
+        current_date = parse_date(current_date)
     
     # Read projects data
     projects = read_csv(projects_file)
@@ -818,7 +818,7 @@ def generate_monthly_schedule(month, year, output_file=None):
             continue
         
         # Check if the review is in the specified month/year
-        review_date = datetime.strptime(review['Scheduled_Date'], '%Y-%m-%d')
+        review_date = parse_date(review['Scheduled_Date'])
         if review_date.strftime('%m') != month or review_date.strftime('%Y') != year:
             continue
         
@@ -953,7 +953,7 @@ def generate_overdue_alerts(output_file=None):
             review = active_reviews[0]  # Take the first active review
             reviewer = get_reviewer(review['Reviewer_ID'])
             reviewer_name = reviewer.get('Name', 'Unknown') if reviewer else 'Unknown'
-            next_review = datetime.strptime(project['Next_Review_Date'], '%Y-%m-%d')
+            next_review = parse_date(project['Next_Review_Date'])
             days_overdue = (datetime.now() - next_review).days
 
         else:
@@ -0,0 +1,64 @@
+"""
+Test Case: Append-only Review Inserts
+Verify add_review and add_reviews append rows to Reviews.csv without rewriting the file.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+
+
+class TestAddReviewAppend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reviews_file = os.path.join(self.tmpdir.name, "Reviews.csv")
+        scheduler.create_csv_if_missing(self.reviews_file)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def _review(review_id):
+        return {"Review_ID": review_id, "Project_ID": "P001", "Reviewer_ID": "U001",
+                "Scheduled_Date": "2025-06-01", "Status": "Scheduled", "Completion_Date": ""}
+
+    @patch("scheduler.write_csv")
+    def test_append_does_not_rewrite(self, mock_write_csv):
+        scheduler.add_review(self._review("R002"), self.reviews_file)
+        added = scheduler.add_reviews((self._review(f"R10{i}") for i in range(3)), self.reviews_file)
+
+        mock_write_csv.assert_not_called()
+        self.assertEqual(added, 3)
+        ids = [r["Review_ID"] for r in scheduler.read_csv(self.reviews_file)]
+        self.assertEqual(ids, ["R002", "R100", "R101", "R102"])
+
+    def test_missing_trailing_newline(self):
+        with open(self.reviews_file, "a") as f:
+            f.write("R001,P001,U001,2025-06-01,Scheduled,")  # no line break
+        scheduler.add_review(self._review("R002"), self.reviews_file)
+
+        ids = [r["Review_ID"] for r in scheduler.read_csv(self.reviews_file)]
+        self.assertEqual(ids, ["R001", "R002"])
+
+    def test_unknown_column_falls_back_to_rewrite(self):
+        review = dict(self._review("R003"), Notes="extra column")
+        scheduler.add_review(review, self.reviews_file)
+
+        rows = scheduler.read_csv(self.reviews_file)
+        self.assertEqual(rows[0]["Notes"], "extra column")
+
+    def test_unknown_column_with_existing_rows(self):
+        scheduler.add_review(self._review("R001"), self.reviews_file)
+        scheduler.add_review(dict(self._review("R002"), Notes="extra column"), self.reviews_file)
+
+        rows = scheduler.read_csv(self.reviews_file)
+        self.assertEqual([(r["Review_ID"], r["Notes"]) for r in rows], [("R001", ""), ("R002", "extra column")])
+        self.assertEqual(scheduler.read_csv_header(self.reviews_file)[-1], "Notes")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Test Case: Compressed Backups
+Verify write_csv makes one compressed backup per file per run, identical
+contents are stored once, backups restore correctly (also as of a point in
+time), and old backups are thinned by the retention policy.
+"""
+
+import gzip
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+import scheduler
+from backups import BackupManager
+
+
+class TestBackups(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.users_file = os.path.join(self.tmpdir.name, "Users.csv")
+        with open(self.users_file, "w") as f:
+            f.write("User_ID,Name\nU001,Alice\n")
+
+    def tearDown(self):
+        scheduler.configure_backups()
+        self.tmpdir.cleanup()
+
+    def test_one_compressed_backup_per_run(self):
+        backup_dir = os.path.join(self.tmpdir.name, "archive")
+        manager = scheduler.configure_backups(backup_dir=backup_dir)
+
+        with scheduler.backup_run():
+            for name in ["Bob", "Carol", "Dave"]:
+                scheduler.write_csv(self.users_file, [{"User_ID": "U001", "Name": name}])
+
+        backups = manager.list_backups(self.users_file)
+        self.assertEqual(len(backups), 1)
+        self.assertTrue(backups[0][1].endswith(".gz"))
+        with gzip.open(backups[0][1], "rt") as f:
+            self.assertIn("Alice", f.read())
+
+        manager.restore(self.users_file)
+        self.assertEqual(scheduler.read_csv(self.users_file)[0]["Name"], "Alice")
+
+        # Outside a run, every write is backed up again
+        scheduler.write_csv(self.users_file, [{"User_ID": "U001", "Name": "Erin"}])
+        scheduler.write_csv(self.users_file, [{"User_ID": "U001", "Name": "Frank"}])
+        self.assertEqual(len(manager.list_backups(self.users_file)), 4)
+
+    def test_restore_backs_up_the_current_file(self):
+        manager = scheduler.configure_backups(keep_last=10)
+        manager.backup(self.users_file, now=datetime(2025, 6, 1, 9, 0))
+        scheduler.write_csv(self.users_file, [{"User_ID": "U001", "Name": "Bob"}])
+
+        scheduler.restore_backups([self.users_file], as_of=datetime(2025, 6, 1, 12, 0))
+        self.assertEqual(scheduler.read_csv(self.users_file)[0]["Name"], "Alice")
+        # The overwritten contents are the newest backup, so the restore can be undone
+        scheduler.restore_backups([self.users_file])
+        self.assertEqual(scheduler.read_csv(self.users_file)[0]["Name"], "Bob")
+
+    def test_restore_keeps_its_source_backup(self):
+        manager = scheduler.configure_backups(keep_last=1, keep_daily=0, keep_weekly=0)
+        manager.backup(self.users_file, now=datetime(2025, 6, 1, 9, 0))
+        with open(self.users_file, "w") as f:
+            f.write("User_ID,Name\nU001,Bob\n")
+
+        # Backing up Bob before the restore leaves Alice outside the policy
+        restored = manager.restore(self.users_file, as_of=datetime(2025, 6, 1, 12, 0))
+        self.assertTrue(os.path.exists(restored))
+        self.assertEqual([path for _, path in manager.list_backups(self.users_file)][0], restored)
+        self.assertEqual(scheduler.read_csv(self.users_file)[0]["Name"], "Alice")
+
+    def test_concurrent_backups_share_the_store(self):
+        backup_dir = os.path.join(self.tmpdir.name, "archive")
+        files = []
+        for i in range(4):
+            path = os.path.join(self.tmpdir.name, f"Users{i}.csv")
+            files.append(path)
+
+        def back_up(path):
+            manager = BackupManager(backup_dir=backup_dir, keep_last=2, keep_daily=0, keep_weekly=0)
+            for version in range(15):
+                with open(path, "w") as f:
+                    f.write(f"User_ID,Name\nU001,{path} {version}\n")
+                manager.start_run()
+                manager.backup(path)
+
+        threads = [threading.Thread(target=back_up, args=(path,)) for path in files]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        manager = BackupManager(backup_dir=backup_dir)
+        for path in files:
+            backups = manager.list_backups(path)
+            self.assertEqual(len(backups), 2)
+            for _, blob in backups:
+                self.assertTrue(os.path.exists(blob))
+
+    def test_lzma_backup(self):
+        manager = BackupManager(compression="lzma")
+        backup_path = manager.backup(self.users_file)
+        self.assertTrue(backup_path.endswith(".xz"))
+        self.assertTrue(backup_path.startswith(os.path.join(self.tmpdir.name, "backups", "blobs")))
+
+    def test_identical_contents_are_stored_once(self):
+        backup_dir = os.path.join(self.tmpdir.name, "archive")
+        manager = BackupManager(backup_dir=backup_dir, keep_last=10)
+        start = datetime(2025, 6, 1, 9, 0)
+        paths = []
+        for i in range(3):
+            manager.start_run()
+            paths.append(manager.backup(self.users_file, now=start + timedelta(hours=i)))
+
+        self.assertEqual(len(set(paths)), 1)
+        self.assertEqual(len(manager.list_backups(self.users_file)), 3)
+        blobs = [name for _, _, files in os.walk(os.path.join(backup_dir, "blobs")) for name in files]
+        self.assertEqual(len(blobs), 1)
+
+    def test_restore_as_of(self):
+        manager = scheduler.configure_backups(keep_last=10)
+        start = datetime(2025, 6, 1, 9, 0)
+        for i, name in enumerate(["Bob", "Carol", "Dave"]):
+            manager.start_run()
+            manager.backup(self.users_file, now=start + timedelta(days=i))
+            scheduler.write_csv(self.users_file, [{"User_ID": "U001", "Name": name}])
+
+        # Backups hold Alice (Jun 1), Bob (Jun 2) and Carol (Jun 3)
+        scheduler.restore_backups([self.users_file], as_of=datetime(2025, 6, 2, 12, 0))
+        self.assertEqual(scheduler.read_csv(self.users_file)[0]["Name"], "Bob")
+
+        cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        try:
+            result = scheduler.execute_command(["restore", "--as-of", "2025-06-01", "--file", "Users.csv"])
+            self.assertTrue(result["success"])
+            self.assertEqual(scheduler.read_csv("Users.csv")[0]["Name"], "Alice")
+
+            result = scheduler.execute_command(["restore", "--as-of", "2025-05-31", "--file", "Users.csv"])
+            self.assertFalse(result["success"])
+        finally:
+            os.chdir(cwd)
+
+    def test_retention_policy(self):
+        manager = BackupManager(keep_last=2, keep_daily=3, keep_weekly=2, prune_legacy=True)
+        legacy_dir = manager.directory_for(self.users_file)
+        os.makedirs(legacy_dir)
+        legacy_path = os.path.join(legacy_dir, "Users.csv.20250101_080000.bak")
+        with open(legacy_path, "w") as f:
+            f.write("old")
+
+        # Legacy backups are only thinned when the user opts in
+        BackupManager(keep_last=1, keep_daily=0, keep_weekly=0).backup(self.users_file, now=datetime(2025, 3, 1))
+        self.assertTrue(os.path.exists(legacy_path))
+
+        start = datetime(2025, 3, 3, 9, 0)  # a Monday
+        for day in range(21):
+            for hour in (0, 6):
+                manager.start_run()
+                manager.backup(self.users_file, now=start + timedelta(days=day, hours=hour))
+
+        kept = [stamp for stamp, _ in manager.list_backups(self.users_file)]
+        blobs = [name for _, _, files in os.walk(os.path.join(legacy_dir, "blobs")) for name in files]
+        self.assertEqual(len(blobs), 1)
+        expected = [
+            datetime(2025, 3, 16, 15, 0),  # newest of the second-to-last week
+            datetime(2025, 3, 21, 15, 0),  # newest of the last three days...
+            datetime(2025, 3, 22, 15, 0),
+            datetime(2025, 3, 23, 9, 0),   # ...and the last two backups
+            datetime(2025, 3, 23, 15, 0),
+        ]
+        self.assertEqual(kept, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Test Case: Columnar Snapshots
+Verify the snapshot command stores the CSV files column by column, read_csv loads
+the same rows from a current snapshot without parsing the CSV, and ignores a
+snapshot once the CSV has changed.
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+from columnar import encode_rows, load_snapshot
+
+
+class TestColumnarSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        scheduler.invalidate_csv_cache()
+        with open("Reviews.csv", "w") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\n")
+            f.write("R001,P001,U001,2025-05-10,Scheduled,\n")
+            f.write("R002,P002,U002,2025-05-12,Completed,2025-05-12\n")
+            f.write("\n")
+            f.write("R003,P001,U002,2025-06-01,Scheduled\n")  # short row
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        scheduler.configure_backups()
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def csv_rows(self):
+        with open("Reviews.csv", newline="") as f:
+            return list(csv.DictReader(f))
+
+    def test_snapshot_round_trip(self):
+        result = scheduler.execute_command(["snapshot"])
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"]["Reviews.csv"], "Reviews.csv.npz")
+        self.assertIsNone(result["result"]["Projects.csv"])
+
+        snapshot = load_snapshot("Reviews.csv")
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(list(snapshot.categories["Status"]), ["Completed", "Scheduled"])
+        self.assertEqual(snapshot.column("Completion_Date"), ["", "2025-05-12", None])
+
+        expected = self.csv_rows()
+        with patch("scheduler.csv.DictReader") as mock_reader:
+            rows = scheduler.read_csv("Reviews.csv")
+        mock_reader.assert_not_called()
+        self.assertEqual(rows, expected)
+
+    def test_stale_snapshot_is_ignored(self):
+        scheduler.write_snapshots(["Reviews.csv"])
+        rows = self.csv_rows()
+        rows[0]["Status"] = "Completed"
+        scheduler.write_csv("Reviews.csv", rows)
+
+        self.assertIsNone(load_snapshot("Reviews.csv"))
+        self.assertEqual(scheduler.read_csv("Reviews.csv")[0]["Status"], "Completed")
+
+    def test_rows_with_extra_values_are_rejected(self):
+        with self.assertRaises(ValueError):
+            encode_rows(["A", "B"], [["1", "2", "3"]])
+
+    def test_header_names_are_only_data(self):
+        header = ["A", "x}: __import__('os').remove('Reviews.csv'), {'y", "A B", "A"]
+        table = encode_rows(header, [["1", "2", "3", "4"], ["5"]])
+
+        self.assertEqual(table.rows(), [dict(zip(header, ["1", "2", "3", "4"])),
+                                        dict(zip(header, ["5", None, None, None]))])
+        self.assertTrue(os.path.exists("Reviews.csv"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Test Case: CSV Read Cache
+Verify parsed CSV tables are reused until the file changes on disk or is written by write_csv.
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+
+
+class TestCSVCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.users_file = os.path.join(self.tmpdir.name, "Users.csv")
+        scheduler.write_csv(self.users_file, [
+            {"User_ID": "U001", "Name": "Alice", "Email": "a@example.com", "Department": "IT", "Current_Load": "0"},
+            {"User_ID": "U002", "Name": "Bob", "Email": "b@example.com", "Department": "HR", "Current_Load": "1"},
+        ])
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        self.tmpdir.cleanup()
+
+    def test_repeated_lookups_parse_once(self):
+        with patch("scheduler.csv.DictReader", wraps=csv.DictReader) as spy:
+            for _ in range(50):
+                self.assertEqual(scheduler.get_reviewer("U002", self.users_file)["Name"], "Bob")
+        self.assertEqual(spy.call_count, 1)
+
+    def test_callers_get_copies(self):
+        users = scheduler.read_csv(self.users_file)
+        users[0]["Name"] = "Changed"
+        scheduler.get_reviewer("U001", self.users_file)["Name"] = "Changed"
+        self.assertEqual(scheduler.get_reviewer("U001", self.users_file)["Name"], "Alice")
+
+    def test_write_csv_invalidates(self):
+        user = scheduler.get_reviewer("U001", self.users_file)
+        user["Current_Load"] = "7"
+        scheduler.update_user(user, self.users_file)
+        self.assertEqual(scheduler.get_reviewer("U001", self.users_file)["Current_Load"], "7")
+
+    def test_external_change_detected(self):
+        scheduler.read_csv(self.users_file)
+        with open(self.users_file, "a", newline="") as f:
+            csv.writer(f).writerow(["U003", "Carol", "c@example.com", "QA", "0"])
+        self.assertIsNotNone(scheduler.get_reviewer("U003", self.users_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Test Case: Batched Reviewer Assignment
+Verify assign_all_reviewers writes Users and Reviews once per run and that a failed
+commit leaves the data unchanged.
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+
+
+class TestDataSession(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.projects_file = os.path.join(self.tmpdir.name, "Projects.csv")
+        self.users_file = os.path.join(self.tmpdir.name, "Users.csv")
+        self.reviews_file = os.path.join(self.tmpdir.name, "Reviews.csv")
+
+        projects = [{
+            "Project_ID": f"P{i:03}", "Project_Name": f"Project {i}", "Start_Date": "2024-01-01",
+            "Last_Review_Date": "2024-01-01", "Review_Frequency_Years": "1",
+            "Department": "IT", "Status": "Overdue", "Next_Review_Date": "2025-01-01"
+        } for i in range(1, 6)]
+        users = [
+            {"User_ID": "U001", "Name": "Alice", "Email": "a@example.com", "Department": "HR", "Current_Load": "0"},
+            {"User_ID": "U002", "Name": "Bob", "Email": "b@example.com", "Department": "QA", "Current_Load": "0"},
+        ]
+        self._write(self.projects_file, projects)
+        self._write(self.users_file, users)
+        scheduler.create_csv_if_missing(self.reviews_file)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def _write(path, rows):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def test_single_write_per_file(self):
+        with patch("scheduler.write_csv", wraps=scheduler.write_csv) as spy, \
+                patch("scheduler.add_reviews", wraps=scheduler.add_reviews) as append_spy:
+            result = scheduler.assign_all_reviewers(self.projects_file, self.users_file, self.reviews_file)
+
+        self.assertEqual(result["total_assigned"], 5)
+        written = [call.args[0] for call in spy.call_args_list]
+        self.assertEqual(written, [self.users_file])
+        # New reviews are appended in one call instead of rewriting Reviews.csv
+        self.assertEqual([call.args[1] for call in append_spy.call_args_list], [self.reviews_file])
+
+        reviews = scheduler.read_csv(self.reviews_file)
+        self.assertEqual(len({r["Review_ID"] for r in reviews}), 5)
+        loads = {u["User_ID"]: int(u["Current_Load"]) for u in scheduler.read_csv(self.users_file)}
+        self.assertEqual(sum(loads.values()), 5)
+
+    def test_rollback_on_failed_commit(self):
+        users = scheduler.read_csv(self.users_file)
+        session = scheduler.DataSession(self.users_file, self.reviews_file, users=users)
+        project = scheduler.read_csv(self.projects_file)[0]
+        scheduler.assign_reviewer(project, users, session=session)
+
+        with patch("scheduler.add_reviews", side_effect=IOError("disk full")):
+            with self.assertRaises(IOError):
+                session.commit()
+
+        self.assertEqual([u["Current_Load"] for u in scheduler.read_csv(self.users_file)], ["0", "0"])
+        self.assertEqual([int(u["Current_Load"]) for u in users], [0, 0])
+        self.assertEqual(session.pending, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
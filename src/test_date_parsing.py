@@ -0,0 +1,41 @@
+"""
+Test Case: Cached Date Parsing
+Verify parse_date and safe_parse_date return the same values as strptime,
+reject the same invalid values, and reuse results for repeated dates.
+"""
+
+import unittest
+from datetime import datetime
+
+import scheduler
+from utils import parse_date, safe_parse_date
+
+
+class TestDateParsing(unittest.TestCase):
+
+    def test_matches_strptime(self):
+        for value in ["2025-01-31", "2024-02-29", "2025-1-5", "0001-01-01", "9999-12-31"]:
+            self.assertEqual(parse_date(value), datetime.strptime(value, "%Y-%m-%d"))
+            self.assertEqual(safe_parse_date(value), datetime.strptime(value, "%Y-%m-%d"))
+        self.assertEqual(safe_parse_date("2025-05-01 13:45:10"), datetime(2025, 5, 1, 13, 45, 10))
+
+    def test_invalid_values_raise(self):
+        for value in ["2025-02-30", "2025-W01-1", "20250101", "2025/01/01", "", "2025-01-01 25:00:00"]:
+            with self.assertRaises(ValueError):
+                safe_parse_date(value)
+            with self.assertRaises(ValueError):
+                parse_date(value)
+        with self.assertRaises(TypeError):
+            parse_date(None)
+
+    def test_repeated_dates_are_cached(self):
+        project = {"Last_Review_Date": "2011-03-04", "Review_Frequency_Years": "1"}
+        scheduler.calculate_due_date(project, "2011-06-01")
+        hits = parse_date.cache_info().hits
+        for _ in range(5):
+            scheduler.calculate_due_date(project, "2011-06-01")
+        self.assertGreaterEqual(parse_date.cache_info().hits - hits, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
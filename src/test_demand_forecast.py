@@ -0,0 +1,106 @@
+"""
+Test Case: Review Demand Forecast
+Verify the weekly and monthly forecast per department matches expanding each
+project's review series one date at a time.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+import scheduler
+from forecast import forecast_review_demand
+
+
+class TestDemandForecast(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.projects = []
+        for i in range(400):
+            last_review = date(2018, 1, 1) + timedelta(days=rng.randint(0, 2800))
+            self.projects.append({
+                "Project_ID": f"P{i:04d}",
+                "Last_Review_Date": last_review.strftime("%Y-%m-%d"),
+                "Review_Frequency_Years": rng.choice(["1", "2", "0.5", "0.25", "0.0834", "3"]),
+                "Department": rng.choice(["IT", "HR", ""]),
+            })
+        self.projects.append({"Project_ID": "X1", "Last_Review_Date": "2024-01-31",
+                              "Review_Frequency_Years": "0.0834", "Department": "IT"})
+        self.projects.append({"Project_ID": "X2", "Last_Review_Date": "", "Review_Frequency_Years": "1",
+                              "Department": "IT"})
+        self.projects.append({"Project_ID": "X3", "Last_Review_Date": "2024-01-01", "Review_Frequency_Years": "0.01",
+                              "Department": "IT"})
+
+    def expected(self, start, end, period_starts):
+        counts = {}
+        for project in self.projects:
+            try:
+                last_review = date.fromisoformat(project["Last_Review_Date"])
+            except ValueError:
+                continue
+            months = int(float(project["Review_Frequency_Years"]) * 12)
+            if months <= 0:
+                continue
+            department = project["Department"] or "Unknown"
+            k = 1
+            due = last_review + relativedelta(months=months)
+            if due < start:
+                counts[(department, 0)] = counts.get((department, 0), 0) + 1  # overdue
+            while due <= end:
+                if due >= start:
+                    bin_number = max(i for i, s in enumerate(period_starts) if s <= due)
+                    counts[(department, bin_number)] = counts.get((department, bin_number), 0) + 1
+                k += 1
+                due = last_review + relativedelta(months=months * k)
+        return counts
+
+    def check(self, period):
+        start, end = date(2025, 3, 15), date(2027, 3, 14)
+        result = forecast_review_demand([p["Last_Review_Date"] for p in self.projects],
+                                        [p["Review_Frequency_Years"] for p in self.projects],
+                                        [p["Department"] for p in self.projects], start, end, period)
+        period_starts = [date.fromisoformat(s) for s in result["periods"]]
+        expected = self.expected(start, end, period_starts)
+
+        self.assertEqual(result["skipped"], 2)
+        for department, counts in result["departments"].items():
+            for i, count in enumerate(counts):
+                self.assertEqual(count, expected.get((department, i), 0), (period, department, period_starts[i]))
+        self.assertEqual(sum(result["totals"]), sum(expected.values()))
+        return result
+
+    def test_weekly(self):
+        result = self.check("week")
+        self.assertEqual(result["periods"][:2], ["2025-03-15", "2025-03-22"])
+
+    def test_monthly(self):
+        result = self.check("month")
+        self.assertEqual(result["periods"][:3], ["2025-03-15", "2025-04-01", "2025-05-01"])
+        self.assertEqual(len(result["periods"]), 25)
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            scheduler.invalidate_csv_cache()
+            try:
+                scheduler.write_csv("Projects.csv", self.projects)
+                result = scheduler.execute_command(["forecast", "--from", "2025-03-15", "--years", "2",
+                                                    "--period", "month", "--output", "forecast.csv"])
+                self.assertTrue(result["success"])
+                self.assertEqual(len(scheduler.read_csv("forecast.csv")), 25)
+                self.assertEqual(scheduler.read_csv_header("forecast.csv"),
+                                 ["Period_Start", "HR", "IT", "Unknown", "Total"])
+                self.assertFalse(scheduler.execute_command(["forecast", "--period", "day"])["success"])
+            finally:
+                scheduler.invalidate_csv_cache()
+                os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Test Case: Batch Due Date Calculation
+Verify the vectorized calculation matches calculate_due_date row for row, including
+end-of-month clamping, fractional frequencies and a current date with a time part.
+"""
+
+import random
+import unittest
+from datetime import date, datetime, timedelta
+
+import scheduler
+from due_dates import calculate_due_dates
+
+
+class TestBatchDueDates(unittest.TestCase):
+
+    def _projects(self):
+        rng = random.Random(42)
+        projects = []
+        for i in range(2000):
+            last_review = date(2020, 1, 1) + timedelta(days=rng.randint(0, 2000))
+            projects.append({
+                "Project_ID": f"P{i:05}",
+                "Last_Review_Date": last_review.strftime("%Y-%m-%d"),
+                "Review_Frequency_Years": rng.choice(["1", "2", "0.5", "0.25", "1.5", "0.1", "3"]),
+            })
+        for day in ["2024-01-31", "2023-01-31", "2024-02-29", "2023-08-31", "2024-12-31"]:
+            projects.append({"Project_ID": day, "Last_Review_Date": day, "Review_Frequency_Years": "0.0834"})
+        return projects
+
+    def test_matches_scalar_calculation(self):
+        projects = self._projects()
+        for current_date in [datetime(2025, 6, 1), datetime(2025, 6, 1, 15, 30)]:
+            next_dates, statuses = calculate_due_dates(
+                [p["Last_Review_Date"] for p in projects],
+                [p["Review_Frequency_Years"] for p in projects],
+                current_date,
+            )
+            for project, next_date, status in zip(projects, next_dates, statuses):
+                expected = scheduler.calculate_due_date(project, current_date)
+                self.assertEqual((next_date, status), (expected["Next_Review_Date"], expected["Status"]),
+                                 project["Project_ID"])
+
+    def test_unparsable_rows_are_skipped(self):
+        next_dates, statuses = calculate_due_dates(
+            ["2025-01-15", "2025-1-15", ""], ["1", "1", "1"], datetime(2025, 6, 1))
+        self.assertEqual(next_dates, ["2026-01-15", None, None])
+        self.assertEqual(statuses, ["Up to Date", None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
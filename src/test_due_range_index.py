@@ -0,0 +1,110 @@
+"""
+Test Case: Next_Review_Date Range Index
+Verify projects_due_between returns the projects due in a date range, in date
+order, optionally for one department, and stays correct after updates.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from dateutil.relativedelta import relativedelta
+
+import scheduler
+from indexes import build_index
+from report_snapshot import ReportSnapshot
+
+
+class TestDueRangeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        scheduler.invalidate_csv_cache()
+        rng = random.Random(5)
+        self.projects = []
+        for i in range(300):
+            next_review = date(2025, 1, 1) + timedelta(days=rng.randint(0, 365))
+            self.projects.append({
+                "Project_ID": f"P{i:04d}", "Project_Name": f"Project {i}", "Start_Date": "2020-01-01",
+                "Last_Review_Date": "2024-01-01", "Review_Frequency_Years": "1",
+                "Department": rng.choice(["IT", "HR"]), "Status": "Up to Date",
+                "Next_Review_Date": next_review.strftime("%Y-%m-%d") if i % 50 else "",
+            })
+        scheduler.write_csv("Projects.csv", self.projects)
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        scheduler.configure_backups()
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def expected(self, start, end, department=None):
+        matches = [p for p in self.projects if p["Next_Review_Date"]
+                   and (start is None or start <= p["Next_Review_Date"])
+                   and (end is None or p["Next_Review_Date"] <= end)
+                   and (department is None or p["Department"] == department)]
+        return [p["Project_ID"] for p in sorted(matches, key=lambda p: p["Next_Review_Date"])]
+
+    def ids(self, projects):
+        return [p["Project_ID"] for p in projects]
+
+    def test_matches_scan(self):
+        for start, end, department in [("2025-03-01", "2025-03-31", None), ("2025-06-15", "2025-09-12", "HR"),
+                                       (None, "2025-01-31", None), ("2025-12-01", None, "IT"),
+                                       ("2026-01-01", "2026-12-31", None)]:
+            self.assertEqual(self.ids(scheduler.projects_due_between(start, end, department)),
+                             self.expected(start, end, department))
+        with patch("scheduler.STREAM_THRESHOLD_BYTES", 0):
+            self.assertEqual(self.ids(scheduler.projects_due_between("2025-03-01", "2025-03-31", "IT")),
+                             self.expected("2025-03-01", "2025-03-31", "IT"))
+
+    def test_index_follows_updates(self):
+        scheduler.projects_due_between("2025-01-01", "2025-12-31")
+        project = dict(self.projects[1], Next_Review_Date="2030-05-05")
+        scheduler.update_project(project)
+        self.projects[1] = project
+
+        self.assertEqual(self.ids(scheduler.projects_due_between("2030-01-01", "2030-12-31")), ["P0001"])
+        self.assertEqual(self.ids(scheduler.projects_due_between("2025-01-01", "2025-12-31")),
+                         self.expected("2025-01-01", "2025-12-31"))
+
+        index = build_index("Projects", [{"Project_ID": "A", "Next_Review_Date": "2025-01-02"}])
+        index.range("Next_Review_Date")
+        index.insert({"Project_ID": "B", "Next_Review_Date": "2025-01-01"})
+        index.replace("A", {"Project_ID": "A", "Next_Review_Date": "2025-02-01"})
+        self.assertEqual(self.ids(index.range("Next_Review_Date", "2025-01-01", "2025-01-31")), ["B"])
+
+    def test_snapshot_and_overdue_alerts(self):
+        snapshot = ReportSnapshot(self.projects, [], [])
+        self.assertEqual(self.ids(snapshot.projects_due_between("2025-03-01", "2025-03-31", "HR")),
+                         self.expected("2025-03-01", "2025-03-31", "HR"))
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        overdue = dict(self.projects[2], Status="Overdue", Next_Review_Date="2024-12-01")
+        stale = dict(self.projects[3], Status="Overdue",
+                     Next_Review_Date=(datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d"))
+        # calculate_due_date marks a project Overdue on its due date already
+        due_today = dict(self.projects[4], Last_Review_Date=(datetime.now() - relativedelta(years=1))
+                         .strftime("%Y-%m-%d"))
+        due_today = scheduler.calculate_due_date(due_today)
+        self.assertEqual((due_today["Next_Review_Date"], due_today["Status"]), (today, "Overdue"))
+        undated = dict(self.projects[50], Status="Overdue")
+        scheduler.write_csv("Projects.csv", [overdue, stale, due_today] + self.projects[5:])
+        result = scheduler.generate_overdue_alerts(output_file="overdue.csv")
+        self.assertEqual(result["projects"], ["P0002", "P0004", "P0003"])
+        result = scheduler.generate_overdue_alerts(output_file="overdue.csv",
+                                                   snapshot=ReportSnapshot([stale, due_today, undated, overdue], [], []))
+        self.assertEqual(result["projects"], ["P0050", "P0002", "P0004", "P0003"])
+
+        result = scheduler.execute_command(["due", "--days", "120"])
+        self.assertEqual(result["result"], ["P0004", "P0003"])
+
+
+if __name__ == '__main__':
+    unittest.main()
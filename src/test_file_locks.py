@@ -0,0 +1,108 @@
+"""
+Test Case: Atomic Writes and File Locks
+Verify write_csv replaces files atomically, readers and writers follow the
+shared/exclusive lock protocol, and parallel assignment runs do not assign the
+same project twice.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import scheduler
+import file_locks
+from file_locks import file_lock, lock_path_for
+
+
+@unittest.skipIf(file_locks.fcntl is None, "fcntl is not available")
+class TestFileLocks(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        self.users_file = os.path.join(self.tmpdir.name, "Users.csv")
+        with open(self.users_file, "w") as f:
+            f.write("User_ID,Name,Email,Department,Current_Load\n")
+            f.write("U001,Alice,alice@example.com,Math,0\n")
+            f.write("U002,Bob,bob@example.com,Science,0\n")
+
+    def tearDown(self):
+        scheduler.configure_backups()
+        scheduler.invalidate_csv_cache()
+        self.tmpdir.cleanup()
+
+    def try_lock(self, file_path, mode):
+        """Try to lock from a separate open file, like another process would."""
+        fd = os.open(lock_path_for(file_path), os.O_RDWR | os.O_CREAT)
+        try:
+            file_locks.fcntl.flock(fd, mode | file_locks.fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+        finally:
+            os.close(fd)
+
+    def test_failed_write_leaves_file_intact(self):
+        with open(self.users_file) as f:
+            before = f.read()
+
+        with self.assertRaises(ValueError):
+            scheduler.write_csv(self.users_file, [{"User_ID": "U001", "Unknown": "x"}],
+                                fieldnames=["User_ID"])
+
+        with open(self.users_file) as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual([n for n in os.listdir(self.tmpdir.name) if n.endswith(".tmp")], [])
+
+    def test_shared_and_exclusive_locks(self):
+        fcntl = file_locks.fcntl
+        with file_lock(self.users_file):
+            self.assertTrue(self.try_lock(self.users_file, fcntl.LOCK_SH))
+            self.assertFalse(self.try_lock(self.users_file, fcntl.LOCK_EX))
+
+            # Upgrade and nested use by write_csv, then back to shared
+            with file_lock(self.users_file, exclusive=True):
+                scheduler.write_csv(self.users_file, scheduler.read_csv(self.users_file))
+                self.assertFalse(self.try_lock(self.users_file, fcntl.LOCK_SH))
+            self.assertTrue(self.try_lock(self.users_file, fcntl.LOCK_SH))
+
+        self.assertTrue(self.try_lock(self.users_file, fcntl.LOCK_EX))
+
+    def test_parallel_assignment_runs(self):
+        projects_file = os.path.join(self.tmpdir.name, "Projects.csv")
+        reviews_file = os.path.join(self.tmpdir.name, "Reviews.csv")
+        with open(projects_file, "w") as f:
+            f.write("Project_ID,Project_Name,Department,Status\n")
+            for i in range(20):
+                f.write(f"P{i:03d},Project {i},Math,Overdue\n")
+        with open(reviews_file, "w") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\n")
+
+        # Slow down each assignment so the runs overlap
+        generate_review_id = scheduler.generate_review_id
+
+        def slow_review_id(taken=None):
+            time.sleep(0.002)
+            return generate_review_id(taken)
+
+        threads = [threading.Thread(target=scheduler.assign_all_reviewers,
+                                    args=(projects_file, self.users_file, reviews_file))
+                   for _ in range(4)]
+        with patch("scheduler.generate_review_id", side_effect=slow_review_id):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        scheduler.invalidate_csv_cache()
+        reviews = scheduler.read_csv(reviews_file)
+        self.assertEqual(sorted(r["Project_ID"] for r in reviews), [f"P{i:03d}" for i in range(20)])
+        loads = [int(u["Current_Load"]) for u in scheduler.read_csv(self.users_file)]
+        self.assertEqual(sum(loads), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
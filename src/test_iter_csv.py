@@ -0,0 +1,91 @@
+"""
+Test Case: Streaming CSV Reads
+Verify iter_csv yields only matching rows and requested columns without loading
+the file, and that the filtered getters and reports stream large files with the
+same results as the in-memory path.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+
+
+class TestIterCsv(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        scheduler.invalidate_csv_cache()
+        with open("Projects.csv", "w") as f:
+            f.write("Project_ID,Project_Name,Department,Status,Next_Review_Date\n")
+            f.write("P001,AI Audit,IT,Overdue,2025-01-01\n")
+            f.write("P002,Cloud Update,HR,Up to Date,2030-01-01\n")
+            f.write("P003,Cyber Compliance,IT,Overdue,2025-02-01\n")
+        with open("Users.csv", "w") as f:
+            f.write("User_ID,Name,Email,Department,Current_Load\n")
+            f.write("U001,Alice,alice@example.com,HR,1\n")
+            f.write("U002,Bob,bob@example.com,IT,1\n")
+        with open("Reviews.csv", "w") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\n")
+            f.write("R001,P001,U001,2025-05-10,Scheduled,\n")
+            f.write("R002,P002,U002,2025-05-12,Completed,2025-05-12\n")
+            f.write("\n")
+            f.write("R003,P001,U002,2025-06-01,In Progress\n")  # short row
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def test_where_and_columns(self):
+        rows = list(scheduler.iter_csv("Reviews.csv", where={"Project_ID": "P001"},
+                                       columns=["Review_ID", "Completion_Date"]))
+        self.assertEqual(rows, [{"Review_ID": "R001", "Completion_Date": ""},
+                                {"Review_ID": "R003", "Completion_Date": None}])
+
+        active = scheduler.iter_csv("Reviews.csv", where={"Status": {"Scheduled", "In Progress"}})
+        self.assertEqual(next(active)["Review_ID"], "R001")
+        active.close()
+
+        may = scheduler.iter_csv("Reviews.csv", where=lambda r: r["Scheduled_Date"].startswith("2025-05"))
+        self.assertEqual([r["Review_ID"] for r in may], ["R001", "R002"])
+        self.assertEqual(list(scheduler.iter_csv("Reviews.csv", where={"Missing": "x"})), [])
+        self.assertEqual(scheduler._csv_cache, {})
+
+    def test_cached_rows_are_filtered_in_memory(self):
+        scheduler.read_csv("Reviews.csv")
+        with patch("scheduler.open") as mock_open:
+            rows = list(scheduler.iter_csv("Reviews.csv", where={"Reviewer_ID": "U002"}))
+        mock_open.assert_not_called()
+        self.assertEqual([r["Review_ID"] for r in rows], ["R002", "R003"])
+
+    @patch("scheduler.plt")
+    @patch("scheduler.write_csv")
+    def test_streamed_results_match(self, mock_write_csv, mock_plt):
+        def run():
+            scheduler.invalidate_csv_cache()
+            return (
+                scheduler.get_reviews_by_project("P001"),
+                scheduler.get_projects_by_status("Overdue"),
+                scheduler.generate_monthly_schedule("05", "2025")["review_count"],
+                scheduler.generate_workload_report()["total_reviews"],
+                scheduler.generate_overdue_alerts()["projects"],
+                [c[0][1] for c in mock_write_csv.call_args_list[-3:]],
+            )
+
+        loaded = run()
+        with patch("scheduler.STREAM_THRESHOLD_BYTES", 0):
+            streamed = run()
+            self.assertNotIn(os.path.abspath("Reviews.csv"), scheduler._csv_cache)
+
+        self.assertEqual(streamed, loaded)
+        self.assertEqual(loaded[3], 2)
+        self.assertEqual(loaded[4], ["P001", "P003"])
+
+
+if __name__ == '__main__':
+    unittest.main()
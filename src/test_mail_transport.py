@@ -0,0 +1,152 @@
+"""
+Test Case: Pooled SMTP Transport
+Verify notifications reuse SMTP connections, reconnect after the server drops one
+and are sent in parallel over at most pool_size connections, using a stub SMTP
+server on localhost.
+"""
+
+import socketserver
+import threading
+import unittest
+from email.message import EmailMessage
+
+from mail_transport import PooledSMTPTransport
+from scheduler import send_notifications
+
+
+class StubSMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue: accepts every message and records it."""
+
+    def reply(self, line):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            self.dialogue()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def dialogue(self):
+        server = self.server
+        self.reply("220 stub ESMTP")
+        received = 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO") or command.startswith("HELO"):
+                self.reply("250 stub")
+            elif command.startswith("DATA"):
+                self.reply("354 end with .")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with server.lock:
+                    server.messages += 1
+                received += 1
+                self.reply("250 queued")
+                if server.drop_after and received >= server.drop_after:
+                    return  # hang up without QUIT
+            elif command.startswith("QUIT"):
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 ok")
+
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, drop_after=0):
+        super().__init__(("127.0.0.1", 0), StubSMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.messages = 0
+        self.drop_after = drop_after
+
+
+class TestPooledSMTPTransport(unittest.TestCase):
+
+    def start_server(self, drop_after=0):
+        server = StubSMTPServer(drop_after)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    @staticmethod
+    def message(i):
+        msg = EmailMessage()
+        msg["Subject"] = f"Review {i}"
+        msg["From"] = "scheduler@example.com"
+        msg["To"] = "reviewer@example.com"
+        msg.set_content("Please review.")
+        return msg
+
+    def test_connections_are_reused(self):
+        server = self.start_server()
+        with PooledSMTPTransport("127.0.0.1", server.server_address[1], use_tls=False,
+                                 messages_per_connection=4) as transport:
+            for i in range(10):
+                transport.send(self.message(i))
+
+        self.assertEqual(server.messages, 10)
+        self.assertEqual(transport.connections_opened, 3)
+
+    def test_reconnects_after_disconnect(self):
+        server = self.start_server(drop_after=3)
+        with PooledSMTPTransport("127.0.0.1", server.server_address[1], use_tls=False) as transport:
+            for i in range(7):
+                transport.send(self.message(i))
+
+        self.assertEqual(server.messages, 7)
+        self.assertEqual(transport.connections_opened, 3)
+
+    def test_concurrent_senders_share_the_pool(self):
+        # Recycling after every message frees a slot each time; waiting senders must get it
+        server = self.start_server()
+        transport = PooledSMTPTransport("127.0.0.1", server.server_address[1], use_tls=False,
+                                        pool_size=2, messages_per_connection=1)
+
+        def send_five(first):
+            for i in range(first, first + 5):
+                transport.send(self.message(i))
+
+        threads = [threading.Thread(target=send_five, args=(n * 5,), daemon=True) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        transport.close()
+
+        self.assertEqual(server.messages, 30)
+        self.assertEqual(transport.connections_opened, 30)
+        self.assertLessEqual(server.max_active, 2)
+
+    def test_send_notifications_in_parallel(self):
+        server = self.start_server()
+        plan = [{"project_id": f"P{i}", "review_id": f"R{i}", "reviewer_email": "reviewer@example.com",
+                 "subject": f"Review {i}", "body": "Please review."} for i in range(20)]
+        plan.insert(3, {"project_id": "PX", "review_id": "RX", "reason": "Missing reviewer or email"})
+
+        result = send_notifications(plan=plan, smtp_server="127.0.0.1", smtp_port=server.server_address[1],
+                                    use_tls=False, pool_size=3, messages_per_connection=4)
+
+        self.assertEqual((result["sent"], result["failed"]), (20, 1))
+        self.assertEqual([entry["review_id"] for entry in result["log"]], [spec["review_id"] for spec in plan])
+        self.assertEqual(server.messages, 20)
+        self.assertLessEqual(server.max_active, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
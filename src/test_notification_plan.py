@@ -0,0 +1,86 @@
+"""
+Test Case: Notification Plan
+Verify the notification plan loads each table once and joins reviews to projects and reviewers.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from scheduler import build_notification_plan, send_notifications
+
+
+class TestNotificationPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.projects = [
+            {"Project_ID": f"P{i:03}", "Project_Name": f"Project {i}",
+             "Status": "Overdue" if i % 2 else "Due Soon"} for i in range(1, 51)
+        ]
+        self.reviews = [
+            {"Review_ID": f"R{i:03}", "Project_ID": f"P{i:03}", "Reviewer_ID": f"U{i % 3}",
+             "Scheduled_Date": "2025-06-01", "Status": "Scheduled"} for i in range(1, 51)
+        ] + [
+            {"Review_ID": "R900", "Project_ID": "P001", "Reviewer_ID": "U1",
+             "Scheduled_Date": "2025-01-01", "Status": "Completed"},
+            {"Review_ID": "R901", "Project_ID": "P003", "Reviewer_ID": "U404",
+             "Scheduled_Date": "2025-06-01", "Status": "In Progress"},
+        ]
+        self.users = [
+            {"User_ID": "U0", "Name": "Alice", "Email": "alice@example.com"},
+            {"User_ID": "U1", "Name": "Bob", "Email": "bob@example.com"},
+            {"User_ID": "U2", "Name": "Carol", "Email": ""},
+        ]
+
+    @patch("scheduler.read_csv")
+    def test_plan_joins_tables_once(self, mock_read_csv):
+        mock_read_csv.side_effect = [self.projects, self.reviews, self.users]
+
+        plan = build_notification_plan(status_filter="Overdue")
+
+        self.assertEqual(mock_read_csv.call_count, 3)
+        self.assertEqual(len(plan), 26)  # 25 overdue projects plus the second review of P003
+        self.assertEqual([s["review_id"] for s in plan[:3]], ["R001", "R003", "R901"])
+        self.assertEqual(plan[0]["reviewer_email"], "bob@example.com")
+        self.assertTrue(plan[0]["subject"].startswith("[URGENT]"))
+        self.assertEqual(plan[2]["reason"], "Missing reviewer or email")
+
+    @patch("scheduler.read_csv")
+    def test_due_soon_plan_in_date_order(self, mock_read_csv):
+        def day(offset):
+            return (datetime.now() + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+        projects = [
+            {"Project_ID": "P1", "Project_Name": "Later", "Status": "Due Soon", "Next_Review_Date": day(20)},
+            {"Project_ID": "P2", "Project_Name": "Far", "Status": "Up to Date", "Next_Review_Date": day(200)},
+            {"Project_ID": "P3", "Project_Name": "Sooner", "Status": "Due Soon", "Next_Review_Date": day(31)},
+            {"Project_ID": "P4", "Project_Name": "Stale", "Status": "Due Soon", "Next_Review_Date": day(-3)},
+            {"Project_ID": "P5", "Project_Name": "Undated", "Status": "Due Soon", "Next_Review_Date": ""},
+            {"Project_ID": "P6", "Project_Name": "Soonest", "Status": "Due Soon", "Next_Review_Date": day(1)},
+            {"Project_ID": "P7", "Project_Name": "Today", "Status": "Overdue", "Next_Review_Date": day(0)},
+            {"Project_ID": "P8", "Project_Name": "Far", "Status": "Due Soon", "Next_Review_Date": day(90)},
+        ]
+        reviews = [{"Review_ID": f"R{p['Project_ID']}", "Project_ID": p["Project_ID"], "Reviewer_ID": "U0",
+                    "Scheduled_Date": day(0), "Status": "Scheduled"} for p in projects]
+        mock_read_csv.side_effect = [projects, reviews, self.users]
+
+        plan = build_notification_plan(status_filter="Due Soon")
+
+        self.assertEqual(mock_read_csv.call_count, 3)
+        # The Due Soon rows of the next 31 days; stale and undated rows wait for a recalculation
+        self.assertEqual([s["project_id"] for s in plan], ["P6", "P1", "P3"])
+
+    def test_send_prebuilt_plan(self):
+        plan = [
+            {"project_id": "P001", "review_id": "R001", "reviewer_email": "bob@example.com",
+             "subject": "Project 1 - Review Required", "body": "Please review."},
+            {"project_id": "P002", "review_id": "R002", "reason": "Missing reviewer or email"},
+        ]
+        result = send_notifications(plan=plan)
+
+        self.assertEqual((result["sent"], result["failed"]), (1, 1))
+        self.assertEqual(result["log"][0]["reviewer_email"], "bob@example.com")
+
+
+if __name__ == '__main__':
+    unittest.main()
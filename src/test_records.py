@@ -0,0 +1,89 @@
+"""
+Test Case: Typed Records
+Verify Project, User and Review records parse their values once, round-trip to
+the same CSV rows, share interned strings and can be read like dictionaries.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+
+import scheduler
+from records import Project, Review, User, row_date, to_records
+
+
+class TestRecords(unittest.TestCase):
+
+    def test_parsed_values_and_round_trip(self):
+        row = {"Project_ID": "P001", "Project_Name": "AI Audit", "Start_Date": "2020-01-15",
+               "Last_Review_Date": "2023-05-01", "Review_Frequency_Years": "1.5",
+               "Department": "IT", "Status": "Overdue", "Next_Review_Date": "", "Notes": "x"}
+        project = Project.from_row(row)
+
+        self.assertEqual(project.last_review_date, date(2023, 5, 1))
+        self.assertEqual(project.review_frequency_years, 1.5)
+        self.assertIsNone(project.next_review_date)
+        self.assertEqual(project.to_row(), row)
+        self.assertEqual(dict(project), row)
+
+        user = User.from_row({"User_ID": "U001", "Name": "Alice", "Email": "a@example.com",
+                              "Department": "HR", "Current_Load": "3"})
+        self.assertEqual(user.current_load, 3)
+        self.assertEqual(user["Current_Load"], "3")
+
+        # Numbers keep their text; columns the row lacks come back empty
+        project = Project.from_row({"Project_ID": "P002", "Review_Frequency_Years": "1.0"})
+        self.assertEqual(project.review_frequency_years, 1.0)
+        self.assertEqual(project["Review_Frequency_Years"], "1.0")
+        self.assertEqual(project.to_row()["Review_Frequency_Years"], "1.0")
+        self.assertEqual(project.to_row()["Start_Date"], "")
+        for text in ("0.50", "2", "1e1", "-0.0"):
+            self.assertEqual(Project.from_row({"Review_Frequency_Years": text})["Review_Frequency_Years"], text)
+        loaded = User.from_row({"User_ID": "U002", "Current_Load": "03"})
+        self.assertEqual((loaded.current_load, loaded["Current_Load"]), (3, "03"))
+
+        # Malformed values are kept as they are
+        odd = Review.from_row({"Review_ID": "R1", "Scheduled_Date": "05/10/2025"})
+        self.assertEqual(odd["Scheduled_Date"], "05/10/2025")
+        self.assertEqual(Review.from_row({"Scheduled_Date": "2025-W01-1"}).scheduled_date, "2025-W01-1")
+        self.assertEqual(odd.get("Completion_Date", "none"), "none")
+
+    def test_mapping_access_is_read_only(self):
+        review = Review.from_row({"Review_ID": "R1", "Project_ID": "P1", "Reviewer_ID": "U1",
+                                  "Scheduled_Date": "2025-05-10", "Status": "Scheduled",
+                                  "Completion_Date": ""})
+        self.assertEqual(review["Scheduled_Date"], "2025-05-10")
+        self.assertIn("Status", review)
+        with self.assertRaises(KeyError):
+            review["Missing"]
+        with self.assertRaises(TypeError):
+            review["Status"] = "Completed"
+        self.assertEqual(row_date(review, "Scheduled_Date"), datetime(2025, 5, 10))
+        self.assertEqual(row_date({"Scheduled_Date": "2025-05-10"}, "Scheduled_Date"), datetime(2025, 5, 10))
+
+    def test_repeated_strings_are_shared(self):
+        rows = [{"Review_ID": f"R{i}", "Project_ID": "P" + str(1), "Reviewer_ID": "".join(["U", "1"]),
+                 "Status": "".join(["Sched", "uled"])} for i in range(3)]
+        reviews = to_records("Reviews", rows)
+        self.assertIs(reviews[0].status, reviews[2].status)
+        self.assertIs(reviews[0].reviewer_id, reviews[1].reviewer_id)
+
+    def test_scheduler_uses_records(self):
+        project = Project.from_row({"Project_ID": "P001", "Last_Review_Date": "2024-01-01",
+                                    "Review_Frequency_Years": "1"})
+        result = scheduler.calculate_due_date(project, "2024-06-01")
+        self.assertEqual(result["Next_Review_Date"], "2025-01-01")
+        self.assertEqual(result["Status"], "Up to Date")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            users_file = os.path.join(tmpdir, "Users.csv")
+            with open(users_file, "w") as f:
+                f.write("User_ID,Name,Email,Department,Current_Load\nU001,Alice,a@example.com,HR,2\n")
+            users = scheduler.read_records(users_file)
+            scheduler.invalidate_csv_cache(users_file)
+        self.assertEqual(users[0].current_load, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Test Case: Shared Report Snapshot
+Verify all reports can run from one preloaded snapshot without reading the CSV files again.
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import scheduler
+from report_snapshot import ReportSnapshot
+
+
+class TestReportSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        this_month = datetime.now().strftime('%Y-%m')
+        self.snapshot = ReportSnapshot(
+            projects=[
+                {"Project_ID": "P001", "Project_Name": "AI Audit", "Department": "IT",
+                 "Status": "Overdue", "Next_Review_Date": "2025-01-01"},
+                {"Project_ID": "P002", "Project_Name": "Cloud Update", "Department": "HR",
+                 "Status": "Up to Date", "Next_Review_Date": "2030-01-01"},
+            ],
+            users=[
+                {"User_ID": "U001", "Name": "Alice", "Department": "HR"},
+                {"User_ID": "U002", "Name": "Bob", "Department": "IT"},
+            ],
+            reviews=[
+                {"Review_ID": "R001", "Project_ID": "P001", "Reviewer_ID": "U001",
+                 "Scheduled_Date": f"{this_month}-15", "Status": "Scheduled"},
+                {"Review_ID": "R002", "Project_ID": "P002", "Reviewer_ID": "U001",
+                 "Scheduled_Date": "2024-01-15", "Status": "Completed"},
+            ],
+        )
+
+    @patch("scheduler.plt")
+    @patch("scheduler.write_csv")
+    @patch("scheduler.read_csv")
+    def test_reports_share_one_snapshot(self, mock_read_csv, mock_write_csv, mock_plt):
+        result = scheduler.generate_all_reports(snapshot=self.snapshot)
+
+        mock_read_csv.assert_not_called()
+        self.assertEqual(result["monthly_schedule"]["review_count"], 1)
+        self.assertEqual(result["workload_report"]["total_reviews"], 1)
+        self.assertEqual(result["overdue_alerts"]["projects"], ["P001"])
+
+        overdue_rows = mock_write_csv.call_args_list[-1][0][1]
+        self.assertEqual(overdue_rows[0]["Reviewer_Name"], "Alice")
+
+    def test_snapshot_is_read_only(self):
+        with self.assertRaises(TypeError):
+            self.snapshot.projects[0]["Status"] = "Up to Date"
+        self.assertEqual([r["Review_ID"] for r in self.snapshot.reviews_for_reviewer("U001")], ["R001", "R002"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Test Case: Review Archive
+Verify the archive command moves old Completed and Missed reviews into the
+compressed archive, leaves active reviews in Reviews.csv, and that the history
+functions still return the archived reviews.
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import file_locks
+import scheduler
+from archive import archive_path_for, read_archive
+
+
+class TestReviewArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        scheduler.invalidate_csv_cache()
+        with open("Reviews.csv", "w") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\n")
+            f.write("R001,P001,U001,2025-01-10,Completed,2025-01-12\n")
+            f.write("R002,P002,U002,2025-02-01,Missed,\n")
+            f.write("R003,P001,U002,2025-01-05,Scheduled,\n")
+            f.write("R004,P003,U001,2025-05-20,Completed,2025-05-25\n")
+            f.write("R005,P003,U001,2025-06-02,In Progress,\n")
+        self.today = datetime(2025, 6, 10)
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        scheduler.configure_backups()
+        scheduler.configure_archiving(None)
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def test_archive_moves_old_finished_reviews(self):
+        archived = scheduler.archive_reviews("Reviews.csv", 90, current_date=self.today)
+
+        self.assertEqual(archived, 2)
+        self.assertEqual([r["Review_ID"] for r in scheduler.read_csv("Reviews.csv")], ["R003", "R004", "R005"])
+        header, rows = read_archive(archive_path_for("Reviews.csv"))
+        self.assertEqual(header[0], "Review_ID")
+        self.assertEqual([r["Review_ID"] for r in rows], ["R001", "R002"])
+
+        history = scheduler.get_all_reviews()
+        self.assertEqual([r["Review_ID"] for r in history], ["R001", "R002", "R003", "R004", "R005"])
+        self.assertEqual(len(scheduler.get_all_reviews(include_archived=False)), 3)
+        self.assertEqual([r["Review_ID"] for r in scheduler.get_reviews_between("2025-01-01", "2025-01-31")],
+                         ["R001", "R003"])
+        self.assertEqual(len(scheduler.load_report_snapshot().reviews), 5)
+
+    def test_later_runs_append_to_the_archive(self):
+        scheduler.archive_reviews("Reviews.csv", 90, current_date=self.today)
+        archived = scheduler.archive_reviews("Reviews.csv", 90, current_date=datetime(2025, 9, 1))
+
+        self.assertEqual(archived, 1)
+        with open(archive_path_for("Reviews.csv"), "rb") as f:
+            self.assertEqual(f.read().count(b"\x1f\x8b\x08"), 2)  # two gzip members
+        _, rows = read_archive(archive_path_for("Reviews.csv"))
+        self.assertEqual([r["Review_ID"] for r in rows], ["R001", "R002", "R004"])
+        with gzip.open(archive_path_for("Reviews.csv"), "rt") as f:
+            self.assertEqual(f.read().count("Review_ID"), 1)
+
+    def test_rows_left_in_both_files_are_not_duplicated(self):
+        reviews = scheduler.read_csv("Reviews.csv")
+        scheduler.archive_reviews("Reviews.csv", 90, current_date=self.today)
+        # As if the previous run failed after writing the archive
+        scheduler.write_csv("Reviews.csv", reviews)
+
+        self.assertEqual(len(scheduler.get_all_reviews()), 5)
+        scheduler.archive_reviews("Reviews.csv", 90, current_date=self.today)
+        _, rows = read_archive(archive_path_for("Reviews.csv"))
+        self.assertEqual(len(rows), 2)
+
+    def test_duplicate_review_ids_are_kept_apart(self):
+        # Older IDs were one timestamp per second, so two reviews can share one
+        with open("Reviews.csv", "w") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\n")
+            f.write("R1,P001,U001,2025-01-10,Completed,2025-01-12\n")
+            f.write("R1,P002,U002,2025-05-20,Completed,2025-05-25\n")
+        scheduler.invalidate_csv_cache()
+
+        self.assertEqual(scheduler.archive_reviews("Reviews.csv", 90, current_date=self.today), 1)
+        self.assertEqual([r["Project_ID"] for r in scheduler.get_all_reviews()], ["P001", "P002"])
+
+        self.assertEqual(scheduler.archive_reviews("Reviews.csv", 90, current_date=datetime(2025, 9, 1)), 1)
+        _, rows = read_archive(archive_path_for("Reviews.csv"))
+        self.assertEqual([r["Project_ID"] for r in rows], ["P001", "P002"])
+        self.assertEqual(scheduler.read_csv("Reviews.csv"), [])
+        self.assertEqual([r["Project_ID"] for r in scheduler.get_all_reviews()], ["P001", "P002"])
+
+    def test_cli_and_automatic_policy(self):
+        result = scheduler.execute_command(["archive", "--days", "100000"])
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"]["archived"], 0)
+        self.assertFalse(os.path.exists(archive_path_for("Reviews.csv")))
+
+        with open("Projects.csv", "w") as f:
+            f.write("Project_ID,Project_Name,Start_Date,Last_Review_Date,Review_Frequency_Years,"
+                    "Department,Status,Next_Review_Date\n")
+        with open("Users.csv", "w") as f:
+            f.write("User_ID,Name,Email,Department,Current_Load\n")
+        scheduler.configure_archiving(30)
+        scheduler.assign_all_reviewers()
+
+        statuses = {r["Status"] for r in scheduler.read_csv("Reviews.csv")}
+        self.assertEqual(statuses, {"Scheduled", "In Progress"})
+        self.assertEqual(len(scheduler.get_all_reviews()), 5)
+
+    def test_policy_runs_before_assignment_takes_its_locks(self):
+        # archive_reviews locks the archive before Reviews.csv; taking it while
+        # holding Reviews.csv would deadlock against a concurrent archive run
+        held = []
+        archive_reviews = scheduler.archive_reviews
+
+        def record_locks(*args, **kwargs):
+            held.append(dict(file_locks._held_locks()))
+            return archive_reviews(*args, **kwargs)
+
+        for name, header in (("Projects.csv", "Project_ID,Department,Status\n"),
+                             ("Users.csv", "User_ID,Department,Current_Load\n")):
+            with open(name, "w") as f:
+                f.write(header)
+        scheduler.configure_archiving(30)
+        with patch("scheduler.archive_reviews", side_effect=record_locks):
+            scheduler.assign_all_reviewers()
+        self.assertEqual(held, [{}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Test Case: Month-Partitioned Reviews
+Verify Reviews.csv can be moved into month partitions, reads and writes of
+Reviews.csv are routed to them, and the monthly report and date-range queries
+read only the partitions they need.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+
+
+class TestReviewPartitions(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        scheduler.invalidate_csv_cache()
+        with open("Reviews.csv", "w") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\n")
+            f.write("R001,P001,U001,2025-06-10,Scheduled,\n")
+            f.write("R002,P002,U002,2025-05-12,Completed,2025-05-12\n")
+            f.write("R003,P001,U002,2025-06-01,In Progress,\n")
+            f.write("R004,P003,U001,,Scheduled,\n")
+        result = scheduler.execute_command(["partition_reviews"])
+        self.assertTrue(result["success"])
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        scheduler.configure_backups()
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def test_partition_layout_and_reads(self):
+        self.assertFalse(os.path.exists("Reviews.csv"))
+        self.assertEqual(sorted(os.listdir("reviews")), [".partitioned", "2025-05.csv", "2025-06.csv", "undated.csv"])
+
+        reviews = scheduler.get_all_reviews()
+        self.assertEqual([r["Review_ID"] for r in reviews], ["R002", "R001", "R003", "R004"])
+        self.assertEqual([r["Review_ID"] for r in scheduler.get_reviews_by_project("P001")], ["R001", "R003"])
+        self.assertEqual([r["Review_ID"] for r in scheduler.iter_csv("Reviews.csv", where={"Reviewer_ID": "U001"})],
+                         ["R001", "R004"])
+        self.assertFalse(os.path.exists("Reviews.csv"))
+
+    def test_writes_touch_only_changed_months(self):
+        may_mtime = os.stat("reviews/2025-05.csv").st_mtime_ns
+
+        scheduler.add_review({"Review_ID": "R005", "Project_ID": "P004", "Reviewer_ID": "U002",
+                              "Scheduled_Date": "2025-07-03", "Status": "Scheduled", "Completion_Date": ""})
+        review = scheduler.get_review("R001")
+        review["Status"] = "Completed"
+        scheduler.update_review(review)
+
+        self.assertEqual(os.stat("reviews/2025-05.csv").st_mtime_ns, may_mtime)
+        self.assertEqual(scheduler.read_csv("reviews/2025-07.csv")[0]["Review_ID"], "R005")
+        self.assertEqual(scheduler.get_review("R001")["Status"], "Completed")
+        self.assertEqual(len(scheduler.get_all_reviews()), 5)
+        self.assertFalse(os.path.exists("Reviews.csv"))
+
+    def test_partitions_take_priority_over_a_recreated_file(self):
+        self.assertTrue(scheduler.validate_csv_data("Reviews.csv")["valid"])
+        self.assertFalse(os.path.exists("Reviews.csv"))
+
+        # A header-only Reviews.csv written by another tool does not hide the partitions
+        with open("Reviews.csv", "w") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\n")
+        scheduler.invalidate_csv_cache()
+        self.assertEqual(len(scheduler.get_all_reviews()), 4)
+        self.assertEqual([r["Review_ID"] for r in scheduler.get_reviews_by_project("P001")], ["R001", "R003"])
+        self.assertEqual(len(list(scheduler.iter_csv("Reviews.csv"))), 4)
+
+        # Reviews in both places are refused rather than silently merged or hidden
+        with open("Reviews.csv", "a") as f:
+            f.write("R009,P009,U001,2025-06-20,Scheduled,\n")
+        with self.assertRaises(ValueError):
+            scheduler.get_all_reviews()
+
+    def test_queries_read_only_needed_partitions(self):
+        with patch("scheduler.iter_csv", wraps=scheduler.iter_csv) as spy:
+            reviews = scheduler.get_reviews_between("2025-06-01", "2025-06-05")
+        self.assertEqual([r["Review_ID"] for r in reviews], ["R003"])
+        self.assertEqual([c.args[0] for c in spy.call_args_list],
+                         [os.path.join(self.tmpdir.name, "reviews", "2025-06.csv")])
+
+        with patch("scheduler.get_all_reviews", side_effect=AssertionError("read all reviews")), \
+                patch("scheduler.write_csv") as mock_write_csv:
+            result = scheduler.generate_monthly_schedule("06", "2025")
+        self.assertEqual(result["review_count"], 2)
+        self.assertEqual([r["Review_ID"] for r in mock_write_csv.call_args[0][1]], ["R003", "R001"])
+
+
+if __name__ == '__main__':
+    unittest.main()
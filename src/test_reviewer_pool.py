@@ -0,0 +1,60 @@
+"""
+Test Case: Reviewer Pool
+Verify heap-based reviewer selection picks the same reviewers as sorting the full
+reviewer list for every project, and that a large batch runs quickly.
+"""
+
+import random
+import time
+import unittest
+
+from reviewer_pool import ReviewerPool
+
+DEPARTMENTS = ["Engineering", "QA", "HR", "Finance", "IT"]
+
+
+def sorted_pick(reviewers, department):
+    reviewers_sorted = sorted(reviewers, key=lambda r: r['Current_Load'])
+    other = [r for r in reviewers_sorted if r.get('Department') != department]
+    return other[0] if other else reviewers_sorted[0]
+
+
+class TestReviewerPool(unittest.TestCase):
+
+    @staticmethod
+    def _reviewers(count, rng, departments=DEPARTMENTS):
+        return [{"User_ID": f"U{i:05}", "Department": rng.choice(departments),
+                 "Current_Load": str(rng.randint(0, 5))} for i in range(count)]
+
+    def test_matches_sorted_selection(self):
+        rng = random.Random(7)
+        for departments in (DEPARTMENTS, ["IT"]):
+            reviewers = self._reviewers(40, rng, departments)
+            expected_reviewers = [dict(r, Current_Load=int(r["Current_Load"])) for r in reviewers]
+            pool = ReviewerPool(reviewers)
+
+            for _ in range(300):
+                department = rng.choice(DEPARTMENTS)
+                expected = sorted_pick(expected_reviewers, department)
+                expected["Current_Load"] += 1
+                picked = pool.pick(department)
+                pool.increment(picked)
+                self.assertEqual(picked["User_ID"], expected["User_ID"])
+
+            self.assertEqual([r["Current_Load"] for r in reviewers],
+                             [r["Current_Load"] for r in expected_reviewers])
+
+    def test_empty_pool(self):
+        self.assertIsNone(ReviewerPool([]).pick("IT"))
+
+    def test_large_batch(self):
+        rng = random.Random(1)
+        pool = ReviewerPool(self._reviewers(10000, rng))
+        start = time.perf_counter()
+        for _ in range(100000):
+            pool.increment(pool.pick(rng.choice(DEPARTMENTS)))
+        self.assertLess(time.perf_counter() - start, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Test Case: Row Offset Index
+Verify single reviews are read with one seek through a saved byte-offset index,
+same-length updates are written in place and journaled instead of backed up,
+and other updates rewrite the file.
+"""
+
+import json
+import os
+import pickle
+import struct
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import row_offsets
+import scheduler
+from row_offsets import RowOffsetIndex, offsets_path_for
+
+
+class TestRowOffsets(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        scheduler.invalidate_csv_cache()
+        self.reviews_file = os.path.join(self.tmpdir.name, "Reviews.csv")
+        with open(self.reviews_file, "w", newline="") as f:
+            f.write("Review_ID,Project_ID,Reviewer_ID,Scheduled_Date,Status,Completion_Date\r\n")
+            f.write("R001,P001,U001,2025-05-10,Scheduled,\r\n")
+            f.write('R002,P002,U002,2025-05-12,"Note, with\nline break",\r\n')
+            f.write("R003,P001,U002,2025-06-01,Scheduled,\r\n")
+        self.threshold = patch("scheduler.STREAM_THRESHOLD_BYTES", 0)
+        self.threshold.start()
+
+    def tearDown(self):
+        self.threshold.stop()
+        scheduler._offset_indexes.clear()
+        scheduler.invalidate_csv_cache()
+        scheduler.configure_backups()
+        self.tmpdir.cleanup()
+
+    def test_point_reads_use_saved_index(self):
+        review = scheduler.get_review("R003", self.reviews_file)
+        self.assertEqual(review["Project_ID"], "P001")
+        self.assertEqual(scheduler.get_review("R002", self.reviews_file)["Status"], "Note, with\nline break")
+        self.assertIsNone(scheduler.get_review("R999", self.reviews_file))
+        self.assertTrue(os.path.exists(offsets_path_for(self.reviews_file)))
+
+        # A new process loads the saved index instead of scanning the file
+        with patch("row_offsets._scan") as mock_scan:
+            index = RowOffsetIndex(self.reviews_file).load()
+        mock_scan.assert_not_called()
+        self.assertEqual(index.get("R001")["Status"], "Scheduled")
+
+    def test_saved_index_is_never_unpickled(self):
+        path = offsets_path_for(self.reviews_file)
+        RowOffsetIndex(self.reviews_file).load()
+        with open(path, "rb") as f:
+            header = f.read(16)
+            self.assertEqual(json.loads(f.read())["key_column"], "Review_ID")
+
+        self.assertEqual(struct.unpack("<qq", header)[1], os.path.getsize(self.reviews_file))
+
+        # A pickle written into the shared directory, even with a valid header, is rebuilt over
+        with open(path, "wb") as f:
+            f.write(header + pickle.dumps({"key_column": "Review_ID", "header": [], "offsets": {}}))
+        with patch("row_offsets._scan", wraps=row_offsets._scan) as mock_scan:
+            index = RowOffsetIndex(self.reviews_file).load()
+        mock_scan.assert_called_once()
+        self.assertEqual(index.get("R003")["Project_ID"], "P001")
+
+    def test_same_length_update_is_written_in_place(self):
+        review = scheduler.get_review("R001", self.reviews_file)
+        review["Status"] = "Completed"
+        with patch("scheduler.write_csv") as mock_write_csv:
+            scheduler.update_review(review, self.reviews_file)
+        mock_write_csv.assert_not_called()
+
+        with open(self.reviews_file, newline="") as f:
+            self.assertIn("R001,P001,U001,2025-05-10,Completed,\r\n", f.read())
+        with patch("row_offsets._scan") as mock_scan:
+            self.assertEqual(RowOffsetIndex(self.reviews_file).load().get("R001")["Status"], "Completed")
+        mock_scan.assert_not_called()
+
+    def test_in_place_update_is_journaled_not_backed_up(self):
+        review = scheduler.get_review("R003", self.reviews_file)
+        review["Status"] = "Completed"
+        scheduler.update_review(review, self.reviews_file)
+
+        manager = scheduler._backup_manager
+        self.assertEqual(manager.list_backups(self.reviews_file), [])
+        with open(manager.row_edits_path(self.reviews_file), newline="") as f:
+            self.assertIn("R003,P001,U002,2025-06-01,Scheduled,", f.read())
+
+        result = scheduler.restore_backups([self.reviews_file], as_of=datetime(2025, 1, 1))
+        self.assertEqual(result[self.reviews_file], manager.row_edits_path(self.reviews_file))
+        self.assertEqual(scheduler.get_review("R003", self.reviews_file)["Status"], "Scheduled")
+        self.assertEqual(manager.undo_row_edits(self.reviews_file), 0)
+
+    def test_other_updates_rewrite_the_file(self):
+        review = scheduler.get_review("R003", self.reviews_file)
+        review["Status"] = "In Progress"
+        review["Completion_Date"] = ""
+        scheduler.update_review(review, self.reviews_file)
+
+        self.assertEqual(scheduler.get_review("R003", self.reviews_file)["Status"], "In Progress")
+        self.assertEqual(scheduler.get_review("R001", self.reviews_file)["Status"], "Scheduled")
+        self.assertEqual(len(scheduler._offset_indexes), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Test Case: SQLite Storage Backend
+Verify the data access functions keep their behaviour when routed through the SQLite backend.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+from storage import SQLiteBackend, StorageBackend
+
+
+class TestSQLiteStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.backend = SQLiteBackend(os.path.join(self.tmpdir.name, "scheduler.db"))
+        self.backend.import_csv("Projects", [
+            {"Project_ID": "P001", "Project_Name": "AI Audit", "Start_Date": "2024-01-01",
+             "Last_Review_Date": "2024-01-01", "Review_Frequency_Years": "1",
+             "Department": "IT", "Status": "Overdue", "Next_Review_Date": "2025-01-01"},
+        ])
+        self.backend.import_csv("Users", [
+            {"User_ID": "U001", "Name": "Alice", "Email": "a@example.com", "Department": "IT", "Current_Load": "0"},
+            {"User_ID": "U002", "Name": "Bob", "Email": "b@example.com", "Department": "HR", "Current_Load": "1"},
+        ])
+        self.previous = scheduler.set_storage_backend(self.backend)
+
+    def tearDown(self):
+        scheduler.set_storage_backend(self.previous)
+        self.backend.close()
+        self.tmpdir.cleanup()
+
+    def test_row_level_updates(self):
+        user = scheduler.get_reviewer("U002")
+        user["Current_Load"] = 5
+        scheduler.update_user(user)
+
+        self.assertEqual(scheduler.get_reviewer("U002")["Current_Load"], "5")
+        self.assertEqual([u["User_ID"] for u in scheduler.get_all_users()], ["U001", "U002"])
+        self.assertIsNone(scheduler.get_reviewer("U999"))
+
+    def test_assign_all_reviewers_uses_backend(self):
+        result = scheduler.assign_all_reviewers()
+
+        self.assertEqual(result["total_assigned"], 1)
+        reviews = scheduler.get_reviews_by_project("P001")
+        self.assertEqual(len(reviews), 1)
+        self.assertEqual(reviews[0]["Reviewer_ID"], "U002")  # other department
+        self.assertEqual(scheduler.get_reviewer("U002")["Current_Load"], "2")
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, "Reviews.csv")))
+
+    def test_duplicate_review_ids(self):
+        # Older Review_IDs were one timestamp per second, so they repeat
+        reviews = [{"Review_ID": "R1", "Project_ID": "P001", "Reviewer_ID": "U001", "Scheduled_Date": "2025-05-15",
+                    "Status": "Completed", "Completion_Date": "2025-05-16"},
+                   {"Review_ID": "R1", "Project_ID": "P002", "Reviewer_ID": "U002", "Scheduled_Date": "2025-05-15",
+                    "Status": "Scheduled", "Completion_Date": ""}]
+        self.assertEqual(self.backend.import_csv("Reviews", reviews), 2)
+        scheduler.add_review(dict(reviews[1], Project_ID="P003"))
+
+        review = scheduler.get_review("R1")
+        self.assertEqual(review["Project_ID"], "P001")
+        review["Status"] = "Missed"
+        scheduler.update_review(review)
+        self.assertEqual([(r["Project_ID"], r["Status"]) for r in scheduler.get_all_reviews()],
+                         [("P001", "Missed"), ("P002", "Scheduled"), ("P003", "Scheduled")])
+
+    def test_reviews_table_with_unique_key_is_rebuilt(self):
+        path = os.path.join(self.tmpdir.name, "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE "Reviews" ("Review_ID" TEXT PRIMARY KEY, "Project_ID" TEXT, "Reviewer_ID" TEXT, '
+                     '"Scheduled_Date" TEXT, "Status" TEXT, "Completion_Date" TEXT)')
+        conn.execute('INSERT INTO "Reviews" VALUES (\'R2\', \'P002\', \'U001\', \'\', \'Scheduled\', \'\')')
+        conn.execute('INSERT INTO "Reviews" VALUES (\'R1\', \'P001\', \'U001\', \'\', \'Scheduled\', \'\')')
+        conn.commit()
+        conn.close()
+
+        backend = SQLiteBackend(path)
+        try:
+            backend.insert("Reviews", {"Review_ID": "R1", "Project_ID": "P003"})
+            self.assertEqual([r["Project_ID"] for r in backend.read_all("Reviews")], ["P002", "P001", "P003"])
+        finally:
+            backend.close()
+
+    def test_db_option_only_applies_to_its_command(self):
+        opened = []
+
+        def open_backend(path):
+            opened.append(SQLiteBackend(path))
+            return opened[-1]
+
+        cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        try:
+            with patch("scheduler.SQLiteBackend", side_effect=open_backend):
+                result = scheduler.execute_command(["calculate_reviews", "--db", "scheduler.db"])
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual(result["result"]["total_projects"], 1)
+        self.assertIs(scheduler._storage_backend, self.backend)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            opened[0].conn.execute("SELECT 1")
+
+    def test_backend_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            StorageBackend()
+
+
+if __name__ == '__main__':
+    unittest.main()
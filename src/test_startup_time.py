@@ -0,0 +1,56 @@
+"""
+Test Case: CLI Startup Time
+Verify the scheduler starts without importing heavy dependencies and that the
+help and calculate_reviews commands stay within their cold-start time budgets.
+"""
+
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+SCHEDULER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scheduler.py")
+
+# Generous budgets in seconds; importing pandas and matplotlib alone took longer than this
+HELP_BUDGET = 1.0
+CALCULATE_BUDGET = 2.0
+
+
+class TestStartupTime(unittest.TestCase):
+
+    def run_scheduler(self, *args, cwd=None):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, SCHEDULER, *args], cwd=cwd,
+                                   capture_output=True, text=True, timeout=60)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        return elapsed
+
+    def test_heavy_modules_not_imported(self):
+        code = ("import sys; sys.path.insert(0, %r); import scheduler; "
+                "print(','.join(m for m in ('pandas', 'matplotlib', 'faker', 'numpy') if m in sys.modules))"
+                % os.path.dirname(SCHEDULER))
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+        self.assertEqual(output.stdout.strip(), "")
+
+    def test_help_budget(self):
+        self.run_scheduler("help")  # warm the bytecode cache
+        self.assertLess(self.run_scheduler("help"), HELP_BUDGET)
+
+    def test_calculate_reviews_budget(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "Projects.csv"), "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["Project_ID", "Project_Name", "Start_Date", "Last_Review_Date",
+                                 "Review_Frequency_Years", "Department", "Status", "Next_Review_Date"])
+                for i in range(1000):
+                    writer.writerow([f"P{i:04}", f"Project {i}", "2023-01-01", "2024-03-15",
+                                     "1", "IT", "", ""])
+            self.assertLess(self.run_scheduler("calculate_reviews", cwd=tmpdir), CALCULATE_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Test Case: Status Matrix
+Verify the per-date and per-department status counts match running
+calculate_due_date for every project on every date.
+"""
+
+import csv
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+import scheduler
+
+
+class TestStatusMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        scheduler.invalidate_csv_cache()
+
+        rng = random.Random(3)
+        self.projects = []
+        for i in range(500):
+            last_review = date(2023, 1, 1) + timedelta(days=rng.randint(0, 900))
+            self.projects.append({
+                "Project_ID": f"P{i:04d}", "Project_Name": "x", "Start_Date": "2020-01-01",
+                "Last_Review_Date": last_review.strftime("%Y-%m-%d"),
+                "Review_Frequency_Years": rng.choice(["1", "2", "0.5", "0.0834"]),
+                "Department": rng.choice(["IT", "HR", "Finance", ""]),
+                "Status": "", "Next_Review_Date": "",
+            })
+        self.projects.append(dict(self.projects[0], Project_ID="BAD", Last_Review_Date="unknown"))
+        scheduler.write_csv("Projects.csv", self.projects)
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        scheduler.configure_backups()
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def test_matches_scalar_calculation(self):
+        result = scheduler.status_matrix("2025-01-01", "2025-12-31", 14)
+
+        self.assertEqual(result["dates"][:2], ["2025-01-01", "2025-01-15"])
+        self.assertEqual(len(result["dates"]), 27)
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(sorted(result["departments"]), ["Finance", "HR", "IT", "Unknown"])
+
+        valid = [p for p in self.projects if p["Project_ID"] != "BAD"]
+        for i, day in enumerate(result["dates"]):
+            current_date = datetime.strptime(day, "%Y-%m-%d")
+            expected = {}
+            for project in valid:
+                status = scheduler.calculate_due_date(project, current_date)["Status"]
+                department = project["Department"] or "Unknown"
+                expected[(department, status)] = expected.get((department, status), 0) + 1
+            for department, counts in result["departments"].items():
+                for status, values in counts.items():
+                    self.assertEqual(values[i], expected.get((department, status), 0), (day, department, status))
+            self.assertEqual(sum(result["totals"][s][i] for s in result["totals"]), len(valid))
+
+    def test_cli_writes_department_rows(self):
+        result = scheduler.execute_command(["status_matrix", "--from", "2025-03-01", "--to", "2025-03-31",
+                                            "--step", "30", "--output", "matrix.csv"])
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"]["dates"], ["2025-03-01", "2025-03-31"])
+        with open("matrix.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 2 * 4)
+        self.assertEqual(list(rows[0]), ["Date", "Department", "Overdue", "Due Soon", "Up to Date"])
+
+        self.assertFalse(scheduler.execute_command(["status_matrix", "--from", "2025-03-01"])["success"])
+        self.assertFalse(scheduler.execute_command(["status_matrix", "--from", "2025-03-01", "--to", "2025-02-01"])
+                         ["success"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Test Case: Table Indexes
+Verify key and multi-value indexes answer lookups and stay current after inserts and updates.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import scheduler
+from indexes import build_index
+
+
+class TestTableIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reviews_file = os.path.join(self.tmpdir.name, "Reviews.csv")
+        scheduler.write_csv(self.reviews_file, [
+            {"Review_ID": "R001", "Project_ID": "P001", "Reviewer_ID": "U001",
+             "Scheduled_Date": "2025-05-01", "Status": "Scheduled", "Completion_Date": ""},
+            {"Review_ID": "R002", "Project_ID": "P002", "Reviewer_ID": "U001",
+             "Scheduled_Date": "2025-05-02", "Status": "Completed", "Completion_Date": "2025-05-03"},
+        ])
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        self.tmpdir.cleanup()
+
+    def test_index_lookups(self):
+        index = build_index("Reviews", scheduler.read_csv(self.reviews_file))
+        self.assertEqual(index.get("R002")["Project_ID"], "P002")
+        self.assertEqual([r["Review_ID"] for r in index.find("Reviewer_ID", "U001")], ["R001", "R002"])
+        self.assertEqual(index.find("Status", "Missed"), [])
+
+        index.replace("R001", dict(index.get("R001"), Status="Completed"))
+        self.assertEqual([r["Review_ID"] for r in index.find("Status", "Completed")], ["R001", "R002"])
+        self.assertEqual(index.find("Status", "Scheduled"), [])
+
+    def test_index_maintained_without_reparse(self):
+        scheduler.get_reviews_by_project("P001", self.reviews_file)  # build the index
+
+        with patch("scheduler.csv.DictReader") as mock_reader:
+            scheduler.add_review({"Review_ID": "R003", "Project_ID": "P001", "Reviewer_ID": "U002",
+                                  "Scheduled_Date": "2025-05-04", "Status": "Scheduled",
+                                  "Completion_Date": ""}, self.reviews_file)
+            review = scheduler.get_reviews_by_project("P002", self.reviews_file)[0]
+            review["Status"] = "Missed"
+            scheduler.update_review(review, self.reviews_file)
+
+            by_project = scheduler.get_reviews_by_project("P001", self.reviews_file)
+            by_reviewer = scheduler.get_reviews_by_reviewer("U001", self.reviews_file)
+
+        self.assertEqual([r["Review_ID"] for r in by_project], ["R001", "R003"])
+        self.assertEqual([r["Status"] for r in by_reviewer], ["Scheduled", "Missed"])
+        mock_reader.assert_not_called()
+
+        scheduler.invalidate_csv_cache()
+        self.assertEqual(len(scheduler.get_reviews_by_project("P001", self.reviews_file)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Test Case: Status Transition Index
+Verify advance updates exactly the projects whose status changes by the given
+date, gives the same statuses as calculate_due_date, and rebuilds its saved
+index when the Projects file was changed elsewhere.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import scheduler
+from transitions import transitions_path_for
+
+
+class TestTransitionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        scheduler.configure_backups(backup_dir=os.path.join(self.tmpdir.name, "backups"))
+        scheduler.invalidate_csv_cache()
+        scheduler._transition_indexes.clear()
+        with open("Projects.csv", "w") as f:
+            f.write("Project_ID,Project_Name,Start_Date,Last_Review_Date,Review_Frequency_Years,"
+                    "Department,Status,Next_Review_Date\n")
+            f.write("P001,Alpha,2020-01-01,2024-07-05,1,IT,Up to Date,2025-07-05\n")
+            f.write("P002,Beta,2020-01-01,2024-06-05,1,HR,Due Soon,2025-06-05\n")
+            f.write("P003,Gamma,2020-01-01,2023-01-01,1,IT,Overdue,2024-01-01\n")
+            f.write("P004,Delta,2020-01-01,2024-12-01,2,IT,Up to Date,2026-12-01\n")
+            f.write("P005,Epsilon,2020-01-01,2024-06-20,1,HR,,\n")
+
+    def tearDown(self):
+        scheduler.invalidate_csv_cache()
+        scheduler.configure_backups()
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def statuses(self):
+        return {p["Project_ID"]: p["Status"] for p in scheduler.read_csv("Projects.csv")}
+
+    def test_advance_changes_only_crossing_projects(self):
+        result = scheduler.advance_statuses("2025-06-10")
+
+        self.assertEqual(result["statuses"], {"P001": "Due Soon", "P002": "Overdue", "P005": "Due Soon"})
+        self.assertEqual(result["checked"], 3)
+        self.assertEqual(self.statuses()["P004"], "Up to Date")
+        self.assertEqual(scheduler.get_project("P005")["Next_Review_Date"], "2025-06-20")
+        self.assertEqual(result["next_change"], "2025-06-21")
+        self.assertTrue(os.path.exists(transitions_path_for("Projects.csv")))
+
+        mtime = os.stat("Projects.csv").st_mtime_ns
+        scheduler._transition_indexes.clear()  # load the saved index
+        again = scheduler.execute_command(["advance", "--to", "2025-06-15"])
+        self.assertEqual(again["result"]["checked"], 0)
+        self.assertEqual(os.stat("Projects.csv").st_mtime_ns, mtime)
+
+    def test_external_change_rebuilds_index(self):
+        scheduler.advance_statuses("2025-06-10")
+        project = scheduler.get_project("P004")
+        project["Next_Review_Date"] = "2025-06-30"
+        scheduler.update_project(project)
+
+        result = scheduler.advance_statuses("2025-06-11")
+        self.assertEqual(result["statuses"], {"P004": "Due Soon"})
+
+    def test_statuses_behind_a_moved_date_are_corrected(self):
+        with open("Projects.csv", "w") as f:
+            f.write("Project_ID,Project_Name,Start_Date,Last_Review_Date,Review_Frequency_Years,"
+                    "Department,Status,Next_Review_Date\n")
+            f.write("P1,Alpha,2020-01-01,2025-12-01,1,IT,Overdue,2026-12-01\n")
+            f.write("P2,Beta,2020-01-01,2025-12-01,1,HR,Due Soon,2026-12-01\n")
+            f.write("P3,Gamma,2020-01-01,2025-12-01,1,IT,Up to Date,2026-12-01\n")
+
+        result = scheduler.advance_statuses("2026-02-01")
+
+        self.assertEqual(result["statuses"], {"P1": "Up to Date", "P2": "Up to Date"})
+        self.assertEqual(set(self.statuses().values()), {"Up to Date"})
+        self.assertEqual(result["next_change"], "2026-11-01")
+
+    def test_matches_full_recalculation(self):
+        rng = random.Random(7)
+        rows = []
+        start = datetime(2025, 1, 1)
+        for i in range(300):
+            last = start - timedelta(days=rng.randint(0, 900))
+            project = {"Project_ID": f"P{i:04d}", "Project_Name": "x", "Start_Date": "2020-01-01",
+                       "Last_Review_Date": last.strftime("%Y-%m-%d"),
+                       "Review_Frequency_Years": rng.choice(["1", "2", "0.5"]),
+                       "Department": "IT", "Status": "", "Next_Review_Date": ""}
+            rows.append(scheduler.calculate_due_date(project, start))
+        scheduler.write_csv("Projects.csv", rows)
+
+        day = start
+        for step in (1, 3, 10, 30, 45, 90):
+            day += timedelta(days=step)
+            scheduler.advance_statuses(day)
+            expected = {p["Project_ID"]: scheduler.calculate_due_date(p, day)["Status"] for p in rows}
+            self.assertEqual(self.statuses(), expected, day)
+
+    def test_backend_is_rejected(self):
+        previous = scheduler.set_storage_backend(scheduler.SQLiteBackend(":memory:"))
+        try:
+            with self.assertRaises(ValueError):
+                scheduler.advance_statuses("2025-06-10")
+        finally:
+            scheduler.set_storage_backend(previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
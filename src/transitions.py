@@ -0,0 +1,178 @@
+"""
+Project Review Scheduler - Status Transition Index
+
+A project's Status only depends on how far away its Next_Review_Date is, so
+it changes on known days: 'Up to Date' becomes 'Due Soon' 30 days before the
+date and 'Due Soon' becomes 'Overdue' the day after it. The transition index
+is a heap of (day of the next change, Project_ID). Advancing to a day pops the
+projects whose change day has come and leaves the rest alone, instead of
+recalculating every project.
+
+The heap is saved in a sidecar file next to the Projects file
+(.Projects.csv.transitions, see sidecars.py), and rebuilt from the
+Next_Review_Date and Status columns when the file was changed by anything else.
+"""
+
+import heapq
+import os
+
+from sidecars import load_sidecar, save_sidecar, sidecar_path_for, version_of
+from utils import parse_date
+
+DUE_SOON_DAYS = 30
+
+
+def transitions_path_for(file_path):
+    return sidecar_path_for(file_path, 'transitions')
+
+
+def status_on(next_review, day):
+    """
+    Status of a project with its next review on next_review, as seen on day.
+
+    Same rule as calculate_due_date for a date without a time.
+
+    Args:
+        next_review (int): Next_Review_Date as a proleptic Gregorian ordinal
+        day (int): Day to evaluate, as an ordinal
+    """
+    days_until_review = next_review - day
+    if days_until_review < 0:
+        return 'Overdue'
+    if days_until_review <= DUE_SOON_DAYS:
+        return 'Due Soon'
+    return 'Up to Date'
+
+
+def next_change(next_review, status):
+    """
+    Day (ordinal) on which a project's status next changes, or None if it never does.
+
+    Assumes the status fits the date; one that is not one of the three
+    statuses changes right away, which the earliest possible day expresses.
+    """
+    if status == 'Up to Date':
+        return next_review - DUE_SOON_DAYS
+    if status == 'Due Soon':
+        return next_review + 1
+    if status == 'Overdue':
+        return None
+    return 1
+
+
+def parse_day(value):
+    """Return a YYYY-MM-DD value as an ordinal, or None if it is not such a date."""
+    try:
+        return parse_date((value or '')[:10]).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+class TransitionIndex:
+    """
+    Pending status changes of the projects in one Projects file.
+
+    Args:
+        file_path (str): Projects CSV file
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.heap = []
+        # Project_ID -> change day of its live heap entry; older entries are skipped
+        self.scheduled = {}
+        self.mtime_ns = None
+        self.size = None
+
+    def __len__(self):
+        return len(self.scheduled)
+
+    def is_current(self, stat):
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def load(self, read_rows, today):
+        """
+        Use the saved index if it matches the file, otherwise rebuild it.
+
+        Args:
+            read_rows (callable): Returns the rows of the file; only called for a rebuild
+            today (int): Day (ordinal) statuses are being advanced to
+        """
+        stat = os.stat(self.file_path)
+        if self.is_current(stat):
+            return self
+        saved = load_sidecar(transitions_path_for(self.file_path), version_of(stat))
+        try:
+            heap = [(day, project_id) for day, project_id in saved['heap']]
+            scheduled = dict(saved['scheduled'])
+        except (TypeError, KeyError, ValueError):
+            return self.rebuild(read_rows(), stat, today)
+        self.heap, self.scheduled = heap, scheduled
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        return self
+
+    def rebuild(self, rows, stat, today):
+        """
+        Build the index from the Next_Review_Date and Status of each project.
+
+        A project whose Status does not fit its date on today, for example one
+        still marked Overdue after its Next_Review_Date was moved into the
+        future, is scheduled to change on today.
+        """
+        self.heap, self.scheduled = [], {}
+        for row in rows:
+            project_id = row.get('Project_ID')
+            if project_id in self.scheduled:
+                continue
+            next_review = parse_day(row.get('Next_Review_Date'))
+            status = row.get('Status')
+            # Projects without a next review date are recalculated on the next advance
+            if next_review is None:
+                day = 1
+            elif status != status_on(next_review, today):
+                day = today
+            else:
+                day = next_change(next_review, status)
+            if day is not None:
+                self.scheduled[project_id] = day
+                self.heap.append((day, project_id))
+        heapq.heapify(self.heap)
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        return self
+
+    def schedule(self, project_id, next_review, status):
+        """Record the next change of a project after its status was set."""
+        day = next_change(next_review, status) if next_review is not None else None
+        if day is None:
+            self.scheduled.pop(project_id, None)
+            return
+        self.scheduled[project_id] = day
+        heapq.heappush(self.heap, (day, project_id))
+
+    def pop_due(self, day):
+        """
+        Remove and return the projects whose status changes on or before day.
+
+        Returns:
+            list: Project IDs, earliest change first
+        """
+        due = []
+        while self.heap and self.heap[0][0] <= day:
+            change_day, project_id = heapq.heappop(self.heap)
+            if self.scheduled.get(project_id) == change_day:
+                del self.scheduled[project_id]
+                due.append(project_id)
+        return due
+
+    def next_change_day(self):
+        """Earliest pending change day (ordinal), or None if no status will change."""
+        while self.heap and self.scheduled.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        return self.heap[0][0] if self.heap else None
+
+    def save(self, stat):
+        """Save the index as belonging to the file version described by stat."""
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        # Pairs rather than a mapping: JSON object keys would turn IDs into strings
+        save_sidecar(transitions_path_for(self.file_path), version_of(stat),
+                     {'heap': self.heap, 'scheduled': list(self.scheduled.items())})
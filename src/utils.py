@@ -1,6 +1,37 @@
+from datetime import date, datetime
+from functools import lru_cache
 
-from datetime import datetime
+# Distinct date strings remembered by the parsers; a few decades of days
+DATE_CACHE_SIZE = 16384
 
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(date_str):
+    """
+    Parse a '%Y-%m-%d' date string, like datetime.strptime(date_str, '%Y-%m-%d').
+
+    Zero-padded ISO dates, the usual case, take the date.fromisoformat fast
+    path. Results are cached, since tables repeat the same few dates many times.
+
+    Args:
+        date_str (str): A date string in '%Y-%m-%d' format
+
+    Returns:
+        datetime: Parsed datetime object (midnight)
+
+    Raises:
+        ValueError: If the string is not a valid date in that format
+    """
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            parsed = date.fromisoformat(date_str)
+            return datetime(parsed.year, parsed.month, parsed.day)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def safe_parse_date(date_str):
     """
     Parse a date string that may or may not include a time portion.
@@ -11,7 +42,10 @@ def safe_parse_date(date_str):
     Returns:
         datetime: Parsed datetime object
     """
+    # A plain date can never match the format with a time
+    if len(date_str) == 10:
+        return parse_date(date_str)
     try:
         return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
     except ValueError:
-        return datetime.strptime(date_str, '%Y-%m-%d')
+        return parse_date(date_str)